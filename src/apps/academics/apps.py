@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class AcademicsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
-    name = "apps.academics"
\ No newline at end of file
+    name = "apps.academics"
+
+    def ready(self):
+        from apps.academics.instrumentation import install_query_recorder
+
+        connection_created.connect(install_query_recorder, dispatch_uid="academics_query_recorder")
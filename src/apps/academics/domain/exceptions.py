@@ -21,6 +21,22 @@ class DuplicateEnrollmentError(DomainError):
         )
 
 
+class UnknownStudentError(DomainError):
+    """
+    Raised when a student id does not name an existing student.
+    """
+    def __init__(self, student_id: UUID):
+        super().__init__(f"Unknown student {student_id}.")
+
+
+class UnknownCourseError(DomainError):
+    """
+    Raised when a course id does not name an existing course.
+    """
+    def __init__(self, course_id: UUID):
+        super().__init__(f"Unknown course {course_id}.")
+
+
 class StudentNotEnrolledError(DomainError):
     """
     Raised when attempting to perform an action that requires
@@ -71,3 +87,24 @@ class InvalidStudentNameError(DomainError):
 class InvalidCourseNameError(DomainError):
     def __init__(self, name: str):
         super().__init__(f"Invalid course name: {name!r}.")
+
+
+class InvalidCursorError(DomainError):
+    """
+    Raised when a pagination cursor is malformed or was not issued by the services.
+    """
+    def __init__(self, cursor: str):
+        super().__init__(f"Invalid pagination cursor: {cursor!r}.")
+
+
+class InvalidPageSizeError(DomainError):
+    def __init__(self, page_size: object):
+        super().__init__(f"Invalid page size: {page_size!r}.")
+
+
+class UnknownJobError(DomainError):
+    """
+    Raised when enqueuing a job name that has no registered handler.
+    """
+    def __init__(self, name: str):
+        super().__init__(f"Unknown job: {name!r}.")
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
+from functools import cached_property
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
 
 @dataclass(frozen=True)
@@ -29,6 +33,92 @@ GRADE_SCALE: tuple[LetterRange, ...] = (
 )
 
 
+@dataclass(frozen=True)
+class CompiledGradeScale:
+    """
+    A grade scale compiled into direct lookup tables.
+
+    letters_by_value[v] is the letter for numeric grade v (0..100),
+    max_by_letter[letter] is the numeric MAX of the letter interval.
+    """
+    ranges: tuple[LetterRange, ...]
+    letters_by_value: tuple[str, ...]
+    max_by_letter: Mapping[str, int]
+
+    @cached_property
+    def letters_array(self):
+        """
+        letters_by_value as a NumPy array, built on first vectorized use.
+        """
+        import numpy as np
+
+        return np.array(self.letters_by_value)
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        Stable digest of the value-to-letter mapping, for cache keys of letter-bearing results.
+        """
+        return hashlib.blake2b("|".join(self.letters_by_value).encode(), digest_size=8).hexdigest()
+
+
+def compile_grade_scale(ranges: Iterable[LetterRange]) -> CompiledGradeScale:
+    """
+    Compile a scale into lookup tables.
+
+    Rules:
+    - Every value in 0..100 must belong to exactly one range.
+    - Letters must be unique.
+    """
+    ranges = tuple(ranges)
+    letters_by_value: list[str | None] = [None] * 101
+    max_by_letter: dict[str, int] = {}
+
+    for r in ranges:
+        letter = r.letter.strip().upper()
+        if letter in max_by_letter:
+            raise ValueError(f"Duplicate letter grade in scale: {r.letter!r}")
+        if not 0 <= r.min_value <= r.max_value <= 100:
+            raise ValueError(f"Invalid range for letter grade {r.letter!r}.")
+        for value in range(r.min_value, r.max_value + 1):
+            if letters_by_value[value] is not None:
+                raise ValueError(f"Numeric grade {value} matches more than one letter range.")
+            letters_by_value[value] = letter
+        max_by_letter[letter] = r.max_value
+
+    missing = [value for value, letter in enumerate(letters_by_value) if letter is None]
+    if missing:
+        raise ValueError(f"Numeric grade {missing[0]} does not match any letter range.")
+
+    return CompiledGradeScale(
+        ranges=ranges,
+        letters_by_value=tuple(letters_by_value),
+        max_by_letter=MappingProxyType(max_by_letter),
+    )
+
+
+_active_scale: CompiledGradeScale = compile_grade_scale(GRADE_SCALE)
+
+
+def get_grade_scale() -> CompiledGradeScale:
+    """
+    Return the compiled scale used by the conversion functions.
+    """
+    return _active_scale
+
+
+def load_grade_scale(ranges: Iterable[LetterRange] | CompiledGradeScale) -> CompiledGradeScale:
+    """
+    Replace the scale used by every conversion function (call sites are unchanged).
+
+    Returns the previously active scale so callers can restore it.
+    """
+    global _active_scale
+    previous = _active_scale
+    _active_scale = ranges if isinstance(ranges, CompiledGradeScale) else compile_grade_scale(ranges)
+    return previous
+
+
 def letter_to_numeric_max(letter: str) -> int:
     """
     Convert a letter grade to the numeric MAX value of its interval.
@@ -39,10 +129,10 @@ def letter_to_numeric_max(letter: str) -> int:
       "F"  -> 59
     """
     normalized = letter.strip().upper()
-    for r in GRADE_SCALE:
-        if r.letter == normalized:
-            return r.max_value
-    raise ValueError(f"Unknown letter grade: {letter!r}")
+    try:
+        return _active_scale.max_by_letter[normalized]
+    except KeyError:
+        raise ValueError(f"Unknown letter grade: {letter!r}") from None
 
 
 def numeric_to_letter(value: int) -> str:
@@ -53,10 +143,66 @@ def numeric_to_letter(value: int) -> str:
         raise TypeError("Numeric grade must be an integer.")
     if value < 0 or value > 100:
         raise ValueError("Numeric grade must be between 0 and 100 (inclusive).")
+    return _active_scale.letters_by_value[value]
+
+
+def numeric_to_letters(values):
+    """
+    Convert many numeric grades to letters in one pass.
+
+    Accepts any iterable of ints (returns a list) or a NumPy integer array
+    (returns an array of the same shape). Invalid values raise the same
+    errors as numeric_to_letter.
+    """
+    if hasattr(values, "dtype"):
+        return _numeric_array_to_letters(values)
+
+    table = _active_scale.letters_by_value
+    return [
+        table[v] if isinstance(v, int) and 0 <= v <= 100 else numeric_to_letter(v)
+        for v in values
+    ]
+
+
+def letters_to_numeric(values):
+    """
+    Convert many letter grades to the numeric MAX of their intervals in one pass.
+
+    Accepts any iterable of strings (returns a list) or a NumPy string array
+    (returns an integer array of the same shape). Unknown letters raise the
+    same error as letter_to_numeric_max.
+    """
+    if hasattr(values, "dtype"):
+        return _letter_array_to_numeric(values)
+
+    table = _active_scale.max_by_letter
+    result = []
+    for letter in values:
+        value = table.get(letter)
+        result.append(value if value is not None else letter_to_numeric_max(letter))
+    return result
+
+
+def _numeric_array_to_letters(values):
+    if values.dtype.kind not in "iu":
+        raise TypeError("Numeric grade must be an integer.")
+    if values.size and (values.min() < 0 or values.max() > 100):
+        raise ValueError("Numeric grade must be between 0 and 100 (inclusive).")
+    return _active_scale.letters_array[values]
+
 
-    for r in GRADE_SCALE:
-        if r.min_value <= value <= r.max_value:
-            return r.letter
+def _letter_array_to_numeric(values):
+    import numpy as np
 
-    # Defensive (should never happen if scale covers 0..100)
-    raise ValueError(f"Numeric grade {value} does not match any letter range.")
+    if values.dtype.kind == "S":
+        values = values.astype(str)
+    elif values.dtype.kind not in "UO":
+        raise TypeError("Letter grades must be strings.")
+    # Only the distinct spellings are normalized and looked up.
+    unique, inverse = np.unique(values, return_inverse=True)
+    mapped = np.fromiter(
+        (letter_to_numeric_max(letter) for letter in unique.tolist()),
+        dtype=np.int64,
+        count=len(unique),
+    )
+    return mapped[inverse].reshape(values.shape)
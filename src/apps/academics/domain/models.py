@@ -1,7 +1,9 @@
 
 # Create your models here.
 import uuid
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -17,11 +19,27 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
-class UUIDModel(models.Model):
+class IntegerIdModel(models.Model):
     """
-    Abstract base model that uses UUID as primary key.
+    Abstract base model with a compact integer primary key.
+
+    The integer id is internal: foreign keys and indexes use it, which keeps
+    the large tables and their joins small.
+    """
+    id = models.BigAutoField(primary_key=True)
+
+    class Meta:
+        abstract = True
+
+
+class UUIDModel(IntegerIdModel):
+    """
+    Abstract base model that adds a UUID public identifier.
+
+    The uuid is what the services accept and return; the integer id never
+    leaves the service layer.
     """
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    uuid = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
 
     class Meta:
         abstract = True
@@ -33,6 +51,12 @@ class Student(UUIDModel, TimeStampedModel):
     """
     name = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [
+            # Serves name-ordered listings and (name, uuid) keyset pagination.
+            models.Index(fields=["name", "uuid"], name="student_name_uuid_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
@@ -43,6 +67,12 @@ class Course(UUIDModel, TimeStampedModel):
     """
     name = models.CharField(max_length=255)
 
+    class Meta:
+        indexes = [
+            # Serves name-ordered listings and (name, uuid) keyset pagination.
+            models.Index(fields=["name", "uuid"], name="course_name_uuid_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.name
 
@@ -53,6 +83,11 @@ class Enrollment(UUIDModel, TimeStampedModel):
 
     A student can participate in many courses,
     but only once per course.
+
+    The grade_* / last_* fields are a denormalized aggregate of the
+    enrollment's Grade rows, maintained by the grade services in the same
+    transaction as each write. They let averages be computed without
+    scanning the grade history.
     """
     student = models.ForeignKey(
         Student,
@@ -63,8 +98,14 @@ class Enrollment(UUIDModel, TimeStampedModel):
         Course,
         on_delete=models.CASCADE,
         related_name="enrollments",
+        db_index=False,  # covered by enrollment_course_student_idx
     )
 
+    grade_count = models.PositiveIntegerField(default=0)
+    grade_sum = models.PositiveBigIntegerField(default=0)
+    last_grade_value = models.IntegerField(null=True, blank=True)
+    last_graded_at = models.DateTimeField(null=True, blank=True)
+
     class Meta:
         constraints = [
             models.UniqueConstraint(
@@ -72,17 +113,22 @@ class Enrollment(UUIDModel, TimeStampedModel):
                 name="unique_student_course_enrollment",
             )
         ]
+        indexes = [
+            # Covering index for course rosters (course -> student ids).
+            models.Index(fields=["course", "student"], name="enrollment_course_student_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.student} -> {self.course}"
 
 
-class Grade(UUIDModel, TimeStampedModel):
+class Grade(IntegerIdModel, TimeStampedModel):
     """
     Represents a grade assigned to a student in a course.
 
     Grades are historical records: multiple grades may exist
-    for the same enrollment.
+    for the same enrollment. They are only ever addressed through
+    their enrollment, so they carry no public uuid.
 
     The numeric_value field is the primary source of truth.
     Letter grades are derived representations and should not
@@ -92,6 +138,7 @@ class Grade(UUIDModel, TimeStampedModel):
         Enrollment,
         on_delete=models.CASCADE,
         related_name="grades",
+        db_index=False,  # covered by grade_enrollment_created_idx
     )
 
     numeric_value = models.IntegerField(
@@ -101,5 +148,136 @@ class Grade(UUIDModel, TimeStampedModel):
         ]
     )
 
+    class Meta:
+        indexes = [
+            # Grade history is always read per enrollment in created_at order;
+            # including numeric_value makes those reads index-only.
+            models.Index(
+                fields=["enrollment", "created_at", "numeric_value"],
+                name="grade_enrollment_created_idx",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"{self.enrollment} -> {self.numeric_value}"
+
+
+class ArchivedGrade(IntegerIdModel):
+    """
+    A Grade moved out of the hot table by archive_grades.
+
+    Keeps the original value and created_at; the enrollment's stored
+    aggregate and its GradeRollup still account for it.
+    """
+    enrollment = models.ForeignKey(
+        Enrollment,
+        on_delete=models.CASCADE,
+        related_name="archived_grades",
+        db_index=False,  # covered by archived_grade_enrollment_idx
+    )
+    numeric_value = models.IntegerField()
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["enrollment", "created_at", "numeric_value"],
+                name="archived_grade_enrollment_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.enrollment} -> {self.numeric_value} (archived)"
+
+
+class GradeRollup(models.Model):
+    """
+    Summary of an enrollment's archived grades.
+
+    grade_count/grade_sum/last_* mean the same as on Enrollment, restricted
+    to the archived rows; together with the live Grade rows they rebuild the
+    enrollment's aggregate. archived_through is the latest cutoff applied.
+    """
+    enrollment = models.OneToOneField(
+        Enrollment,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="grade_rollup",
+    )
+    grade_count = models.PositiveIntegerField(default=0)
+    grade_sum = models.PositiveBigIntegerField(default=0)
+    min_grade_value = models.IntegerField(null=True, blank=True)
+    max_grade_value = models.IntegerField(null=True, blank=True)
+    last_grade_value = models.IntegerField(null=True, blank=True)
+    last_graded_at = models.DateTimeField(null=True, blank=True)
+    archived_through = models.DateTimeField()
+
+    def __str__(self) -> str:
+        return f"{self.enrollment} rollup ({self.grade_count} grades)"
+
+
+class OutboxEvent(IntegerIdModel):
+    """
+    A domain event appended by a write service in the same transaction as
+    the write (transactional outbox).
+
+    Consumers read events in id order and remember the last id they
+    processed (OutboxOffset), so delivery is at-least-once and never
+    blocks the write path. payload holds public ids only.
+    """
+    topic = models.CharField(max_length=40)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.id} {self.topic}"
+
+
+class OutboxOffset(models.Model):
+    """
+    A consumer's position in the outbox: the id of the last event it processed.
+    """
+    consumer = models.CharField(max_length=100, primary_key=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.consumer} @ {self.position}"
+
+
+class Job(IntegerIdModel):
+    """
+    A unit of background work for run_workers: a registered job name and
+    its JSON keyword arguments.
+
+    Workers claim queued jobs with an atomic compare-and-set UPDATE. A
+    failed job is queued again with a backoff until max_attempts, then
+    left as DEAD (the dead-letter state) with its last error.
+    """
+    class Status(models.TextChoices):
+        QUEUED = "queued"
+        RUNNING = "running"
+        SUCCEEDED = "succeeded"
+        DEAD = "dead"
+
+    name = models.CharField(max_length=100)
+    kwargs = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(max_length=10, choices=Status.choices, default=Status.QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    result = models.JSONField(null=True, blank=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Claims walk one status in id (FIFO) order.
+            models.Index(fields=["status", "id"], name="job_status_id_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.id} {self.name} ({self.status})"
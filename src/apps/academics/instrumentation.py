@@ -0,0 +1,266 @@
+"""
+Opt-in instrumentation of the academics service layer.
+
+Public service functions, sync and async, are decorated with @instrumented.
+When enabled, each call records its wall time, number of SQL statements and
+time spent in the database into in-process histograms, exported in
+Prometheus text format by the metrics view. Calls slower than a threshold are
+logged with their SQL. Hit/miss counts of the read-through caches are always
+recorded.
+
+Statements are attributed through a context variable, not per-thread
+connection state: an async service's queries run in Django's sync thread
+(sync_to_async), which inherits the calling context. Every connection gets
+one execute wrapper when it is opened (install_query_recorder, connected to
+connection_created by the app config); it does nothing outside an
+instrumented call.
+
+Settings (all optional):
+
+    ACADEMICS_INSTRUMENTATION = {
+        "ENABLED": True,            # default False: the decorator is a no-op
+        "SLOW_CALL_SECONDS": 0.5,   # default None: no slow-call logging
+    }
+"""
+from __future__ import annotations
+
+import bisect
+import inspect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 500, 1000)
+
+
+def _config() -> dict:
+    return getattr(settings, "ACADEMICS_INSTRUMENTATION", None) or {}
+
+
+class Histogram:
+    """
+    Cumulative-bucket histogram (Prometheus semantics). Not thread-safe on
+    its own; MetricsRegistry serializes access.
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        running = 0
+        result = []
+        for bound, count in zip((*map(_format_number, self.buckets), "+Inf"), self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._duration: dict[str, Histogram] = {}
+        self._queries: dict[str, Histogram] = {}
+        self._db_time: dict[str, Histogram] = {}
+        self._errors: dict[tuple[str, str], int] = {}
+        self._cache_requests: dict[tuple[str, str], int] = {}
+
+    def observe(self, service: str, *, seconds: float, queries: int, db_seconds: float, error: str | None):
+        with self._lock:
+            if service not in self._duration:
+                self._duration[service] = Histogram(DURATION_BUCKETS)
+                self._queries[service] = Histogram(QUERY_BUCKETS)
+                self._db_time[service] = Histogram(DURATION_BUCKETS)
+            self._duration[service].observe(seconds)
+            self._queries[service].observe(queries)
+            self._db_time[service].observe(db_seconds)
+            if error is not None:
+                self._errors[(service, error)] = self._errors.get((service, error), 0) + 1
+
+    def count_cache(self, cache: str, *, hit: bool) -> None:
+        key = (cache, "hit" if hit else "miss")
+        with self._lock:
+            self._cache_requests[key] = self._cache_requests.get(key, 0) + 1
+
+    def cache_stats(self, cache: str) -> dict[str, int]:
+        """
+        Hit and miss totals of one read-through cache.
+        """
+        with self._lock:
+            return {
+                "hits": self._cache_requests.get((cache, "hit"), 0),
+                "misses": self._cache_requests.get((cache, "miss"), 0),
+            }
+
+    def snapshot(self, service: str) -> dict | None:
+        """
+        Totals for one service (calls, seconds, queries, db_seconds), or None if never called.
+        """
+        with self._lock:
+            if service not in self._duration:
+                return None
+            return {
+                "calls": self._duration[service].count,
+                "seconds": self._duration[service].sum,
+                "queries": int(self._queries[service].sum),
+                "db_seconds": self._db_time[service].sum,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._duration.clear()
+            self._queries.clear()
+            self._db_time.clear()
+            self._errors.clear()
+            self._cache_requests.clear()
+
+    def render_prometheus(self) -> str:
+        families = (
+            ("academics_service_duration_seconds", "Wall time of academics service calls.", self._duration),
+            ("academics_service_db_queries", "SQL statements issued per service call.", self._queries),
+            ("academics_service_db_seconds", "Database time per service call.", self._db_time),
+        )
+        lines: list[str] = []
+        with self._lock:
+            for name, help_text, histograms in families:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for service in sorted(histograms):
+                    h = histograms[service]
+                    label = f'service="{service}"'
+                    for bound, count in h.cumulative():
+                        lines.append(f'{name}_bucket{{{label},le="{bound}"}} {count}')
+                    lines.append(f"{name}_sum{{{label}}} {float(h.sum)!r}")
+                    lines.append(f"{name}_count{{{label}}} {h.count}")
+            lines.append("# HELP academics_service_errors_total Service calls that raised, by exception type.")
+            lines.append("# TYPE academics_service_errors_total counter")
+            for (service, error), count in sorted(self._errors.items()):
+                lines.append(f'academics_service_errors_total{{service="{service}",exception="{error}"}} {count}')
+            lines.append("# HELP academics_cache_requests_total Read-through cache lookups, by result.")
+            lines.append("# TYPE academics_cache_requests_total counter")
+            for (cache, result), count in sorted(self._cache_requests.items()):
+                lines.append(f'academics_cache_requests_total{{cache="{cache}",result="{result}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+def _format_number(value: float) -> str:
+    return f"{value:g}"
+
+
+registry = MetricsRegistry()
+
+
+class _CallRecorder:
+    """
+    Query count, DB time and (optionally) SQL of one instrumented call.
+    """
+
+    def __init__(self, capture_sql: bool):
+        self.queries = 0
+        self.seconds = 0.0
+        self.statements: list[str] | None = [] if capture_sql else None
+
+    def add(self, sql: str, seconds: float) -> None:
+        self.seconds += seconds
+        self.queries += 1
+        if self.statements is not None:
+            self.statements.append(sql)
+
+
+# Recorders of the instrumented calls in progress, innermost last: a nested
+# call's statements also count for the calls around it.
+_active_recorders: ContextVar[tuple[_CallRecorder, ...]] = ContextVar("academics_call_recorders", default=())
+
+
+def _record_queries(execute, sql, params, many, context):
+    recorders = _active_recorders.get()
+    if not recorders:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        for recorder in recorders:
+            recorder.add(sql, elapsed)
+
+
+def install_query_recorder(sender=None, connection=None, **kwargs) -> None:
+    """
+    connection_created receiver: give a newly opened connection (any alias) the query recorder.
+    """
+    if _record_queries not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks entered before the connection was opened still pop their own.
+        connection.execute_wrappers.insert(0, _record_queries)
+
+
+@contextmanager
+def _recording(service: str, config: dict):
+    slow_after = config.get("SLOW_CALL_SECONDS")
+    recorder = _CallRecorder(capture_sql=slow_after is not None)
+    token = _active_recorders.set((*_active_recorders.get(), recorder))
+    error = None
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        _active_recorders.reset(token)
+        registry.observe(service, seconds=elapsed, queries=recorder.queries, db_seconds=recorder.seconds, error=error)
+        if slow_after is not None and elapsed >= slow_after:
+            logger.warning(
+                "Slow service call %s: %.3fs, %d queries (%.3fs in DB)\n%s",
+                service,
+                elapsed,
+                recorder.queries,
+                recorder.seconds,
+                "\n".join(recorder.statements),
+            )
+
+
+def instrumented(fn):
+    """
+    Record latency, query count and DB time of each call when instrumentation is enabled.
+
+    Works on plain and coroutine functions (the coroutine is timed until it
+    returns, including its queries in Django's sync thread).
+    """
+    service = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    if inspect.iscoroutinefunction(fn):
+        @wraps(fn)
+        async def wrapper(*args, **kwargs):
+            config = _config()
+            if not config.get("ENABLED"):
+                return await fn(*args, **kwargs)
+            with _recording(service, config):
+                return await fn(*args, **kwargs)
+    else:
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            config = _config()
+            if not config.get("ENABLED"):
+                return fn(*args, **kwargs)
+            with _recording(service, config):
+                return fn(*args, **kwargs)
+
+    wrapper.service_name = service
+    return wrapper
@@ -0,0 +1,61 @@
+import time
+from datetime import datetime, time as dt_time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from apps.academics.services.archival import ARCHIVE_BATCH_SIZE, archive_grades
+
+
+def _parse_cutoff(value: str) -> datetime:
+    """
+    An ISO date (midnight) or datetime; naive values are in the current time zone.
+    """
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None and (day := parse_date(value)) is not None:
+            parsed = datetime.combine(day, dt_time.min)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise CommandError(f"Invalid --before value {value!r}; use YYYY-MM-DD or an ISO datetime.")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = (
+        "Move grades recorded before a cutoff into the archive table, keeping a "
+        "per-enrollment rollup. Averages are unchanged; report cards and grade "
+        "lists show archived grades only when asked (include_archived=True)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--before",
+            required=True,
+            help="Archive grades created before this date/datetime (e.g. the start of the current term).",
+        )
+        parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE, help="Enrollments per transaction.")
+
+    def handle(self, *args, **options):
+        before = _parse_cutoff(options["before"])
+        started = time.perf_counter()
+
+        def progress(result):
+            elapsed = time.perf_counter() - started
+            self.stderr.write(
+                f"{result.grades} grades from {result.enrollments} enrollments archived "
+                f"({result.grades / elapsed:.0f} grades/s)"
+            )
+
+        result = archive_grades(before=before, batch_size=options["batch_size"], progress=progress)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {result.grades} grade(s) from {result.enrollments} enrollment(s) "
+                f"created before {before.isoformat()} in {elapsed:.2f}s."
+            )
+        )
@@ -0,0 +1,93 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academics.services.outbox import OUTBOX_BATCH_SIZE, consumers, drain_outbox, prune_outbox
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver outbox events (grade.recorded, enrollment.created) to the consumers "
+        "configured in ACADEMICS_OUTBOX['HANDLERS'], in batches, from each consumer's "
+        "stored position. Delivery is at-least-once; a failing consumer is retried "
+        "from the same position and does not hold up the others."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--consumer",
+            action="append",
+            dest="consumers",
+            metavar="NAME",
+            help="Drain only this consumer (repeatable). Default: every configured consumer.",
+        )
+        parser.add_argument("--batch-size", type=int, default=OUTBOX_BATCH_SIZE, help="Events per handler call.")
+        parser.add_argument(
+            "--follow",
+            action="store_true",
+            help="Keep running, polling for new events every --interval seconds when idle.",
+        )
+        parser.add_argument("--interval", type=float, default=1.0)
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="After each pass, delete the events every configured consumer has processed.",
+        )
+
+    def handle(self, *args, **options):
+        handlers = consumers()
+        names = options["consumers"] or list(handlers)
+        unknown = [name for name in names if name not in handlers]
+        if unknown:
+            raise CommandError(
+                f"Unknown consumer(s): {', '.join(unknown)}. Configured: {', '.join(handlers) or 'none'}."
+            )
+
+        try:
+            while True:
+                delivered, failed = self._pass(names, handlers, options)
+                if not options["follow"]:
+                    break
+                if not delivered:
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            self.stderr.write("Interrupted; positions are saved after every batch.")
+            return
+        if failed:
+            raise CommandError(f"Consumer(s) failed: {', '.join(failed)}; they resume from their last position.")
+
+    def _pass(self, names, handlers, options) -> tuple[int, list[str]]:
+        delivered = 0
+        failed = []
+        for name in names:
+            started = time.perf_counter()
+
+            def progress(result, started=started):
+                elapsed = time.perf_counter() - started
+                self.stderr.write(
+                    f"{result.consumer}: {result.delivered} events delivered, position {result.position} "
+                    f"({result.delivered / elapsed:.0f} events/s)"
+                )
+
+            try:
+                result = drain_outbox(
+                    consumer=name, handler=handlers[name], batch_size=options["batch_size"], progress=progress
+                )
+            except Exception as exc:
+                failed.append(name)
+                self.stderr.write(self.style.ERROR(f"{name}: handler failed: {exc!r}"))
+                continue
+            delivered += result.delivered
+            if result.delivered:
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"{name}: delivered {result.delivered} event(s) in {result.batches} batch(es), "
+                        f"{elapsed:.2f}s, up to id {result.position}."
+                    )
+                )
+        if options["prune"]:
+            pruned = prune_outbox()
+            if pruned:
+                self.stdout.write(f"Pruned {pruned} processed event(s).")
+        return delivered, failed
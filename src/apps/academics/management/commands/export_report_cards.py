@@ -0,0 +1,122 @@
+import csv
+import json
+import time
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academics.services.report_cards import (
+    REPORT_CARD_BATCH_SIZE,
+    report_card_chunks,
+    report_card_to_dict,
+)
+
+CSV_HEADER = (
+    "student_id",
+    "course_id",
+    "course_name",
+    "numeric_grades",
+    "numeric_average",
+    "letter_average",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Export every student's report card as JSONL (one card per line) or CSV "
+        "(one row per student and course), walking students in id order."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+        parser.add_argument(
+            "--output",
+            default="-",
+            help="Destination file, or '-' for stdout (default).",
+        )
+        parser.add_argument("--chunk-size", type=int, default=REPORT_CARD_BATCH_SIZE)
+        parser.add_argument(
+            "--after",
+            metavar="STUDENT_ID",
+            help="Resume after this student id (as printed in the progress lines); "
+                 "the output file is appended to.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Build report cards in this many processes (one id range per chunk); "
+                 "the output is the same for any value.",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        after = options["after"]
+        if after:
+            # Validated before the output file is opened (and appended to).
+            try:
+                options["after"] = uuid.UUID(after)
+            except ValueError:
+                raise CommandError("--after must be a student uuid") from None
+        if output == "-":
+            self._export(self.stdout, **options)
+            return
+
+        with open(output, "a" if after else "w", newline="", encoding="utf-8") as stream:
+            self._export(stream, **options)
+
+    def _export(self, stream, *, format, chunk_size, after, workers, **options):
+        if format == "csv":
+            writer = csv.writer(stream)
+            if not after:
+                writer.writerow(CSV_HEADER)
+            write = self._csv_writer(writer)
+        else:
+            write = self._jsonl_writer(stream)
+
+        started = time.perf_counter()
+        exported = 0
+        last_id = after
+        for chunk in report_card_chunks(workers=workers, after=after or None, chunk_size=chunk_size):
+            for card in chunk.cards:
+                write(card)
+            stream.flush()
+            exported += len(chunk.cards)
+            # The range's end, not the last card's: a range whose students
+            # were all deleted meanwhile comes back empty.
+            last_id = chunk.last_id
+            elapsed = time.perf_counter() - started
+            self.stderr.write(
+                f"{exported} students exported ({exported / elapsed:.0f} students/s), "
+                f"last id {last_id}"
+            )
+
+        elapsed = time.perf_counter() - started
+        rate = exported / elapsed if elapsed else 0.0
+        self.stderr.write(
+            self.style.SUCCESS(
+                f"Exported {exported} report card(s) in {elapsed:.2f}s ({rate:.0f} students/s)."
+            )
+        )
+
+    @staticmethod
+    def _jsonl_writer(stream):
+        def write(card):
+            stream.write(json.dumps(report_card_to_dict(card), separators=(",", ":")) + "\n")
+        return write
+
+    @staticmethod
+    def _csv_writer(writer):
+        def write(card):
+            writer.writerows(
+                (
+                    card.student_id,
+                    c.course_id,
+                    c.course_name,
+                    " ".join(map(str, c.numeric_grades)),
+                    c.numeric_average,
+                    c.letter_average,
+                )
+                for c in card.courses
+            )
+        return write
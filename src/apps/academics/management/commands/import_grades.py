@@ -0,0 +1,99 @@
+import csv
+import json
+import re
+import sys
+import time
+from itertools import islice
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academics.services.grades import BULK_GRADE_CHUNK_SIZE, record_grades_bulk
+
+_INTEGER_RE = re.compile(r"[+-]?\d+")
+
+
+def _parse_grade(value):
+    """
+    Integers (or integer-looking strings) are numeric grades; any other string is a letter.
+    """
+    if isinstance(value, str):
+        stripped = value.strip()
+        return int(stripped) if _INTEGER_RE.fullmatch(stripped) else stripped
+    return value
+
+
+def _csv_rows(stream):
+    for record in csv.DictReader(stream):
+        yield record.get("student_id"), record.get("course_id"), _parse_grade(record.get("grade"))
+
+
+def _jsonl_rows(stream):
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            # Surfaces as a per-row error from record_grades_bulk.
+            yield None
+            continue
+        if not isinstance(record, dict):
+            yield None
+            continue
+        yield record.get("student_id"), record.get("course_id"), _parse_grade(record.get("grade"))
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream grades from a CSV or JSONL file (columns/keys: student_id, course_id, grade) "
+        "into record_grades_bulk. Use '-' to read from stdin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, or '-' for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=("csv", "jsonl"),
+            help="Input format. Defaults to the file extension.",
+        )
+        parser.add_argument("--chunk-size", type=int, default=BULK_GRADE_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in ("csv", "jsonl"):
+            raise CommandError("Cannot infer input format; pass --format csv|jsonl.")
+
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            rows = _csv_rows(stream) if fmt == "csv" else _jsonl_rows(stream)
+            self._import(rows, chunk_size=options["chunk_size"])
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+    def _import(self, rows, *, chunk_size):
+        started = time.perf_counter()
+        processed = created = failed = 0
+
+        # One chunk at a time keeps memory bounded regardless of file size.
+        while chunk := list(islice(rows, chunk_size)):
+            result = record_grades_bulk(chunk, chunk_size=chunk_size)
+            for err in result.errors:
+                self.stderr.write(f"row {processed + err.row_number + 1}: {err.error}")
+            processed += len(chunk)
+            created += result.created
+            failed += len(result.errors)
+
+            elapsed = time.perf_counter() - started
+            self.stderr.write(f"{processed} rows processed ({processed / elapsed:.0f} rows/s)")
+
+        elapsed = time.perf_counter() - started
+        rate = processed / elapsed if elapsed else 0.0
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {created} grade(s), {failed} error(s) "
+                f"in {elapsed:.2f}s ({rate:.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,375 @@
+import json
+import multiprocessing
+import random
+import threading
+import time
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+# The services are imported inside functions: spawned workers import this
+# module before django.setup() has run.
+
+OPERATIONS = (
+    "record_grade",
+    "enroll_student",
+    "build_report_card",
+    "list_students_for_course",
+    "list_courses_for_student",
+)
+DEFAULT_MIX = (
+    "record_grade=20,enroll_student=5,build_report_card=50,"
+    "list_students_for_course=15,list_courses_for_student=10"
+)
+# Students, courses and enrolled pairs sampled from the database to draw requests from.
+SAMPLE_SIZE = 20_000
+# Random primary-key ranges each sample is read from.
+SAMPLE_WINDOWS = 50
+
+# Request outcomes. A rejected request hit a business rule (e.g. a duplicate
+# enrollment): the service worked, the caller gets a 4xx. An unsent request
+# was due (open loop) but its client was still busy when the run ended.
+OK, REJECTED, LOCK_TIMEOUT, ERROR, UNSENT = "ok", "rejected", "lock_timeout", "error", "unsent"
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    """
+    "record_grade=20,build_report_card=80" -> {operation: share of requests}.
+    """
+    weights = {}
+    for part in filter(None, (p.strip() for p in value.split(","))):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS:
+            raise CommandError(f"Unknown operation {name!r} in --mix; choose from {', '.join(OPERATIONS)}.")
+        try:
+            weights[name] = float(weight)
+        except ValueError:
+            raise CommandError(f"--mix needs NAME=WEIGHT pairs, got {part!r}.")
+        if weights[name] < 0:
+            raise CommandError(f"Negative weight for {name} in --mix.")
+    total = sum(weights.values())
+    if not total:
+        raise CommandError("--mix gives no operation a positive weight.")
+    return {name: weight / total for name, weight in weights.items() if weight}
+
+
+def sample_ids(size: int = SAMPLE_SIZE, *, seed: int | None = None) -> tuple[list, list, list]:
+    """
+    (enrolled (student, course) pairs, students, courses) picked at random from the database.
+    """
+    from apps.academics.domain.models import Course, Enrollment, Student
+
+    rng = random.Random(seed)
+    pairs = _sample(Enrollment.objects.values_list("student__uuid", "course__uuid"), size, rng)
+    students = _sample(Student.objects.values_list("uuid", flat=True), size, rng)
+    courses = _sample(Course.objects.values_list("uuid", flat=True), size, rng)
+    return pairs, students, courses
+
+
+def _sample(queryset, size: int, rng: random.Random) -> list:
+    """
+    About `size` rows read from SAMPLE_WINDOWS runs starting at random ids.
+
+    Each run is a primary-key range read, unlike ORDER BY RANDOM(), which
+    sorts the whole table. Runs may overlap and gaps in the ids skew the
+    picks a little; the load test draws from the sample with replacement
+    anyway.
+    """
+    from django.db.models import Max, Min
+
+    bounds = queryset.aggregate(low=Min("pk"), high=Max("pk"))
+    if bounds["low"] is None:
+        return []
+    per_window = -(-size // SAMPLE_WINDOWS)
+    rows = []
+    for _ in range(SAMPLE_WINDOWS):
+        start = rng.randint(bounds["low"], bounds["high"])
+        rows += queryset.filter(pk__gte=start).order_by("pk")[:per_window]
+    return rows
+
+
+def _operations(ids, rng: random.Random) -> dict:
+    from apps.academics.services.enrollments import enroll_student
+    from apps.academics.services.grades import record_grade
+    from apps.academics.services.queries import list_courses_for_student, list_students_for_course
+    from apps.academics.services.report_cards import build_report_card
+
+    pairs, students, courses = ids
+
+    def grade():
+        student_id, course_id = rng.choice(pairs)
+        record_grade(student_id=student_id, course_id=course_id, numeric=rng.randint(0, 100))
+
+    return {
+        "record_grade": grade,
+        "enroll_student": lambda: enroll_student(student_id=rng.choice(students), course_id=rng.choice(courses)),
+        "build_report_card": lambda: build_report_card(student_id=rng.choice(students)),
+        "list_students_for_course": lambda: list_students_for_course(course_id=rng.choice(courses)),
+        "list_courses_for_student": lambda: list_courses_for_student(student_id=rng.choice(students)),
+    }
+
+
+def _new_tally() -> dict:
+    return {"latencies": [], "outcomes": Counter(), "errors": Counter()}
+
+
+def _merge(into: dict, tallies: dict) -> dict:
+    for name, tally in tallies.items():
+        mine = into.setdefault(name, _new_tally())
+        mine["latencies"].extend(tally["latencies"])
+        mine["outcomes"].update(tally["outcomes"])
+        mine["errors"].update(tally["errors"])
+    return into
+
+
+def drive(*, ids, mix: dict[str, float], rate: float, duration: float, warmup: float, seed: int) -> dict:
+    """
+    Issue requests drawn from mix until warmup + duration seconds have passed.
+
+    Returns {operation: {"latencies": [ms, ...], "outcomes": Counter, "errors": Counter}}
+    for the requests scheduled after the warm-up.
+
+    Rules:
+    - rate > 0 is an open loop: requests arrive at random (Poisson) times at
+      that mean rate, whether or not earlier ones have finished. Latency is
+      counted from the scheduled arrival, so time spent queued behind a slow
+      request is included instead of silently lowering the offered load.
+    - rate == 0 is a closed loop: the next request is sent as soon as the
+      previous one returns.
+    - No request starts after the deadline; arrivals still queued then are
+      counted as unsent (the client could not keep up with the rate).
+    - Every request is recorded, whatever its outcome; lock timeouts
+      (is_lock_error after the services' own retries) and other errors are
+      also counted separately.
+    """
+    from apps.academics.domain.exceptions import DomainError
+    from apps.academics.retry import is_lock_error
+
+    rng = random.Random(seed)
+    operations = _operations(ids, rng)
+    names, weights = list(mix), list(mix.values())
+    tallies = {name: _new_tally() for name in names}
+
+    started = time.perf_counter()
+    measured_from, deadline = started + warmup, started + warmup + duration
+    scheduled = started
+    while True:
+        if rate:
+            scheduled += rng.expovariate(rate)
+            if scheduled >= deadline:
+                break
+            if (pause := scheduled - time.perf_counter()) > 0:
+                time.sleep(pause)
+            elif time.perf_counter() >= deadline:
+                while scheduled < deadline:
+                    if scheduled >= measured_from:
+                        tallies[rng.choices(names, weights)[0]]["outcomes"][UNSENT] += 1
+                    scheduled += rng.expovariate(rate)
+                break
+        else:
+            scheduled = time.perf_counter()
+            if scheduled >= deadline:
+                break
+
+        name = rng.choices(names, weights)[0]
+        try:
+            operations[name]()
+            outcome = OK
+        except DomainError:
+            outcome = REJECTED
+        except Exception as exc:
+            outcome = LOCK_TIMEOUT if is_lock_error(exc) else ERROR
+            if outcome == ERROR:
+                tallies[name]["errors"][type(exc).__name__] += 1
+        if scheduled >= measured_from:
+            tallies[name]["latencies"].append((time.perf_counter() - scheduled) * 1000)
+            tallies[name]["outcomes"][outcome] += 1
+    return tallies
+
+
+def _drive_threads(threads: int, **kwargs) -> dict:
+    # One database connection per thread, closed when it is done.
+    from django.db import connection
+
+    results = [None] * threads
+
+    def run(index):
+        try:
+            results[index] = drive(**{**kwargs, "seed": kwargs["seed"] + index})
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    merged = {}
+    for tallies in results:
+        _merge(merged, tallies or {})
+    return merged
+
+
+def _process_main(threads, kwargs, ready, results) -> None:
+    import django
+
+    django.setup()
+    _operations(kwargs["ids"], random.Random())  # import the services before the clock starts
+    ready.wait()
+    results.put(_drive_threads(threads, **kwargs))
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(tallies: dict, *, duration: float) -> list[dict]:
+    """
+    One row per operation (in OPERATIONS order, then "total") with throughput,
+    latency percentiles in ms and outcome rates.
+    """
+    rows = []
+    everything = {}
+    for tally in tallies.values():
+        _merge(everything, {"total": tally})
+    for name, tally in [*sorted(tallies.items(), key=lambda i: OPERATIONS.index(i[0])), *everything.items()]:
+        latencies = sorted(tally["latencies"])
+        requests = len(latencies)
+        outcomes = tally["outcomes"]
+        rows.append({
+            "operation": name,
+            "requests": requests,
+            "throughput": requests / duration,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+            "max_ms": latencies[-1] if latencies else 0.0,
+            "rejected_rate": outcomes[REJECTED] / requests if requests else 0.0,
+            "lock_timeout_rate": outcomes[LOCK_TIMEOUT] / requests if requests else 0.0,
+            "error_rate": outcomes[ERROR] / requests if requests else 0.0,
+            "unsent": outcomes[UNSENT],
+            "errors": dict(tally["errors"]),
+        })
+    return rows
+
+
+class Command(BaseCommand):
+    help = (
+        "Drive a mixed workload (grade entry, enrollments, report cards, roster queries) "
+        "against the database from many threads and processes, and report throughput, "
+        "p50/p95/p99 latency and error and lock-timeout rates per operation. Writes are "
+        "real: point the settings at a seeded scratch database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help="Client processes (default: 1, this process). Each one has its own connections.",
+        )
+        parser.add_argument("--threads", type=int, default=4, help="Client threads per process (default: 4).")
+        parser.add_argument("--duration", type=float, default=30.0, help="Measured seconds (default: 30).")
+        parser.add_argument(
+            "--warmup",
+            type=float,
+            default=2.0,
+            help="Seconds of load before measuring starts (default: 2).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=0.0,
+            help="Offered requests per second across all clients (open loop). "
+                 "0 (default): every client sends its next request as soon as the last one returns.",
+        )
+        parser.add_argument(
+            "--mix",
+            default=DEFAULT_MIX,
+            help=f"Relative weight of each operation (default: {DEFAULT_MIX}).",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", help="Also write the results as JSON to this file.")
+
+    def handle(self, *args, **options):
+        processes, threads = max(1, options["processes"]), max(1, options["threads"])
+        clients = processes * threads
+        mix = parse_mix(options["mix"])
+
+        ids = sample_ids(seed=options["seed"])
+        if not all(ids):
+            raise CommandError("The database needs students, courses and enrollments; seed it first.")
+        kwargs = {
+            "ids": ids,
+            "mix": mix,
+            "rate": options["rate"] / clients,
+            "duration": options["duration"],
+            "warmup": options["warmup"],
+            "seed": options["seed"],
+        }
+        offered = f"{options['rate']:.0f} req/s offered" if options["rate"] else "closed loop"
+        self.stderr.write(
+            f"{clients} client(s) ({processes} process(es) x {threads} thread(s)), {offered}, "
+            f"{options['warmup']:g}s warm-up + {options['duration']:g}s measured."
+        )
+
+        if processes == 1 and threads == 1:
+            tallies = drive(**kwargs)
+        elif processes == 1:
+            tallies = _drive_threads(threads, **kwargs)
+        else:
+            tallies = self._run_processes(processes, threads, kwargs)
+
+        rows = summarize(tallies, duration=options["duration"])
+        self._print(rows)
+        if rows and rows[-1]["unsent"]:
+            self.stderr.write(self.style.WARNING(
+                f"{rows[-1]['unsent']} request(s) were due but never sent: the clients are saturated "
+                f"at this rate (achieved {rows[-1]['throughput']:.0f} req/s); add clients or lower --rate."
+            ))
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                json.dump({"clients": clients, "rate": options["rate"], "mix": mix, "results": rows}, f, indent=2)
+
+    def _run_processes(self, processes, threads, kwargs) -> dict:
+        # spawn, not fork: children must not share the parent's database connections.
+        from django.db import connection
+
+        connection.close()
+        context = multiprocessing.get_context("spawn")
+        ready, results = context.Barrier(processes + 1), context.Queue()
+        children = [
+            context.Process(
+                target=_process_main,
+                args=(threads, {**kwargs, "seed": kwargs["seed"] + i * threads}, ready, results),
+                daemon=True,
+            )
+            for i in range(processes)
+        ]
+        for child in children:
+            child.start()
+        ready.wait()  # every process has set up Django; start together
+        merged = {}
+        for _ in children:
+            _merge(merged, results.get())
+        for child in children:
+            child.join()
+        return merged
+
+    def _print(self, rows) -> None:
+        self.stdout.write(
+            f"{'operation':26s} {'requests':>9s} {'req/s':>9s} {'p50 ms':>8s} {'p95 ms':>8s} "
+            f"{'p99 ms':>8s} {'max ms':>8s} {'rejected':>9s} {'locked':>8s} {'errors':>8s}"
+        )
+        for r in rows:
+            self.stdout.write(
+                f"{r['operation']:26s} {r['requests']:9d} {r['throughput']:9.1f} {r['p50_ms']:8.2f} "
+                f"{r['p95_ms']:8.2f} {r['p99_ms']:8.2f} {r['max_ms']:8.1f} {r['rejected_rate']:9.2%} "
+                f"{r['lock_timeout_rate']:8.2%} {r['error_rate']:8.2%}"
+            )
+        for r in rows[:-1]:
+            for error, count in r["errors"].items():
+                self.stderr.write(f"{r['operation']}: {count} x {error}")
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academics.services.grade_stats import find_grade_stats_mismatches, rebuild_grade_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-enrollment grade aggregates from raw Grade rows. "
+        "Run after loading fixtures or bulk-inserting grades outside the services."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the aggregates; exit with an error if any is out of sync.",
+        )
+
+    def handle(self, *args, **options):
+        if options["check"]:
+            mismatches = 0
+            for m in find_grade_stats_mismatches():
+                mismatches += 1
+                self.stderr.write(
+                    f"Enrollment {m.enrollment_id}: stored={m.stored} actual={m.actual}"
+                )
+            if mismatches:
+                raise CommandError(f"{mismatches} enrollment aggregate(s) out of sync.")
+            self.stdout.write(self.style.SUCCESS("All enrollment grade aggregates are in sync."))
+            return
+
+        updated = rebuild_grade_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt grade aggregates for {updated} enrollment(s)."))
@@ -0,0 +1,61 @@
+import os
+import sqlite3
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def copy_database(source: str, destination: str) -> None:
+    """
+    Snapshot source into destination with SQLite's online backup API.
+
+    The copy is written next to destination and renamed over it, so readers
+    see either the previous snapshot or the new one, never a partial file.
+    It uses the rollback journal, as read-only connections cannot open a WAL
+    database whose directory they may not write to.
+    """
+    partial = f"{destination}.partial"
+    if os.path.exists(partial):
+        os.remove(partial)
+    src = sqlite3.connect(source, uri=True)
+    dst = sqlite3.connect(partial)
+    try:
+        src.backup(dst)
+        dst.execute("PRAGMA journal_mode=delete")
+    finally:
+        dst.close()
+        src.close()
+    os.replace(partial, destination)
+
+
+class Command(BaseCommand):
+    help = (
+        "Refresh the read-only SQLite replica (SQLITE_REPLICA_PATH) from the primary database. "
+        "Reads routed to the replica see the data as of the last refresh."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--interval",
+            type=float,
+            help="Keep refreshing every INTERVAL seconds instead of refreshing once.",
+        )
+
+    def handle(self, *args, **options):
+        primary = connections[DEFAULT_DB_ALIAS]
+        if primary.vendor != "sqlite":
+            raise CommandError("The replica snapshot is only for SQLite; use the database's own replication.")
+        destination = getattr(settings, "SQLITE_REPLICA_PATH", None)
+        if not destination:
+            raise CommandError("SQLITE_REPLICA_PATH is not set.")
+        source = str(primary.settings_dict["NAME"])
+
+        while True:
+            started = time.perf_counter()
+            copy_database(source, str(destination))
+            self.stdout.write(f"Replica refreshed in {time.perf_counter() - started:.2f}s: {destination}")
+            if not options["interval"]:
+                return
+            time.sleep(options["interval"])
@@ -0,0 +1,121 @@
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+
+# The services are imported inside functions: spawned workers import this
+# module before django.setup() has run.
+
+
+def _worker_name() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def work(*, names, burst: bool, interval: float, stop, report=None) -> int:
+    """
+    Run jobs until stop is set (or, with burst, until none is ready); return how many ran.
+    """
+    from apps.academics.services.jobs import run_next_job
+
+    worker = _worker_name()
+    ran = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        status = run_next_job(worker=worker, names=names)
+        if status is None:
+            if burst:
+                break
+            stop.wait(interval)
+            continue
+        ran += 1
+        if report:
+            report(f"{worker}: job {status} in {time.perf_counter() - started:.2f}s")
+    return ran
+
+
+def _process_main(names, burst, interval, stop, total) -> None:
+    # The parent handles Ctrl-C and sets stop, so a job in progress is always finished.
+    import django
+
+    django.setup()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    ran = work(names=names, burst=burst, interval=interval, stop=stop)
+    with total.get_lock():
+        total.value += ran
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued academics jobs (apps.academics.services.jobs) in a pool of worker "
+        "processes. Jobs are claimed from the database, retried with backoff and "
+        "dead-lettered after their last attempt; a restarted pool picks up where it left off."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Worker processes (default: CPU count). 1 runs the worker in this process.",
+        )
+        parser.add_argument(
+            "--job",
+            action="append",
+            dest="names",
+            metavar="NAME",
+            help="Only run jobs with this name (repeatable).",
+        )
+        parser.add_argument("--burst", action="store_true", help="Exit once no job is ready.")
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds between polls when idle.")
+
+    def handle(self, *args, **options):
+        from apps.academics.services.jobs import job_counts
+
+        concurrency = max(1, options["concurrency"])
+        names, burst, interval = options["names"], options["burst"], options["interval"]
+        started = time.perf_counter()
+
+        if concurrency == 1:
+            stop = threading.Event()
+            try:
+                ran = work(names=names, burst=burst, interval=interval, stop=stop, report=self.stderr.write)
+            except KeyboardInterrupt:
+                self.stderr.write("Interrupted; the job in progress returns to the queue when its lease expires.")
+                return
+        else:
+            ran = self._run_pool(concurrency, names, burst, interval)
+
+        elapsed = time.perf_counter() - started
+        counts = ", ".join(f"{status} {n}" for status, n in job_counts().items())
+        self.stdout.write(self.style.SUCCESS(f"Ran {ran} job(s) in {elapsed:.2f}s ({counts})."))
+
+    def _run_pool(self, concurrency, names, burst, interval) -> int:
+        # spawn, not fork: children must not share the parent's database connections.
+        context = multiprocessing.get_context("spawn")
+        stop = context.Event()
+        total = context.Value("i", 0)
+        processes = [
+            context.Process(target=_process_main, args=(names, burst, interval, stop, total), daemon=True)
+            for _ in range(concurrency)
+        ]
+        for process in processes:
+            process.start()
+        self.stderr.write(f"Started {concurrency} worker processes.")
+        # SIGTERM and Ctrl-C both let every worker finish its current job.
+        previous_sigterm = signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        try:
+            for process in processes:
+                process.join()
+        except KeyboardInterrupt:
+            self.stderr.write("Stopping: waiting for the jobs in progress to finish (Ctrl-C again to abort).")
+            stop.set()
+            for process in processes:
+                process.join()
+        finally:
+            signal.signal(signal.SIGTERM, previous_sigterm)
+        return total.value
+
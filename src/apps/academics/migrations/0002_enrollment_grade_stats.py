@@ -0,0 +1,54 @@
+# Generated by Django 6.0.1 on 2026-10-17 12:40
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_grade_stats(apps, schema_editor):
+    Enrollment = apps.get_model("academics", "Enrollment")
+    Grade = apps.get_model("academics", "Grade")
+
+    grades = Grade.objects.filter(enrollment=OuterRef("pk")).order_by()
+    latest = grades.order_by("-created_at")
+    Enrollment.objects.update(
+        grade_count=Coalesce(
+            Subquery(grades.values("enrollment").annotate(c=Count("pk")).values("c")), 0
+        ),
+        grade_sum=Coalesce(
+            Subquery(grades.values("enrollment").annotate(s=Sum("numeric_value")).values("s")), 0
+        ),
+        last_grade_value=Subquery(latest.values("numeric_value")[:1]),
+        last_graded_at=Subquery(latest.values("created_at")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='enrollment',
+            name='grade_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='grade_sum',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='last_grade_value',
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='enrollment',
+            name='last_graded_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_grade_stats, migrations.RunPython.noop),
+    ]
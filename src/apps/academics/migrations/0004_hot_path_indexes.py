@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-17 12:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0003_name_id_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='enrollment',
+            name='course',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='academics.course'),
+        ),
+        migrations.AlterField(
+            model_name='grade',
+            name='enrollment',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='grades', to='academics.enrollment'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['course', 'student'], name='enrollment_course_student_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='grade',
+            index=models.Index(fields=['enrollment', 'created_at', 'numeric_value'], name='grade_enrollment_created_idx'),
+        ),
+    ]
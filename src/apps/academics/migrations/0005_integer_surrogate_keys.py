@@ -0,0 +1,144 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:10
+
+import django.core.validators
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+# Rows are copied into tables with integer keys; the old UUID primary keys
+# become the uuid column, and foreign keys are remapped through it.
+COPY_ROWS = [
+    """
+    INSERT INTO academics_studentnew (uuid, name, created_at, updated_at)
+    SELECT id, name, created_at, updated_at FROM academics_student
+    ORDER BY created_at, id
+    """,
+    """
+    INSERT INTO academics_coursenew (uuid, name, created_at, updated_at)
+    SELECT id, name, created_at, updated_at FROM academics_course
+    ORDER BY created_at, id
+    """,
+    """
+    INSERT INTO academics_enrollmentnew (
+        uuid, student_id, course_id, grade_count, grade_sum,
+        last_grade_value, last_graded_at, created_at, updated_at
+    )
+    SELECT e.id, s.id, c.id, e.grade_count, e.grade_sum,
+           e.last_grade_value, e.last_graded_at, e.created_at, e.updated_at
+    FROM academics_enrollment e
+    JOIN academics_studentnew s ON s.uuid = e.student_id
+    JOIN academics_coursenew c ON c.uuid = e.course_id
+    ORDER BY e.created_at, e.id
+    """,
+    """
+    INSERT INTO academics_gradenew (enrollment_id, numeric_value, created_at, updated_at)
+    SELECT en.id, g.numeric_value, g.created_at, g.updated_at
+    FROM academics_grade g
+    JOIN academics_enrollmentnew en ON en.uuid = g.enrollment_id
+    ORDER BY g.created_at, g.id
+    """,
+]
+
+
+class Migration(migrations.Migration):
+    """
+    Switch every model to an integer primary key, keeping the UUID as a
+    unique public identifier (Grade drops it). The tables are rebuilt:
+    new ones are created alongside, filled with INSERT ... SELECT, and
+    renamed into place once the old ones are dropped. Irreversible.
+    """
+
+    dependencies = [
+        ('academics', '0004_hot_path_indexes'),
+    ]
+
+    operations = [
+        # Free the index and constraint names for the new tables.
+        migrations.RemoveConstraint(
+            model_name='enrollment',
+            name='unique_student_course_enrollment',
+        ),
+        migrations.RemoveIndex(
+            model_name='enrollment',
+            name='enrollment_course_student_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='grade',
+            name='grade_enrollment_created_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='student_name_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='course',
+            name='course_name_id_idx',
+        ),
+        migrations.CreateModel(
+            name='StudentNew',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=255)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name', 'id'], name='student_name_id_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='CourseNew',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('name', models.CharField(max_length=255)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name', 'id'], name='course_name_id_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='EnrollmentNew',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('uuid', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('grade_count', models.PositiveIntegerField(default=0)),
+                ('grade_sum', models.PositiveBigIntegerField(default=0)),
+                ('last_grade_value', models.IntegerField(blank=True, null=True)),
+                ('last_graded_at', models.DateTimeField(blank=True, null=True)),
+                ('course', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='academics.coursenew')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='academics.studentnew')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['course', 'student'], name='enrollment_course_student_idx')],
+                'constraints': [models.UniqueConstraint(fields=('student', 'course'), name='unique_student_course_enrollment')],
+            },
+        ),
+        migrations.CreateModel(
+            name='GradeNew',
+            fields=[
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('numeric_value', models.IntegerField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(100)])),
+                ('enrollment', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='grades', to='academics.enrollmentnew')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['enrollment', 'created_at', 'numeric_value'], name='grade_enrollment_created_idx')],
+            },
+        ),
+        migrations.RunSQL(COPY_ROWS),
+        migrations.DeleteModel(name='Grade'),
+        migrations.DeleteModel(name='Enrollment'),
+        migrations.DeleteModel(name='Student'),
+        migrations.DeleteModel(name='Course'),
+        migrations.RenameModel(old_name='StudentNew', new_name='Student'),
+        migrations.RenameModel(old_name='CourseNew', new_name='Course'),
+        migrations.RenameModel(old_name='EnrollmentNew', new_name='Enrollment'),
+        migrations.RenameModel(old_name='GradeNew', new_name='Grade'),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0005_integer_surrogate_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GradeRollup',
+            fields=[
+                ('enrollment', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='grade_rollup', serialize=False, to='academics.enrollment')),
+                ('grade_count', models.PositiveIntegerField(default=0)),
+                ('grade_sum', models.PositiveBigIntegerField(default=0)),
+                ('min_grade_value', models.IntegerField(blank=True, null=True)),
+                ('max_grade_value', models.IntegerField(blank=True, null=True)),
+                ('last_grade_value', models.IntegerField(blank=True, null=True)),
+                ('last_graded_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_through', models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ArchivedGrade',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('numeric_value', models.IntegerField()),
+                ('created_at', models.DateTimeField()),
+                ('enrollment', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='archived_grades', to='academics.enrollment')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['enrollment', 'created_at', 'numeric_value'], name='archived_grade_enrollment_idx')],
+            },
+        ),
+    ]
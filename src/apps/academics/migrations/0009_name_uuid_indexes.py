@@ -0,0 +1,29 @@
+# Generated by Django 6.0.1 on 2026-10-17 13:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0008_job_queue'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='course',
+            name='course_name_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='student',
+            name='student_name_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['name', 'uuid'], name='course_name_uuid_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['name', 'uuid'], name='student_name_uuid_idx'),
+        ),
+    ]
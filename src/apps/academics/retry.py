@@ -0,0 +1,72 @@
+"""
+Retry of write services on transient SQLite lock errors.
+
+SQLite allows one writer at a time. A writer that cannot get the lock within
+busy_timeout fails with OperationalError("database is locked"); nothing was
+written, so the whole transaction can safely run again.
+
+Settings (all optional):
+
+    ACADEMICS_DB_RETRY = {
+        "ATTEMPTS": 5,        # total attempts, including the first
+        "BASE_DELAY": 0.05,   # seconds before the first retry, doubled after each one
+        "MAX_DELAY": 1.0,
+    }
+"""
+from __future__ import annotations
+
+import logging
+import random
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.db import OperationalError, connection
+
+logger = logging.getLogger(__name__)
+
+_LOCK_MESSAGES = ("database is locked", "database table is locked")
+
+
+def _config() -> dict:
+    return getattr(settings, "ACADEMICS_DB_RETRY", None) or {}
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    return isinstance(exc, OperationalError) and any(m in str(exc) for m in _LOCK_MESSAGES)
+
+
+def retry_on_db_lock(fn):
+    """
+    Re-run fn with exponential backoff (and jitter) when it fails on a lock error.
+
+    Rules:
+    - Must wrap the transaction (be applied above @transaction.atomic), so
+      each attempt is a fresh transaction.
+    - Inside an outer atomic block nothing is retried: the outer transaction
+      is already broken and only its owner can restart it.
+    - Any other error, and the last lock error, propagate unchanged.
+    """
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        config = _config()
+        attempts = max(1, config.get("ATTEMPTS", 5))
+        delay = config.get("BASE_DELAY", 0.05)
+        max_delay = config.get("MAX_DELAY", 1.0)
+
+        for attempt in range(1, attempts + 1):
+            try:
+                return fn(*args, **kwargs)
+            except OperationalError as exc:
+                if attempt == attempts or connection.in_atomic_block or not is_lock_error(exc):
+                    raise
+                sleep_for = min(max_delay, delay) * random.uniform(0.5, 1.0)
+                logger.info(
+                    "%s.%s hit a lock error (attempt %d/%d), retrying in %.3fs",
+                    fn.__module__, fn.__name__, attempt, attempts, sleep_for,
+                )
+                time.sleep(sleep_for)
+                delay *= 2
+
+    return wrapper
@@ -0,0 +1,70 @@
+"""
+Read/write routing between the primary database and a read replica.
+
+Writes, and reads by default, go to the primary ("default"). Read services
+that accept a ``consistency`` argument run with EVENTUAL consistency unless
+told otherwise, which sends their queries to the replica alias named by
+ACADEMICS_READ_REPLICA. Pass consistency=STRONG on read-your-writes paths,
+e.g. a page rendered right after the write it must show.
+
+Reads inside a transaction on the primary always stay on the primary, and
+everything stays on the primary when no replica is configured.
+
+Settings:
+
+    DATABASE_ROUTERS = ["apps.academics.routers.ReplicaRouter"]
+    ACADEMICS_READ_REPLICA = "replica"   # default None: no replica
+"""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+STRONG = "strong"
+EVENTUAL = "eventual"
+CONSISTENCY_LEVELS = (STRONG, EVENTUAL)
+
+_consistency: ContextVar[str] = ContextVar("academics_read_consistency", default=STRONG)
+
+
+@contextmanager
+def read_consistency(consistency: str):
+    """
+    Route the ORM reads made inside the block according to consistency.
+    """
+    if consistency not in CONSISTENCY_LEVELS:
+        raise ValueError(f"consistency must be one of {CONSISTENCY_LEVELS}, not {consistency!r}.")
+    token = _consistency.set(consistency)
+    try:
+        yield
+    finally:
+        _consistency.reset(token)
+
+
+def replica_alias() -> str | None:
+    return getattr(settings, "ACADEMICS_READ_REPLICA", None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replica = replica_alias()
+        if (
+            replica
+            and _consistency.get() == EVENTUAL
+            and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return replica
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica is a copy of the primary: objects from either may be related.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != replica_alias()
@@ -0,0 +1,36 @@
+"""
+Service layer of the academics app.
+
+Submodules are imported on first use (``services.grades`` works without an
+explicit import), so a process only pays for the services it calls. Keep
+this file free of eager imports: management commands and workers import it
+on every start.
+"""
+from importlib import import_module
+
+__all__ = [
+    "analytics",
+    "archival",
+    "caching",
+    "catalog",
+    "enrollments",
+    "freshness",
+    "grade_stats",
+    "grades",
+    "jobs",
+    "outbox",
+    "pagination",
+    "queries",
+    "registration",
+    "report_cards",
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from django.db.models import Count, ExpressionWrapper, F, IntegerField, Q, Window
+from django.db.models.functions import CumeDist, DenseRank
+
+from apps.academics.domain.exceptions import NoGradesRecordedError, StudentNotEnrolledError
+from apps.academics.domain.grade_scale import get_grade_scale
+from apps.academics.domain.models import Enrollment
+from apps.academics.instrumentation import instrumented
+from apps.academics.services.caching import acached_for_course, cached_for_course
+from apps.academics.services.grades import _round_half_up
+
+# Courses with at least this many graded students are summarized with NumPy.
+NUMPY_THRESHOLD = 1000
+
+
+@dataclass(frozen=True)
+class CourseStatistics:
+    """
+    Distribution of student averages in a course.
+
+    Statistics are computed over graded students only (students without
+    grades have no average); they are None when nobody is graded yet.
+    Percentiles use linear interpolation and stddev is the population one.
+    """
+    course_id: object
+    enrollment_count: int
+    graded_count: int
+    mean: float | None
+    median: float | None
+    p10: float | None
+    p90: float | None
+    stddev: float | None
+    letter_histogram: dict[str, int]
+
+
+@dataclass(frozen=True)
+class RankedStudent:
+    """
+    A graded student's position in a course.
+
+    rank is a dense rank of the averages (1 = highest; equal averages share
+    a rank and the next rank follows without gaps). percentile is the share
+    of graded students whose average is at or below this one, in percent.
+    """
+    student_id: object
+    student_name: str
+    numeric_average: int
+    rank: int
+    percentile: float
+
+
+@instrumented
+def course_statistics(*, course_id) -> CourseStatistics:
+    """
+    Summarize the per-student averages of a course.
+
+    Rules:
+    - Each student's average is the same half-up value returned by
+      calculate_numeric_average for that student and course.
+    - Averages come from the stored enrollment aggregates in a single query;
+      grade history is not scanned.
+    - letter_histogram counts graded students per letter of the scale.
+    """
+    rows = list(_aggregates_query(course_id))
+    return _course_statistics_from(course_id, rows)
+
+
+@instrumented
+async def acourse_statistics(*, course_id) -> CourseStatistics:
+    """
+    Async course_statistics, on Django's async ORM.
+    """
+    rows = [row async for row in _aggregates_query(course_id)]
+    return _course_statistics_from(course_id, rows)
+
+
+def _aggregates_query(course_id):
+    return Enrollment.objects.filter(course__uuid=course_id).values_list("grade_count", "grade_sum").order_by()
+
+
+def _course_statistics_from(course_id, rows: list[tuple[int, int]]) -> CourseStatistics:
+    graded = [(count, total) for count, total in rows if count]
+
+    if len(graded) >= NUMPY_THRESHOLD:
+        summary = _summarize_numpy(graded)
+    else:
+        summary = _summarize_python(graded)
+
+    return CourseStatistics(
+        course_id=course_id,
+        enrollment_count=len(rows),
+        graded_count=len(graded),
+        **summary,
+    )
+
+
+def _letter_histogram(counts_by_value) -> dict[str, int]:
+    scale = get_grade_scale()
+    histogram = {r.letter.strip().upper(): 0 for r in scale.ranges}
+    for value, letter in enumerate(scale.letters_by_value):
+        histogram[letter] += int(counts_by_value[value])
+    return histogram
+
+
+def _empty_summary() -> dict:
+    return {
+        "mean": None,
+        "median": None,
+        "p10": None,
+        "p90": None,
+        "stddev": None,
+        "letter_histogram": _letter_histogram([0] * 101),
+    }
+
+
+def _percentile(sorted_values: list[int], q: float) -> float:
+    """
+    Linear-interpolation percentile (NumPy's default method).
+    """
+    position = (len(sorted_values) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def _summarize_python(graded: list[tuple[int, int]]) -> dict:
+    if not graded:
+        return _empty_summary()
+
+    averages = sorted(_round_half_up(total / count) for count, total in graded)
+    n = len(averages)
+    mean = sum(averages) / n
+    counts_by_value = [0] * 101
+    for avg in averages:
+        counts_by_value[avg] += 1
+
+    return {
+        "mean": mean,
+        "median": _percentile(averages, 50),
+        "p10": _percentile(averages, 10),
+        "p90": _percentile(averages, 90),
+        "stddev": math.sqrt(sum((avg - mean) ** 2 for avg in averages) / n),
+        "letter_histogram": _letter_histogram(counts_by_value),
+    }
+
+
+def _summarize_numpy(graded: list[tuple[int, int]]) -> dict:
+    import numpy as np
+
+    counts, totals = np.array(graded, dtype=np.int64).T
+    # Exact integer form of _round_half_up(total / count) for non-negative values.
+    averages = (2 * totals + counts) // (2 * counts)
+    p10, median, p90 = np.percentile(averages, [10, 50, 90])
+
+    return {
+        "mean": float(averages.mean()),
+        "median": float(median),
+        "p10": float(p10),
+        "p90": float(p90),
+        "stddev": float(averages.std()),
+        "letter_histogram": _letter_histogram(np.bincount(averages, minlength=101)),
+    }
+
+
+def _average_expression():
+    """
+    The enrollment's half-up average as exact integer SQL (see _summarize_numpy).
+    """
+    return ExpressionWrapper(
+        (2 * F("grade_sum") + F("grade_count")) / (2 * F("grade_count")),
+        output_field=IntegerField(),
+    )
+
+
+@instrumented
+def course_ranking(*, course_id, limit: int | None = None, bottom: bool = False) -> list[RankedStudent]:
+    """
+    Rank the graded students of a course by their average.
+
+    Rules:
+    - Averages are the half-up values of calculate_numeric_average; students
+      without grades are not ranked.
+    - Ranks and percentiles are computed over the whole course in a single
+      query with window functions; limit only trims the returned rows.
+    - Ordered best first, ties by name; bottom=True returns the lowest
+      ranks first instead, so limit gives top-N or bottom-N lists.
+    - Served from the per-course read-through cache when it is enabled.
+    """
+    return cached_for_course(
+        "course_ranking",
+        course_id=course_id,
+        parts=(limit, bottom),
+        build=lambda: [_ranked_student(row) for row in _ranking_query(course_id, limit=limit, bottom=bottom)],
+    )
+
+
+@instrumented
+async def acourse_ranking(*, course_id, limit: int | None = None, bottom: bool = False) -> list[RankedStudent]:
+    async def build():
+        return [_ranked_student(row) async for row in _ranking_query(course_id, limit=limit, bottom=bottom)]
+
+    return await acached_for_course("course_ranking", course_id=course_id, parts=(limit, bottom), build=build)
+
+
+def _ranking_query(course_id, *, limit: int | None, bottom: bool):
+    rows = (
+        Enrollment.objects.filter(course__uuid=course_id, grade_count__gt=0)
+        .annotate(average=_average_expression())
+        .annotate(
+            rank=Window(DenseRank(), order_by=F("average").desc()),
+            cume_dist=Window(CumeDist(), order_by=F("average").asc()),
+        )
+        .order_by("-rank" if bottom else "rank", "student__name", "student_id")
+        .values_list("student__uuid", "student__name", "average", "rank", "cume_dist")
+    )
+    return rows if limit is None else rows[:limit]
+
+
+def _ranked_student(row) -> RankedStudent:
+    student_id, name, average, rank, cume_dist = row
+    return RankedStudent(
+        student_id=student_id,
+        student_name=name,
+        numeric_average=average,
+        rank=rank,
+        percentile=100 * cume_dist,
+    )
+
+
+@instrumented
+def student_rank(*, course_id, student_id) -> RankedStudent:
+    """
+    One student's entry of course_ranking, without ranking the whole course.
+
+    Rules:
+    - Same rank, percentile and average as the student's course_ranking row.
+    - Two queries: the student's enrollment, then one aggregate counting the
+      classmates above and at-or-below their average (no sort, no window).
+    - Raises StudentNotEnrolledError / NoGradesRecordedError like
+      calculate_numeric_average.
+    """
+    return cached_for_course(
+        "student_rank",
+        course_id=course_id,
+        parts=(student_id,),
+        build=lambda: _compute_student_rank(course_id=course_id, student_id=student_id),
+    )
+
+
+def _compute_student_rank(*, course_id, student_id) -> RankedStudent:
+    mine = (
+        Enrollment.objects.filter(course__uuid=course_id, student__uuid=student_id)
+        .values_list("student__uuid", "student__name", "grade_count", "grade_sum")
+        .first()
+    )
+    if mine is None:
+        raise StudentNotEnrolledError(student_id=student_id, course_id=course_id)
+    uuid, name, count, total = mine
+    if not count:
+        raise NoGradesRecordedError(student_id=student_id, course_id=course_id)
+    average = _round_half_up(total / count)
+
+    stats = (
+        Enrollment.objects.filter(course__uuid=course_id, grade_count__gt=0)
+        .annotate(average=_average_expression())
+        .aggregate(
+            higher=Count("average", distinct=True, filter=Q(average__gt=average)),
+            at_or_below=Count("pk", filter=Q(average__lte=average)),
+            graded=Count("pk"),
+        )
+    )
+    return RankedStudent(
+        student_id=uuid,
+        student_name=name,
+        numeric_average=average,
+        rank=stats["higher"] + 1,
+        percentile=100 * (stats["at_or_below"] / stats["graded"]),
+    )
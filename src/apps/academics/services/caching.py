@@ -0,0 +1,213 @@
+"""
+Read-through cache for per-student reads (report cards and averages) and
+course-wide reads (rankings).
+
+Entries live in a Django cache (ACADEMICS_CACHE["ALIAS"]) under keys that
+embed two version numbers:
+
+- a per-student (or per-course) version, bumped by every write that changes
+  what the student's (course's) reads return (grades, enrollments);
+- a global generation, bumped by maintenance that may touch any student
+  (a full rebuild of the grade aggregates).
+
+Bumping a version makes the old entries unreachable; they are never
+deleted and age out through the cache's own TIMEOUT/MAX_ENTRIES eviction.
+Writers bump immediately and again when the transaction commits, so a
+reader that built a value from pre-commit data between the two bumps
+cannot keep serving it.
+
+Settings (all optional):
+
+    ACADEMICS_CACHE = {
+        "ENABLED": True,   # default False: every read goes to the database
+        "ALIAS": "default",
+        "TIMEOUT": 300,    # seconds an entry may live
+    }
+"""
+from __future__ import annotations
+
+import time
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from apps.academics.domain.models import Course, Student
+from apps.academics.instrumentation import registry
+
+T = TypeVar("T")
+
+_GENERATION_KEY = "academics:generation"
+_MISSING = object()
+
+
+def _config() -> dict:
+    return getattr(settings, "ACADEMICS_CACHE", None) or {}
+
+
+def _cache():
+    return caches[_config().get("ALIAS", "default")]
+
+
+def _public_key(model, public_id) -> str:
+    return str(model._meta.get_field("uuid").to_python(public_id))
+
+
+def _version_key(scope: str, key: str) -> str:
+    return f"academics:{scope}:{key}:version"
+
+
+def _current_version(cache, key: str, found: dict) -> int:
+    version = found.get(key)
+    if version is None:
+        # Start from the clock, not from 1: if a version key is evicted, the
+        # new one must not reach numbers that stale entries were stored under.
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+async def _acurrent_version(cache, key: str, found: dict) -> int:
+    version = found.get(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), timeout=None)
+        version = await cache.aget(key)
+    return version
+
+
+def _entry_key(kind: str, student_key: str, parts: tuple, generation: int, version: int) -> str:
+    return ":".join(["academics", kind, student_key, *map(str, parts), str(generation), str(version)])
+
+
+def cached_for_student(kind: str, *, student_id, parts: tuple = (), build: Callable[[], T]) -> T:
+    """
+    Return build() through the cache, keyed by student, kind and parts.
+
+    Rules:
+    - Hits and misses are counted per kind in the metrics registry.
+    - Exceptions raised by build() are not cached.
+    - Ids that are not valid UUIDs bypass the cache, so build()
+      reports them exactly as it does uncached.
+    """
+    return _cached(kind, "student", Student, student_id, parts, build)
+
+
+def cached_for_course(kind: str, *, course_id, parts: tuple = (), build: Callable[[], T]) -> T:
+    """
+    cached_for_student for reads over a whole course, versioned per course.
+    """
+    return _cached(kind, "course", Course, course_id, parts, build)
+
+
+async def acached_for_student(
+    kind: str, *, student_id, parts: tuple = (), build: Callable[[], Awaitable[T]]
+) -> T:
+    """
+    Async cached_for_student: same keys and rules, awaiting build().
+    """
+    return await _acached(kind, "student", Student, student_id, parts, build)
+
+
+async def acached_for_course(
+    kind: str, *, course_id, parts: tuple = (), build: Callable[[], Awaitable[T]]
+) -> T:
+    return await _acached(kind, "course", Course, course_id, parts, build)
+
+
+def _cached(kind: str, scope: str, model, public_id, parts: tuple, build: Callable[[], T]) -> T:
+    if not _config().get("ENABLED"):
+        return build()
+    try:
+        public_key = _public_key(model, public_id)
+    except ValidationError:
+        return build()
+
+    cache = _cache()
+    version_key = _version_key(scope, public_key)
+    found = cache.get_many([_GENERATION_KEY, version_key])
+    generation = _current_version(cache, _GENERATION_KEY, found)
+    version = _current_version(cache, version_key, found)
+    key = _entry_key(kind, public_key, parts, generation, version)
+
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        registry.count_cache(kind, hit=True)
+        return value
+
+    registry.count_cache(kind, hit=False)
+    value = build()
+    cache.set(key, value, timeout=_config().get("TIMEOUT", 300))
+    return value
+
+
+async def _acached(kind: str, scope: str, model, public_id, parts: tuple, build: Callable[[], Awaitable[T]]) -> T:
+    if not _config().get("ENABLED"):
+        return await build()
+    try:
+        public_key = _public_key(model, public_id)
+    except ValidationError:
+        return await build()
+
+    cache = _cache()
+    version_key = _version_key(scope, public_key)
+    found = await cache.aget_many([_GENERATION_KEY, version_key])
+    generation = await _acurrent_version(cache, _GENERATION_KEY, found)
+    version = await _acurrent_version(cache, version_key, found)
+    key = _entry_key(kind, public_key, parts, generation, version)
+
+    value = await cache.aget(key, _MISSING)
+    if value is not _MISSING:
+        registry.count_cache(kind, hit=True)
+        return value
+
+    registry.count_cache(kind, hit=False)
+    value = await build()
+    await cache.aset(key, value, timeout=_config().get("TIMEOUT", 300))
+    return value
+
+
+def _bump(keys: list[str]) -> None:
+    cache = _cache()
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            # No version yet: nothing was cached under this key.
+            pass
+
+
+def _bump_now_and_on_commit(keys: list[str]) -> None:
+    _bump(keys)
+    transaction.on_commit(lambda: _bump(keys))
+
+
+def invalidate_students(student_ids: Iterable) -> None:
+    """
+    Make every cached read of these students stale.
+    """
+    _invalidate("student", Student, student_ids)
+
+
+def invalidate_courses(course_ids: Iterable) -> None:
+    """
+    Make every cached course-wide read (e.g. rankings) of these courses stale.
+    """
+    _invalidate("course", Course, course_ids)
+
+
+def _invalidate(scope: str, model, public_ids: Iterable) -> None:
+    if not _config().get("ENABLED"):
+        return
+    keys = sorted({_version_key(scope, _public_key(model, public_id)) for public_id in public_ids})
+    if keys:
+        _bump_now_and_on_commit(keys)
+
+
+def invalidate_all() -> None:
+    """
+    Make every cached read stale, without flushing the cache.
+    """
+    if _config().get("ENABLED"):
+        _bump_now_and_on_commit([_GENERATION_KEY])
@@ -3,6 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from apps.academics.domain.models import Student, Course
+from apps.academics.instrumentation import instrumented
+from apps.academics.routers import EVENTUAL, read_consistency
+from apps.academics.services.pagination import Page, paginate_by_name
 
 
 @dataclass(frozen=True)
@@ -17,21 +20,79 @@ class CourseSummary:
     name: str
 
 
-def list_students() -> list[StudentSummary]:
+@instrumented
+def list_students(*, consistency: str = EVENTUAL) -> list[StudentSummary]:
     """
-    List students (id + name) to make manual exploration easier.
+    List students (public uuid + name) to make manual exploration easier.
+
+    Reads from the replica unless consistency is STRONG (see apps.academics.routers).
+    """
+    with read_consistency(consistency):
+        return [
+            StudentSummary(id=s.uuid, name=s.name)
+            for s in Student.objects.order_by("name", "uuid").only("id", "uuid", "name")
+        ]
+
+
+@instrumented
+def list_courses(*, consistency: str = EVENTUAL) -> list[CourseSummary]:
+    """
+    List courses (public uuid + name) to make manual exploration easier.
+
+    Reads from the replica unless consistency is STRONG (see apps.academics.routers).
+    """
+    with read_consistency(consistency):
+        return [
+            CourseSummary(id=c.uuid, name=c.name)
+            for c in Course.objects.order_by("name", "uuid").only("id", "uuid", "name")
+        ]
+
+
+@instrumented
+def list_students_page(
+    *, page_size: int, cursor: str | None = None, consistency: str = EVENTUAL
+) -> Page[StudentSummary]:
     """
-    return [
-        StudentSummary(id=s.id, name=s.name)
-        for s in Student.objects.order_by("name")
-    ]
+    One page of students ordered by name; pass next_cursor back to get the next page.
+    """
+    with read_consistency(consistency):
+        return paginate_by_name(
+            Student.objects.only("id", "uuid", "name"),
+            page_size=page_size,
+            cursor=cursor,
+            to_item=lambda s: StudentSummary(id=s.uuid, name=s.name),
+        )
 
 
-def list_courses() -> list[CourseSummary]:
+@instrumented
+def list_courses_page(
+    *, page_size: int, cursor: str | None = None, consistency: str = EVENTUAL
+) -> Page[CourseSummary]:
     """
-    List courses (id + name) to make manual exploration easier.
+    One page of courses ordered by name; pass next_cursor back to get the next page.
     """
-    return [
-        CourseSummary(id=c.id, name=c.name)
-        for c in Course.objects.order_by("name")
-    ]
+    with read_consistency(consistency):
+        return paginate_by_name(
+            Course.objects.only("id", "uuid", "name"),
+            page_size=page_size,
+            cursor=cursor,
+            to_item=lambda c: CourseSummary(id=c.uuid, name=c.name),
+        )
+
+
+@instrumented
+async def alist_students(*, consistency: str = EVENTUAL) -> list[StudentSummary]:
+    with read_consistency(consistency):
+        return [
+            StudentSummary(id=s.uuid, name=s.name)
+            async for s in Student.objects.order_by("name", "uuid").only("id", "uuid", "name")
+        ]
+
+
+@instrumented
+async def alist_courses(*, consistency: str = EVENTUAL) -> list[CourseSummary]:
+    with read_consistency(consistency):
+        return [
+            CourseSummary(id=c.uuid, name=c.name)
+            async for c in Course.objects.order_by("name", "uuid").only("id", "uuid", "name")
+        ]
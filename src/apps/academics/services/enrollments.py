@@ -1,12 +1,50 @@
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
 from django.db import IntegrityError, transaction
+from django.db.models import Subquery
 
-from apps.academics.domain.exceptions import DuplicateEnrollmentError
-from apps.academics.domain.models import Enrollment
+from apps.academics.domain.exceptions import (
+    DomainError,
+    DuplicateEnrollmentError,
+    UnknownCourseError,
+    UnknownStudentError,
+)
+from apps.academics.domain.models import Course, Enrollment, Student
 from apps.academics.domain.types import UUID
+from apps.academics.instrumentation import instrumented
+from apps.academics.retry import retry_on_db_lock
+from apps.academics.services.caching import invalidate_students
+from apps.academics.services.outbox import ENROLLMENT_CREATED, enrollment_created, publish
 
+# Pairs inserted per INSERT statement by enroll_students.
+BULK_ENROLLMENT_BATCH_SIZE = 2000
 
 
-@transaction.atomic
+@dataclass(frozen=True)
+class EnrollmentPairError:
+    """
+    A pair rejected by enroll_students, with the domain error enroll_student would raise.
+    """
+    student_id: UUID
+    course_id: UUID
+    error: DomainError
+
+
+@dataclass(frozen=True)
+class BulkEnrollmentResult:
+    enrolled: list[tuple[UUID, UUID]]
+    duplicates: list[tuple[UUID, UUID]]
+    # Pairs naming a student or course that does not exist.
+    unknown: list[EnrollmentPairError] = field(default_factory=list)
+
+
+@instrumented
+@retry_on_db_lock
 def enroll_student(*, student_id: UUID, course_id: UUID) -> Enrollment:
     """
     Enroll a student into a course.
@@ -14,14 +52,137 @@ def enroll_student(*, student_id: UUID, course_id: UUID) -> Enrollment:
     Rules:
     - A student cannot be enrolled in the same course more than once.
     - Duplicate enrollment attempts raise an explicit domain error.
+    - An unknown student raises UnknownStudentError, an unknown course
+      UnknownCourseError (the student is checked first).
+    - The student's cached report card is invalidated.
+    - An enrollment.created event is appended to the outbox in the same transaction.
+
+    The unique_student_course_enrollment constraint is the arbiter: the
+    INSERT is attempted directly, so concurrent requests cannot both pass
+    a pre-check, and a conflict is translated into the domain error. The
+    INSERT resolves the public ids itself (an unknown one leaves a NULL
+    foreign key, which fails the same way); the student and course are
+    only looked up on that failure path.
     """
-    if Enrollment.objects.filter(
-        student_id=student_id,
-        course_id=course_id,
-    ).exists():
-        raise DuplicateEnrollmentError(student_id=student_id, course_id=course_id)
+    try:
+        with transaction.atomic():
+            enrollment = Enrollment.objects.create(
+                student_id=Subquery(Student.objects.filter(uuid=student_id).values("pk")),
+                course_id=Subquery(Course.objects.filter(uuid=course_id).values("pk")),
+            )
+            publish(ENROLLMENT_CREATED, [
+                enrollment_created(enrollment_id=enrollment.uuid, student_id=student_id, course_id=course_id)
+            ])
+    except IntegrityError:
+        if not Student.objects.filter(uuid=student_id).exists():
+            raise UnknownStudentError(student_id=student_id)
+        if not Course.objects.filter(uuid=course_id).exists():
+            raise UnknownCourseError(course_id=course_id)
+        if Enrollment.objects.filter(student__uuid=student_id, course__uuid=course_id).exists():
+            raise DuplicateEnrollmentError(student_id=student_id, course_id=course_id)
+        raise
+    # The foreign keys still hold the subqueries; leave them deferred so
+    # they are loaded from the row on first access.
+    for attname in ("student_id", "course_id"):
+        del enrollment.__dict__[attname]
+    invalidate_students([student_id])
+    return enrollment
+
+
+@instrumented
+def enroll_students(pairs: Iterable[tuple[UUID, UUID]]) -> BulkEnrollmentResult:
+    """
+    Enroll many (student_id, course_id) pairs at once.
+
+    Rules:
+    - Pairs that are already enrolled (or repeated in the input) are reported
+      as duplicates instead of raising DuplicateEnrollmentError.
+    - Pairs naming an unknown student or course are reported as unknown,
+      with the UnknownStudentError / UnknownCourseError enroll_student raises.
+    - Each batch of BULK_ENROLLMENT_BATCH_SIZE pairs resolves its public ids
+      with one SELECT per model, then is one INSERT that ignores constraint
+      conflicts, followed by one SELECT of the generated uuids to tell which
+      rows were actually inserted.
+    - Each inserted pair appends an enrollment.created event to the outbox,
+      in its batch's transaction.
+    """
+    enrolled: list[tuple[UUID, UUID]] = []
+    duplicates: list[tuple[UUID, UUID]] = []
+    unknown: list[EnrollmentPairError] = []
+
+    seen: set[tuple[UUID, UUID]] = set()
+    unique_pairs: list[tuple[UUID, UUID]] = []
+    for student_id, course_id in pairs:
+        key = (_to_uuid(student_id), _to_uuid(course_id))
+        if key in seen:
+            duplicates.append(key)
+            continue
+        seen.add(key)
+        unique_pairs.append(key)
+
+    for start in range(0, len(unique_pairs), BULK_ENROLLMENT_BATCH_SIZE):
+        pairs_batch = unique_pairs[start:start + BULK_ENROLLMENT_BATCH_SIZE]
+        student_pks = _pks_by_uuid(Student, {student_id for student_id, _ in pairs_batch})
+        course_pks = _pks_by_uuid(Course, {course_id for _, course_id in pairs_batch})
+
+        batch: dict[tuple[UUID, UUID], Enrollment] = {}
+        for pair in pairs_batch:
+            student_id, course_id = pair
+            if student_id not in student_pks:
+                unknown.append(EnrollmentPairError(student_id, course_id, UnknownStudentError(student_id=student_id)))
+                continue
+            if course_id not in course_pks:
+                unknown.append(EnrollmentPairError(student_id, course_id, UnknownCourseError(course_id=course_id)))
+                continue
+            batch[pair] = Enrollment(
+                uuid=uuid.uuid4(), student_id=student_pks[student_id], course_id=course_pks[course_id]
+            )
+        if not batch:
+            continue
+
+        inserted = _insert_enrollments(batch)
+        for pair, e in batch.items():
+            (enrolled if e.uuid in inserted else duplicates).append(pair)
+
+    invalidate_students({student_id for student_id, _ in enrolled})
+    return BulkEnrollmentResult(enrolled=enrolled, duplicates=duplicates, unknown=unknown)
+
+
+def _pks_by_uuid(model, uuids: set[UUID]) -> dict[UUID, int]:
+    return dict(model.objects.filter(uuid__in=uuids).values_list("uuid", "pk"))
+
+
+@retry_on_db_lock
+@transaction.atomic
+def _insert_enrollments(batch: dict[tuple[UUID, UUID], Enrollment]) -> set[UUID]:
+    """
+    Insert a batch ignoring conflicts; return the uuids that were actually inserted.
+    """
+    Enrollment.objects.bulk_create(batch.values(), ignore_conflicts=True)
+    inserted = set(
+        Enrollment.objects.filter(uuid__in=[e.uuid for e in batch.values()]).values_list("uuid", flat=True)
+    )
+    publish(ENROLLMENT_CREATED, (
+        enrollment_created(enrollment_id=e.uuid, student_id=student_id, course_id=course_id)
+        for (student_id, course_id), e in batch.items()
+        if e.uuid in inserted
+    ))
+    return inserted
+
+
+@instrumented
+async def aenroll_student(*, student_id: UUID, course_id: UUID) -> Enrollment:
+    """
+    Async enroll_student. Runs the sync service in Django's sync thread,
+    which owns the transaction handling the duplicate check relies on.
+    """
+    return await sync_to_async(enroll_student)(student_id=student_id, course_id=course_id)
+
+
+@instrumented
+async def aenroll_students(pairs: Iterable[tuple[UUID, UUID]]) -> BulkEnrollmentResult:
+    return await sync_to_async(enroll_students)(list(pairs))
+
 
-    return Enrollment.objects.create(
-        student_id=student_id,
-        course_id=course_id,
-    )
\ No newline at end of file
+def _to_uuid(value) -> UUID:
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
@@ -0,0 +1,61 @@
+"""
+Validators (ETags) for the read API, computed without building the response.
+
+Each ETag changes whenever the data behind the matching read can change:
+a grade recorded (grade count, and Enrollment.last_graded_at, the newest
+Grade.created_at of each enrollment), grades archived (rollup count), an
+enrollment added or removed (newest created_at and count), or, for letters,
+the loaded grade scale.
+"""
+from __future__ import annotations
+
+from django.db.models import Count, Max, Sum
+
+from apps.academics.domain.grade_scale import get_grade_scale
+from apps.academics.domain.models import Enrollment
+from apps.academics.routers import EVENTUAL, STRONG, read_consistency
+
+
+def _stamp(value) -> str:
+    return "0" if value is None else str(int(value.timestamp() * 1_000_000))
+
+
+def _enrollments_etag(enrollments, *, graded: bool, consistency: str) -> str:
+    aggregates = {"count": Count("pk"), "enrolled_at": Max("created_at")}
+    if graded:
+        aggregates["graded_at"] = Max("last_graded_at")
+        aggregates["grades"] = Sum("grade_count")
+        # Archiving moves grades out of the default (live) history.
+        aggregates["archived"] = Sum("grade_rollup__grade_count")
+    with read_consistency(consistency):
+        stats = enrollments.order_by().aggregate(**aggregates)
+    parts = [str(stats["count"]), _stamp(stats["enrolled_at"])]
+    if graded:
+        parts += [
+            str(stats["grades"] or 0),
+            str(stats["archived"] or 0),
+            _stamp(stats["graded_at"]),
+            get_grade_scale().fingerprint,
+        ]
+    return "-".join(parts)
+
+
+def report_card_etag(*, student_id) -> str:
+    """
+    ETag of build_report_card for a student (read from the primary, like the card).
+    """
+    return _enrollments_etag(Enrollment.objects.filter(student__uuid=student_id), graded=True, consistency=STRONG)
+
+
+def course_roster_etag(*, course_id, consistency: str = EVENTUAL) -> str:
+    """
+    ETag of the students enrolled in a course (any page).
+    """
+    return _enrollments_etag(Enrollment.objects.filter(course__uuid=course_id), graded=False, consistency=consistency)
+
+
+def student_courses_etag(*, student_id, consistency: str = EVENTUAL) -> str:
+    """
+    ETag of the courses a student is enrolled in (any page).
+    """
+    return _enrollments_etag(Enrollment.objects.filter(student__uuid=student_id), graded=False, consistency=consistency)
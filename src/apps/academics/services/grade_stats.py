@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator
+
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+from apps.academics.domain.models import Enrollment, Grade, GradeRollup
+from apps.academics.instrumentation import instrumented
+from apps.academics.retry import retry_on_db_lock
+from apps.academics.services.caching import invalidate_all, invalidate_courses, invalidate_students
+
+
+@dataclass(frozen=True)
+class GradeStatsMismatch:
+    """
+    An enrollment whose stored grade aggregate differs from its Grade rows.
+    """
+    enrollment_id: object
+    stored: tuple[int, int, int | None, datetime | None]
+    actual: tuple[int, int, int | None, datetime | None]
+
+
+def _actual_stats_expressions() -> dict:
+    """
+    Correlated subqueries computing an enrollment's aggregate from raw Grade
+    rows plus the GradeRollup of its archived grades (which are all older).
+    """
+    grades = Grade.objects.filter(enrollment=OuterRef("pk")).order_by()
+    latest = grades.order_by("-created_at")
+    rollup = GradeRollup.objects.filter(enrollment=OuterRef("pk"))
+    return {
+        "grade_count": Coalesce(
+            Subquery(grades.values("enrollment").annotate(c=Count("pk")).values("c")), 0
+        ) + Coalesce(Subquery(rollup.values("grade_count")), 0),
+        "grade_sum": Coalesce(
+            Subquery(grades.values("enrollment").annotate(s=Sum("numeric_value")).values("s")), 0
+        ) + Coalesce(Subquery(rollup.values("grade_sum")), 0),
+        "last_grade_value": Coalesce(
+            Subquery(latest.values("numeric_value")[:1]), Subquery(rollup.values("last_grade_value"))
+        ),
+        "last_graded_at": Coalesce(
+            Subquery(latest.values("created_at")[:1]), Subquery(rollup.values("last_graded_at"))
+        ),
+    }
+
+
+@instrumented
+@retry_on_db_lock
+@transaction.atomic
+def rebuild_grade_stats(*, enrollment_ids: Iterable | None = None) -> int:
+    """
+    Recompute stored grade aggregates from raw Grade rows and archive rollups.
+
+    Rules:
+    - Runs as a single set-based UPDATE.
+    - Restricted to the given enrollments when enrollment_ids is provided.
+    - Returns the number of enrollments updated.
+    - Cached reads of the affected students and courses (all of them, for
+      a full rebuild) are invalidated.
+    """
+    qs = Enrollment.objects.all()
+    if enrollment_ids is None:
+        invalidate_all()
+    else:
+        qs = qs.filter(pk__in=list(enrollment_ids))
+        invalidate_students(qs.values_list("student__uuid", flat=True))
+        invalidate_courses(qs.values_list("course__uuid", flat=True))
+    return qs.update(**_actual_stats_expressions())
+
+
+def find_grade_stats_mismatches() -> Iterator[GradeStatsMismatch]:
+    """
+    Yield every enrollment whose stored aggregate is out of sync with its grades.
+    """
+    fields = ("grade_count", "grade_sum", "last_grade_value", "last_graded_at")
+    actual = {f"actual_{name}": expr for name, expr in _actual_stats_expressions().items()}
+    rows = (
+        Enrollment.objects.annotate(**actual)
+        .order_by("pk")
+        .values_list("uuid", *fields, *actual.keys())
+        .iterator(chunk_size=2000)
+    )
+    for row in rows:
+        stored, computed = tuple(row[1:5]), tuple(row[5:9])
+        if stored != computed:
+            yield GradeStatsMismatch(enrollment_id=row[0], stored=stored, actual=computed)
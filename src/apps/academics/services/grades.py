@@ -1,15 +1,53 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterable
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import F
 
 from apps.academics.domain.exceptions import (
+    DomainError,
     InvalidGradeInputError,
     InvalidLetterGradeError,
     NoGradesRecordedError,
     StudentNotEnrolledError,
 )
 from apps.academics.domain.grade_scale import letter_to_numeric_max, numeric_to_letter
-from apps.academics.domain.models import Enrollment, Grade
+from apps.academics.domain.models import ArchivedGrade, Course, Enrollment, Grade, Student
+from apps.academics.instrumentation import instrumented
+from apps.academics.retry import retry_on_db_lock
+from apps.academics.services.caching import (
+    acached_for_student,
+    cached_for_student,
+    invalidate_courses,
+    invalidate_students,
+)
+from apps.academics.services.grade_stats import rebuild_grade_stats
+from apps.academics.services.outbox import GRADE_RECORDED, grade_recorded, publish
+
+# Rows resolved, validated and inserted together by record_grades_bulk.
+BULK_GRADE_CHUNK_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class GradeRowError:
+    """
+    A row rejected by record_grades_bulk, with the domain error record_grade would raise.
+    """
+    row_number: int
+    student_id: object
+    course_id: object
+    error: DomainError
+
+
+@dataclass(frozen=True)
+class BulkGradeResult:
+    created: int
+    errors: list[GradeRowError]
 
 
 def _round_half_up(x: float) -> int:
@@ -24,12 +62,46 @@ def _round_half_up(x: float) -> int:
 
 
 def _get_enrollment_or_raise(*, student_id, course_id) -> Enrollment:
-    enrollment = Enrollment.objects.filter(student_id=student_id, course_id=course_id).first()
+    enrollment = Enrollment.objects.filter(student__uuid=student_id, course__uuid=course_id).first()
     if enrollment is None:
         raise StudentNotEnrolledError(student_id=student_id, course_id=course_id)
     return enrollment
 
 
+async def _aget_enrollment_or_raise(*, student_id, course_id) -> Enrollment:
+    enrollment = await Enrollment.objects.filter(student__uuid=student_id, course__uuid=course_id).afirst()
+    if enrollment is None:
+        raise StudentNotEnrolledError(student_id=student_id, course_id=course_id)
+    return enrollment
+
+
+def _resolve_numeric_value(*, numeric: int | None, letter: str | None) -> int:
+    """
+    Validate grade input and return the numeric value to persist.
+    """
+    has_numeric = numeric is not None
+    has_letter = letter is not None and str(letter).strip() != ""
+
+    if has_numeric == has_letter:
+        raise InvalidGradeInputError(
+            "Grade must be provided as exactly one of: numeric (0..100) OR letter."
+        )
+
+    if has_numeric:
+        if not isinstance(numeric, int):
+            raise InvalidGradeInputError("Numeric grade must be an integer.")
+        if numeric < 0 or numeric > 100:
+            raise InvalidGradeInputError("Numeric grade must be between 0 and 100 (inclusive).")
+        return numeric
+
+    try:
+        return letter_to_numeric_max(str(letter))
+    except ValueError:
+        raise InvalidLetterGradeError(letter=str(letter))
+
+
+@instrumented
+@retry_on_db_lock
 @transaction.atomic
 def record_grade(
     *,
@@ -47,55 +119,232 @@ def record_grade(
     - Providing both or neither results in a domain error.
     - Letter grades are converted to the numeric MAX of the letter interval.
     - Grades are historical records (append-only).
+    - The enrollment's stored grade aggregate is updated in the same transaction.
+    - The student's cached report card and averages, and the course's
+      cached rankings, are invalidated.
+    - A grade.recorded event is appended to the outbox in the same transaction.
     """
     enrollment = _get_enrollment_or_raise(student_id=student_id, course_id=course_id)
+    numeric_value = _resolve_numeric_value(numeric=numeric, letter=letter)
 
-    has_numeric = numeric is not None
-    has_letter = letter is not None and str(letter).strip() != ""
+    grade = Grade.objects.create(enrollment=enrollment, numeric_value=numeric_value)
+    Enrollment.objects.filter(pk=enrollment.pk).update(
+        grade_count=F("grade_count") + 1,
+        grade_sum=F("grade_sum") + numeric_value,
+        last_grade_value=numeric_value,
+        last_graded_at=grade.created_at,
+    )
+    publish(GRADE_RECORDED, [
+        grade_recorded(student_id=student_id, course_id=course_id, numeric_value=numeric_value)
+    ])
+    invalidate_students([student_id])
+    invalidate_courses([course_id])
+    return grade
 
-    if has_numeric == has_letter:
-        raise InvalidGradeInputError(
-            "Grade must be provided as exactly one of: numeric (0..100) OR letter."
+
+@instrumented
+def record_grades_bulk(
+    rows: Iterable[tuple],
+    *,
+    chunk_size: int = BULK_GRADE_CHUNK_SIZE,
+) -> BulkGradeResult:
+    """
+    Record many grades from (student_id, course_id, grade) rows.
+
+    Rules:
+    - grade is an int (numeric) or a str (letter); the same validation and
+      domain errors as record_grade apply to each row.
+    - Invalid rows are reported in the result (row_number is the 0-based
+      position in rows) and do not prevent the other rows from being stored.
+    - Rows are processed in chunks: enrollments are resolved with one query,
+      valid grades are inserted with bulk_create and the touched enrollment
+      aggregates are rebuilt, all in one transaction per chunk.
+    - Each stored grade appends a grade.recorded event to the outbox, in
+      its chunk's transaction.
+    """
+    created = 0
+    errors: list[GradeRowError] = []
+    iterator = iter(rows)
+    offset = 0
+    while chunk := list(islice(iterator, chunk_size)):
+        created += _record_grade_chunk(chunk, offset=offset, errors=errors)
+        offset += len(chunk)
+    return BulkGradeResult(created=created, errors=errors)
+
+
+def _record_grade_chunk(chunk: list[tuple], *, offset: int, errors: list[GradeRowError]) -> int:
+    student_field = Student._meta.get_field("uuid")
+    course_field = Course._meta.get_field("uuid")
+
+    def reject(row_number, student_id, course_id, error: DomainError) -> None:
+        errors.append(
+            GradeRowError(row_number=row_number, student_id=student_id, course_id=course_id, error=error)
         )
 
-    if has_numeric:
-        if not isinstance(numeric, int):
-            raise InvalidGradeInputError("Numeric grade must be an integer.")
-        if numeric < 0 or numeric > 100:
-            raise InvalidGradeInputError("Numeric grade must be between 0 and 100 (inclusive).")
-        numeric_value = numeric
-    else:
+    # (row_number, student_id, course_id, normalized key, grade value)
+    parsed: list[tuple] = []
+    for row_number, row in enumerate(chunk, start=offset):
+        try:
+            student_id, course_id, value = row
+        except (TypeError, ValueError):
+            reject(row_number, None, None, InvalidGradeInputError(
+                "Row must be a (student_id, course_id, grade) triple."
+            ))
+            continue
+        try:
+            key = (student_field.to_python(student_id), course_field.to_python(course_id))
+        except ValidationError:
+            reject(row_number, student_id, course_id,
+                   StudentNotEnrolledError(student_id=student_id, course_id=course_id))
+            continue
+        parsed.append((row_number, student_id, course_id, key, value))
+
+    if not parsed:
+        return 0
+
+    enrollment_ids = {
+        (sid, cid): pk
+        for pk, sid, cid in Enrollment.objects.filter(
+            student__uuid__in={key[0] for *_, key, _ in parsed},
+            course__uuid__in={key[1] for *_, key, _ in parsed},
+        ).values_list("pk", "student__uuid", "course__uuid")
+    }
+
+    grades: list[Grade] = []
+    events: list[dict] = []
+    for row_number, student_id, course_id, key, value in parsed:
         try:
-            numeric_value = letter_to_numeric_max(str(letter))
-        except ValueError:
-            raise InvalidLetterGradeError(letter=str(letter))
+            enrollment_id = enrollment_ids.get(key)
+            if enrollment_id is None:
+                raise StudentNotEnrolledError(student_id=student_id, course_id=course_id)
+            if isinstance(value, str):
+                numeric_value = _resolve_numeric_value(numeric=None, letter=value)
+            else:
+                numeric_value = _resolve_numeric_value(numeric=value, letter=None)
+        except DomainError as exc:
+            reject(row_number, student_id, course_id, exc)
+            continue
+        grades.append(Grade(enrollment_id=enrollment_id, numeric_value=numeric_value))
+        events.append(grade_recorded(student_id=key[0], course_id=key[1], numeric_value=numeric_value))
 
-    return Grade.objects.create(enrollment=enrollment, numeric_value=numeric_value)
+    if grades:
+        _insert_grades(grades, events)
+    return len(grades)
 
 
-def get_numeric_grades(*, student_id, course_id) -> list[int]:
+@retry_on_db_lock
+@transaction.atomic
+def _insert_grades(grades: list[Grade], events: list[dict]) -> None:
+    Grade.objects.bulk_create(grades)
+    publish(GRADE_RECORDED, events)
+    rebuild_grade_stats(enrollment_ids={g.enrollment_id for g in grades})
+
+
+def _history_queries(enrollment: Enrollment, *, include_archived: bool) -> list:
+    """
+    Grade value queries making up an enrollment's history, oldest first.
+
+    Archived grades are all older than the live ones (see archive_grades).
+    """
+    models = [ArchivedGrade, Grade] if include_archived else [Grade]
+    return [
+        model.objects.filter(enrollment=enrollment).order_by("created_at").values_list("numeric_value", flat=True)
+        for model in models
+    ]
+
+
+@instrumented
+def get_numeric_grades(*, student_id, course_id, include_archived: bool = False) -> list[int]:
+    """
+    Grades of the enrollment in recording order.
+
+    Only live grades unless include_archived is true; the archived ones then
+    come first, giving the full history.
+    """
     enrollment = _get_enrollment_or_raise(student_id=student_id, course_id=course_id)
-    return list(
-        Grade.objects.filter(enrollment=enrollment)
-        .order_by("created_at")
-        .values_list("numeric_value", flat=True)
-    )
+    return [v for query in _history_queries(enrollment, include_archived=include_archived) for v in query]
 
 
-def get_letter_grades(*, student_id, course_id) -> list[str]:
-    values = get_numeric_grades(student_id=student_id, course_id=course_id)
+@instrumented
+def get_letter_grades(*, student_id, course_id, include_archived: bool = False) -> list[str]:
+    values = get_numeric_grades(student_id=student_id, course_id=course_id, include_archived=include_archived)
     return [numeric_to_letter(v) for v in values]
 
 
+@instrumented
 def calculate_numeric_average(*, student_id, course_id) -> int:
-    values = get_numeric_grades(student_id=student_id, course_id=course_id)
-    if not values:
+    """
+    Average of all grades in the course, read from the enrollment's stored aggregate.
+
+    Archived grades are included: archiving does not change the aggregate.
+
+    Served from the per-student read-through cache when it is enabled.
+    """
+    return cached_for_student(
+        "numeric_average",
+        student_id=student_id,
+        parts=(course_id,),
+        build=lambda: _compute_numeric_average(student_id=student_id, course_id=course_id),
+    )
+
+
+def _compute_numeric_average(*, student_id, course_id) -> int:
+    enrollment = _get_enrollment_or_raise(student_id=student_id, course_id=course_id)
+    return _average_of(enrollment, student_id=student_id, course_id=course_id)
+
+
+def _average_of(enrollment: Enrollment, *, student_id, course_id) -> int:
+    if enrollment.grade_count == 0:
         raise NoGradesRecordedError(student_id=student_id, course_id=course_id)
 
-    avg = sum(values) / len(values)
+    avg = enrollment.grade_sum / enrollment.grade_count
     return _round_half_up(avg)
 
 
+@instrumented
 def calculate_letter_average(*, student_id, course_id) -> str:
     avg = calculate_numeric_average(student_id=student_id, course_id=course_id)
     return numeric_to_letter(avg)
+
+
+# Async API. Reads use Django's async ORM. Writes run the sync service in
+# Django's sync thread: they need transactions, which are sync-only.
+
+@instrumented
+async def arecord_grade(
+    *,
+    student_id,
+    course_id,
+    numeric: int | None = None,
+    letter: str | None = None,
+) -> Grade:
+    return await sync_to_async(record_grade)(
+        student_id=student_id, course_id=course_id, numeric=numeric, letter=letter
+    )
+
+
+@instrumented
+async def aget_numeric_grades(*, student_id, course_id, include_archived: bool = False) -> list[int]:
+    enrollment = await _aget_enrollment_or_raise(student_id=student_id, course_id=course_id)
+    return [v for query in _history_queries(enrollment, include_archived=include_archived) async for v in query]
+
+
+@instrumented
+async def aget_letter_grades(*, student_id, course_id, include_archived: bool = False) -> list[str]:
+    values = await aget_numeric_grades(student_id=student_id, course_id=course_id, include_archived=include_archived)
+    return [numeric_to_letter(v) for v in values]
+
+
+@instrumented
+async def acalculate_numeric_average(*, student_id, course_id) -> int:
+    async def build():
+        enrollment = await _aget_enrollment_or_raise(student_id=student_id, course_id=course_id)
+        return _average_of(enrollment, student_id=student_id, course_id=course_id)
+
+    return await acached_for_student("numeric_average", student_id=student_id, parts=(course_id,), build=build)
+
+
+@instrumented
+async def acalculate_letter_average(*, student_id, course_id) -> str:
+    avg = await acalculate_numeric_average(student_id=student_id, course_id=course_id)
+    return numeric_to_letter(avg)
@@ -0,0 +1,309 @@
+"""
+Database-backed job queue for heavy academics work (run by run_workers).
+
+A job is a registered name plus JSON keyword arguments. Workers, in any
+number of processes, claim the oldest ready job with a compare-and-set
+UPDATE, so no broker and no SELECT ... FOR UPDATE are needed and the same
+code runs on SQLite and PostgreSQL. A job whose handler raises is queued
+again after a backoff; after max_attempts it is left DEAD with its error
+(the dead-letter state) until requeue_dead_jobs. While a handler runs, its
+worker renews the lease every HEARTBEAT_SECONDS, so a long job is never
+taken over. A worker that dies (or stalls for longer than the lease) keeps
+its job RUNNING only until the lease expires; then another worker takes it
+and runs it again, so handlers must be idempotent.
+
+Settings (all optional):
+
+    ACADEMICS_JOBS = {
+        "HANDLERS": {                # extra job name -> callable or dotted path
+            "warm_dashboards": "myproject.jobs.warm_dashboards",
+        },
+        "MAX_ATTEMPTS": 3,
+        "RETRY_DELAY": 10,           # seconds before the first retry, doubled after each one
+        "LEASE_SECONDS": 600,        # a job not renewed for this long is given to another worker
+        "HEARTBEAT_SECONDS": 200,    # lease renewal interval (default: a third of the lease)
+    }
+"""
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import traceback
+from contextlib import contextmanager
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.db.models import Count, F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.module_loading import import_string
+
+from apps.academics.domain.exceptions import UnknownJobError
+from apps.academics.domain.models import Job
+from apps.academics.instrumentation import instrumented
+from apps.academics.retry import retry_on_db_lock
+
+logger = logging.getLogger(__name__)
+
+# Ready jobs read per claim attempt; losing a race moves on to the next one.
+CLAIM_CANDIDATES = 10
+
+
+def _config() -> dict:
+    return getattr(settings, "ACADEMICS_JOBS", None) or {}
+
+
+# The job adapters import their service when first run, so a worker only
+# loads the services of the jobs it actually executes.
+
+def _record_grades_bulk(*, rows: list) -> dict:
+    from apps.academics.services.grades import record_grades_bulk
+
+    result = record_grades_bulk([tuple(row) for row in rows])
+    return {
+        "created": result.created,
+        "errors": [{"row_number": e.row_number, "error": str(e.error)} for e in result.errors],
+    }
+
+
+def _archive_grades(*, before: str, batch_size: int | None = None) -> dict:
+    from apps.academics.services.archival import ARCHIVE_BATCH_SIZE, archive_grades
+
+    # As in the archive_grades command: a naive cutoff is in the current time zone.
+    cutoff = parse_datetime(before)
+    if cutoff is None:
+        raise ValueError(f"Invalid archive cutoff {before!r}; use an ISO datetime.")
+    if timezone.is_naive(cutoff):
+        cutoff = timezone.make_aware(cutoff)
+    batch_size = batch_size or ARCHIVE_BATCH_SIZE
+    return asdict(archive_grades(before=cutoff, batch_size=batch_size))
+
+
+def _course_statistics(*, course_id) -> dict:
+    from apps.academics.services.analytics import course_statistics
+
+    return asdict(course_statistics(course_id=course_id))
+
+
+def _export_report_cards(*, student_ids: list, output: str, include_archived: bool = False) -> dict:
+    from apps.academics.services.report_cards import build_report_cards, report_card_to_dict
+
+    # Rewrites the whole file, so a retried attempt leaves no partial output behind.
+    cards = build_report_cards(student_ids=student_ids, include_archived=include_archived)
+    with open(output, "w", encoding="utf-8") as stream:
+        for card in cards:
+            stream.write(json.dumps(report_card_to_dict(card)) + "\n")
+    return {"cards": len(cards), "output": output}
+
+
+# Built-in jobs: name -> callable (or its dotted path) taking the job's kwargs
+# and returning a JSON-able result.
+BUILTIN_JOBS: dict[str, Callable | str] = {
+    "rebuild_grade_stats": "apps.academics.services.grade_stats.rebuild_grade_stats",
+    "record_grades_bulk": _record_grades_bulk,
+    "archive_grades": _archive_grades,
+    "course_statistics": _course_statistics,
+    "export_report_cards": _export_report_cards,
+}
+
+
+def job_names() -> set[str]:
+    return set(BUILTIN_JOBS) | set(_config().get("HANDLERS", {}))
+
+
+def job_handler(name: str) -> Callable:
+    """
+    The callable registered for a job name (HANDLERS entries win); imported on first use.
+    """
+    handler = _config().get("HANDLERS", {}).get(name) or BUILTIN_JOBS[name]
+    return import_string(handler) if isinstance(handler, str) else handler
+
+
+def enqueue(
+    name: str,
+    kwargs: dict | None = None,
+    *,
+    run_after: datetime | None = None,
+    max_attempts: int | None = None,
+) -> Job:
+    """
+    Queue one job; raises UnknownJobError for an unregistered name.
+    """
+    return enqueue_many(name, [kwargs or {}], run_after=run_after, max_attempts=max_attempts)[0]
+
+
+def enqueue_many(
+    name: str,
+    kwargs_list: Iterable[dict],
+    *,
+    run_after: datetime | None = None,
+    max_attempts: int | None = None,
+) -> list[Job]:
+    """
+    Queue one job per kwargs dict with a single INSERT, e.g. a chunked
+    term-end task that run_workers then spreads across processes.
+    """
+    if name not in job_names():
+        raise UnknownJobError(name)
+    return Job.objects.bulk_create(
+        Job(
+            name=name,
+            kwargs=kwargs,
+            run_after=run_after or timezone.now(),
+            max_attempts=max_attempts or _config().get("MAX_ATTEMPTS", 3),
+        )
+        for kwargs in kwargs_list
+    )
+
+
+@retry_on_db_lock
+def claim_job(*, worker: str, names: Iterable[str] | None = None) -> Job | None:
+    """
+    Claim the oldest ready job for worker, or return None if there is none.
+
+    Rules:
+    - Ready means QUEUED with run_after in the past, or RUNNING with an
+      expired lease (its worker is presumed dead).
+    - The claim is one conditional UPDATE (still in the state we read), so
+      concurrent workers never claim the same job.
+    - Claiming counts an attempt. A job whose lease expires after its last
+      attempt goes DEAD instead of being run again.
+    - names restricts the claim to those job names.
+    """
+    now = timezone.now()
+    lease = timedelta(seconds=_config().get("LEASE_SECONDS", 600))
+    candidates = Job.objects.order_by("id")
+    if names is not None:
+        candidates = candidates.filter(name__in=list(names))
+    queued = candidates.filter(status=Job.Status.QUEUED, run_after__lte=now)
+    expired = candidates.filter(status=Job.Status.RUNNING, locked_at__lt=now - lease)
+
+    for ready in (queued, expired):
+        for job_id, status, locked_at, attempts, max_attempts in ready.values_list(
+            "id", "status", "locked_at", "attempts", "max_attempts"
+        )[:CLAIM_CANDIDATES]:
+            current = Job.objects.filter(id=job_id, status=status, locked_at=locked_at)
+            if attempts >= max_attempts:
+                current.update(status=Job.Status.DEAD, finished_at=now, locked_by="", last_error=(
+                    f"Lease expired after {attempts} attempt(s); the worker running it did not finish."
+                ))
+                continue
+            if current.update(
+                status=Job.Status.RUNNING, locked_by=worker, locked_at=now, attempts=F("attempts") + 1
+            ):
+                return Job.objects.get(id=job_id)
+    return None
+
+
+@instrumented
+def run_job(job: Job, *, worker: str) -> str:
+    """
+    Run a claimed job's handler and record the outcome; return its status.
+
+    Rules:
+    - On success the job is SUCCEEDED and keeps the handler's return value,
+      which must be JSON-serializable (dataclasses are stored as dicts).
+    - If the handler raises, the job is QUEUED again after RETRY_DELAY *
+      2 ** (attempts - 1) seconds, or DEAD once max_attempts is reached; the
+      traceback is kept in last_error. The exception does not propagate.
+    - The lease is renewed in a background thread while the handler runs.
+    - If the lease was lost meanwhile (another worker took the job), the
+      outcome is discarded and the job is left to its new owner.
+    """
+    mine = Job.objects.filter(id=job.id, status=Job.Status.RUNNING, locked_by=worker)
+    try:
+        handler = job_handler(job.name)
+        with _lease_heartbeat(job, worker=worker):
+            result = handler(**job.kwargs)
+        if hasattr(result, "__dataclass_fields__"):
+            result = asdict(result)
+        json.dumps(result, cls=DjangoJSONEncoder)  # an unstorable result fails the attempt here
+        changes = {"status": Job.Status.SUCCEEDED, "result": result, "last_error": ""}
+    except Exception:
+        logger.warning("Job %s (%s) failed, attempt %d/%d", job.id, job.name, job.attempts, job.max_attempts,
+                       exc_info=True)
+        changes = {"last_error": traceback.format_exc()}
+        if job.attempts < job.max_attempts:
+            delay = _config().get("RETRY_DELAY", 10) * 2 ** (job.attempts - 1)
+            changes.update(status=Job.Status.QUEUED, run_after=timezone.now() + timedelta(seconds=delay))
+        else:
+            changes.update(status=Job.Status.DEAD)
+    if changes["status"] != Job.Status.QUEUED:
+        changes["finished_at"] = timezone.now()
+    if not _save_outcome(mine, changes):
+        logger.warning("Job %s (%s) lost its lease before finishing; outcome discarded", job.id, job.name)
+    return changes["status"]
+
+
+@retry_on_db_lock
+def _save_outcome(mine, changes: dict) -> int:
+    return mine.update(locked_by="", locked_at=None, **changes)
+
+
+@retry_on_db_lock
+def renew_lease(*, job_id: int, worker: str) -> bool:
+    """
+    Restart the lease of a job worker is running; False if it is no longer worker's.
+    """
+    return bool(
+        Job.objects.filter(id=job_id, status=Job.Status.RUNNING, locked_by=worker).update(locked_at=timezone.now())
+    )
+
+
+@contextmanager
+def _lease_heartbeat(job: Job, *, worker: str):
+    lease = _config().get("LEASE_SECONDS", 600)
+    interval = _config().get("HEARTBEAT_SECONDS") or lease / 3
+    stop = threading.Event()
+
+    def beat():
+        # Runs on its own database connection, closed when the job is done.
+        try:
+            while not stop.wait(interval):
+                try:
+                    if not renew_lease(job_id=job.id, worker=worker):
+                        logger.warning("Job %s (%s) lost its lease while running", job.id, job.name)
+                        return
+                except Exception:
+                    logger.warning("Could not renew the lease of job %s (%s)", job.id, job.name, exc_info=True)
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=beat, name=f"job-{job.id}-heartbeat", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def run_next_job(*, worker: str, names: Iterable[str] | None = None) -> str | None:
+    """
+    Claim and run one job; return its new status, or None if nothing was ready.
+    """
+    job = claim_job(worker=worker, names=names)
+    return run_job(job, worker=worker) if job else None
+
+
+def requeue_dead_jobs(*, name: str | None = None) -> int:
+    """
+    Give dead jobs a fresh set of attempts; return how many were queued.
+    """
+    dead = Job.objects.filter(status=Job.Status.DEAD)
+    if name is not None:
+        dead = dead.filter(name=name)
+    return dead.update(status=Job.Status.QUEUED, attempts=0, run_after=timezone.now(), finished_at=None)
+
+
+def job_counts() -> dict[str, int]:
+    """
+    Number of jobs per status (every status present, zeros included).
+    """
+    counts = dict(Job.objects.values_list("status").annotate(n=Count("id")).order_by())
+    return {status: counts.get(status, 0) for status in Job.Status.values}
@@ -0,0 +1,163 @@
+"""
+Transactional outbox for grade and enrollment events.
+
+The write services append an event row (publish) in the same transaction as
+the write, so an event exists exactly when its write committed. Consumers run
+out of band, in the drain_outbox command: each is a named handler that gets
+batches of events in id order, and its position (the last id it processed)
+is stored in OutboxOffset after the handler returns. A handler that raises,
+or a worker that dies mid-batch, gets the same events again: delivery is
+at-least-once, so handlers must be idempotent.
+
+Settings (all optional):
+
+    ACADEMICS_OUTBOX = {
+        "HANDLERS": {                 # consumer name -> callable or dotted path
+            "notifications": "myproject.notifications.on_academic_events",
+        },
+        "SETTLE_SECONDS": 0,          # see drain_outbox
+    }
+"""
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Iterable
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from apps.academics.domain.models import OutboxEvent, OutboxOffset
+from apps.academics.instrumentation import instrumented
+
+GRADE_RECORDED = "grade.recorded"
+ENROLLMENT_CREATED = "enrollment.created"
+
+# Events handed to a consumer per call (and per position update).
+OUTBOX_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class DrainResult:
+    consumer: str
+    delivered: int
+    batches: int
+    # Id of the last event the consumer has processed.
+    position: int
+
+
+def _config() -> dict:
+    return getattr(settings, "ACADEMICS_OUTBOX", None) or {}
+
+
+def consumers() -> dict[str, Callable[[list[OutboxEvent]], None]]:
+    """
+    The configured consumers: name -> handler.
+    """
+    return {
+        name: import_string(handler) if isinstance(handler, str) else handler
+        for name, handler in _config().get("HANDLERS", {}).items()
+    }
+
+
+def publish(topic: str, payloads: Iterable[dict]) -> None:
+    """
+    Append one event per payload. Call inside the write's transaction.
+    """
+    OutboxEvent.objects.bulk_create(OutboxEvent(topic=topic, payload=payload) for payload in payloads)
+
+
+def grade_recorded(*, student_id, course_id, numeric_value: int) -> dict:
+    return {"student_id": _public_id(student_id), "course_id": _public_id(course_id), "numeric_value": numeric_value}
+
+
+def enrollment_created(*, enrollment_id, student_id, course_id) -> dict:
+    return {
+        "enrollment_id": _public_id(enrollment_id),
+        "student_id": _public_id(student_id),
+        "course_id": _public_id(course_id),
+    }
+
+
+def _public_id(value) -> str:
+    return str(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+
+
+@instrumented
+def drain_outbox(
+    *,
+    consumer: str,
+    handler: Callable[[list[OutboxEvent]], None] | None = None,
+    batch_size: int = OUTBOX_BATCH_SIZE,
+    max_batches: int | None = None,
+    progress: Callable[[DrainResult], None] | None = None,
+) -> DrainResult:
+    """
+    Deliver the events after a consumer's position to its handler.
+
+    Rules:
+    - handler defaults to the consumer's entry in HANDLERS. It is called with
+      up to batch_size events in id order; the position moves to the last of
+      them only after it returns. If it raises, the exception propagates and
+      the batch is delivered again by the next drain.
+    - Events younger than SETTLE_SECONDS are left for a later drain: with
+      concurrent writers (PostgreSQL) a transaction can commit a lower id
+      after a higher one is already visible, and moving past it would lose
+      it. SQLite serializes writers, so 0 is safe there.
+    - Stops when the consumer has caught up, or after max_batches batches.
+    - The position only moves forward, so two workers on the same consumer
+      are safe; they just deliver some batches twice.
+    """
+    if handler is None:
+        handler = consumers()[consumer]
+    settle = timedelta(seconds=_config().get("SETTLE_SECONDS", 0))
+    offset, _ = OutboxOffset.objects.get_or_create(consumer=consumer)
+    position = offset.position
+    delivered = batches = 0
+    while max_batches is None or batches < max_batches:
+        # A range scan of the primary key: the cost is the batch, not the backlog.
+        events = list(OutboxEvent.objects.filter(id__gt=position).order_by("id")[:batch_size])
+        if settle:
+            cutoff = timezone.now() - settle
+            events = events[:next((i for i, e in enumerate(events) if e.created_at > cutoff), len(events))]
+        if not events:
+            break
+        handler(events)
+        position = events[-1].id
+        OutboxOffset.objects.filter(consumer=consumer, position__lt=position).update(
+            position=position, updated_at=timezone.now()
+        )
+        delivered += len(events)
+        batches += 1
+        if progress:
+            progress(DrainResult(consumer=consumer, delivered=delivered, batches=batches, position=position))
+    return DrainResult(consumer=consumer, delivered=delivered, batches=batches, position=position)
+
+
+@instrumented
+def prune_outbox() -> int:
+    """
+    Delete the events every configured consumer has processed; return how many.
+
+    Nothing is deleted while no consumer is configured, and a configured
+    consumer that never drained holds every event.
+    """
+    names = list(consumers())
+    if not names:
+        return 0
+    positions = dict(OutboxOffset.objects.filter(consumer__in=names).values_list("consumer", "position"))
+    floor = min(positions.get(name, 0) for name in names)
+    deleted, _ = OutboxEvent.objects.filter(id__lte=floor).delete()
+    return deleted
+
+
+def pending_events(*, consumer: str) -> int:
+    """
+    How many events the consumer has not processed yet.
+    """
+    position = (
+        OutboxOffset.objects.filter(consumer=consumer).values_list("position", flat=True).first() or 0
+    )
+    return OutboxEvent.objects.filter(id__gt=position).count()
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Callable, Generic, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q, QuerySet
+
+from apps.academics.domain.exceptions import InvalidCursorError, InvalidPageSizeError
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """
+    One page of a keyset-paginated listing.
+
+    next_cursor is None on the last page.
+    """
+    items: list[T]
+    next_cursor: str | None
+
+
+def encode_cursor(*, name: str, uuid) -> str:
+    """
+    Opaque cursor pointing just after the (name, uuid) row.
+
+    Only public values go into it: the internal integer id never leaves the service layer.
+    """
+    raw = json.dumps([name, str(uuid)], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        name, last_id = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+        raise InvalidCursorError(cursor=cursor)
+    if not isinstance(name, str) or not isinstance(last_id, str):
+        raise InvalidCursorError(cursor=cursor)
+    return name, last_id
+
+
+def paginate_by_name(
+    queryset: QuerySet,
+    *,
+    page_size: int,
+    cursor: str | None = None,
+    to_item: Callable = lambda obj: obj,
+) -> Page:
+    """
+    Keyset pagination over (name, uuid).
+
+    Rules:
+    - Rows are ordered by (name, uuid), matching the (name, uuid) indexes, so
+      every page is an index range seek: deep pages cost the same as the first.
+    - The public uuid, not the internal id, breaks ties between equal names,
+      so cursors reveal nothing that the listed items do not.
+    - page_size must be between 1 and MAX_PAGE_SIZE.
+    """
+    if not isinstance(page_size, int) or not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise InvalidPageSizeError(page_size=page_size)
+
+    queryset = queryset.order_by("name", "uuid")
+    if cursor is not None:
+        name, last_uuid = decode_cursor(cursor)
+        try:
+            last_uuid = queryset.model._meta.get_field("uuid").to_python(last_uuid)
+        except ValidationError:
+            raise InvalidCursorError(cursor=cursor)
+        # (name, uuid) > (cursor name, cursor uuid), written so the leading
+        # name >= ... bound can seek the index.
+        queryset = queryset.filter(Q(name__gte=name) & (Q(name__gt=name) | Q(uuid__gt=last_uuid)))
+
+    rows = list(queryset[: page_size + 1])
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_cursor(name=rows[-1].name, uuid=rows[-1].uuid) if has_more else None
+    return Page(items=[to_item(obj) for obj in rows], next_cursor=next_cursor)
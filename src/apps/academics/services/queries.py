@@ -1,26 +1,76 @@
 from __future__ import annotations
 
 from apps.academics.domain.models import Course, Enrollment, Student
+from apps.academics.instrumentation import instrumented
+from apps.academics.routers import EVENTUAL, read_consistency
+from apps.academics.services.pagination import Page, paginate_by_name
 
 
-def list_courses_for_student(*, student_id) -> list[Course]:
+# All listings read from the replica unless called with consistency=STRONG
+# (see apps.academics.routers).
+
+# Semi-joins (id IN (subquery)) rather than JOIN + DISTINCT: the subquery is
+# answered from an enrollment index, so the cost follows the roster size
+# instead of the size of the whole catalog.
+def _courses_for_student(student_id):
+    return Course.objects.filter(
+        id__in=Enrollment.objects.filter(student__uuid=student_id).values("course_id")
+    )
+
+
+def _students_for_course(course_id):
+    return Student.objects.filter(
+        id__in=Enrollment.objects.filter(course__uuid=course_id).values("student_id")
+    )
+
+
+@instrumented
+def list_courses_for_student(*, student_id, consistency: str = EVENTUAL) -> list[Course]:
     """
     Return all courses a student is enrolled in.
     """
-    return list(
-        Course.objects.filter(enrollments__student_id=student_id)
-        .order_by("name")
-        .distinct()
-    )
+    with read_consistency(consistency):
+        return list(_courses_for_student(student_id).order_by("name", "uuid"))
 
 
-def list_students_for_course(*, course_id) -> list[Student]:
+@instrumented
+def list_students_for_course(*, course_id, consistency: str = EVENTUAL) -> list[Student]:
     """
     Return all students enrolled in a given course.
     """
-    return list(
-        Student.objects.filter(enrollments__course_id=course_id)
-        .order_by("name")
-        .distinct()
-    )
+    with read_consistency(consistency):
+        return list(_students_for_course(course_id).order_by("name", "uuid"))
+
+
+@instrumented
+def list_courses_for_student_page(
+    *, student_id, page_size: int, cursor: str | None = None, consistency: str = EVENTUAL
+) -> Page[Course]:
+    """
+    One page of the courses a student is enrolled in, ordered by name.
+    """
+    with read_consistency(consistency):
+        return paginate_by_name(_courses_for_student(student_id), page_size=page_size, cursor=cursor)
+
+
+@instrumented
+def list_students_for_course_page(
+    *, course_id, page_size: int, cursor: str | None = None, consistency: str = EVENTUAL
+) -> Page[Student]:
+    """
+    One page of the students enrolled in a course, ordered by name.
+    """
+    with read_consistency(consistency):
+        return paginate_by_name(_students_for_course(course_id), page_size=page_size, cursor=cursor)
+
+
+@instrumented
+async def alist_courses_for_student(*, student_id, consistency: str = EVENTUAL) -> list[Course]:
+    with read_consistency(consistency):
+        return [c async for c in _courses_for_student(student_id).order_by("name", "uuid")]
+
 
+@instrumented
+async def alist_students_for_course(*, course_id, consistency: str = EVENTUAL) -> list[Student]:
+    with read_consistency(consistency):
+        return [s async for s in _students_for_course(course_id).order_by("name", "uuid")]
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from asgiref.sync import sync_to_async
+
 from apps.academics.domain.exceptions import InvalidStudentNameError, InvalidCourseNameError
 from apps.academics.domain.models import Student, Course
+from apps.academics.instrumentation import instrumented
+from apps.academics.retry import retry_on_db_lock
 
 
+@instrumented
+@retry_on_db_lock
 def create_student(*, name: str) -> Student:
     """
     Create a Student with the minimal required attributes.
@@ -14,6 +20,8 @@ def create_student(*, name: str) -> Student:
     return Student.objects.create(name=normalized)
 
 
+@instrumented
+@retry_on_db_lock
 def create_course(*, name: str) -> Course:
     """
     Create a Course with the minimal required attributes.
@@ -22,3 +30,13 @@ def create_course(*, name: str) -> Course:
     if not normalized:
         raise InvalidCourseNameError(name=name)
     return Course.objects.create(name=normalized)
+
+
+@instrumented
+async def acreate_student(*, name: str) -> Student:
+    return await sync_to_async(create_student)(name=name)
+
+
+@instrumented
+async def acreate_course(*, name: str) -> Course:
+    return await sync_to_async(create_course)(name=name)
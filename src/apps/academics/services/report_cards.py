@@ -1,11 +1,24 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
 from dataclasses import dataclass
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator
 
-from apps.academics.domain.grade_scale import numeric_to_letter
-from apps.academics.domain.models import Enrollment, Grade
+from django.db import router
+from django.db.models import Case, Count, F, IntegerField, Sum, When
+
+from apps.academics.domain.grade_scale import get_grade_scale, numeric_to_letter
+from apps.academics.domain.models import ArchivedGrade, Enrollment, Grade, Student
+from apps.academics.instrumentation import instrumented
+from apps.academics.routers import EVENTUAL, STRONG, read_consistency
+from apps.academics.services.caching import acached_for_student, cached_for_student
 from apps.academics.services.grades import _round_half_up
 
+# Upper bound of student ids sent in a single IN (...) clause.
+# Keeps each batch well below SQLite's bound-parameter limit.
+REPORT_CARD_BATCH_SIZE = 500
+
 
 @dataclass(frozen=True)
 class CourseReport:
@@ -28,41 +41,369 @@ class StudentReportCard:
     courses: list[CourseReport]
 
 
-def build_report_card(*, student_id) -> StudentReportCard:
+@dataclass(frozen=True)
+class ReportCardChunk:
+    """
+    Report cards of one range of student ids, first_id..last_id inclusive.
+
+    cards is shorter than the range, or empty, when students in it were
+    deleted after the ranges were read; last_id is still where the next
+    range starts.
+    """
+    first_id: object
+    last_id: object
+    cards: list[StudentReportCard]
+
+
+def report_card_to_dict(card: StudentReportCard) -> dict:
+    """
+    JSON-ready representation of a report card (ids as strings).
+    """
+    return {
+        "student_id": str(card.student_id),
+        "courses": [
+            {
+                "course_id": str(c.course_id),
+                "course_name": c.course_name,
+                "numeric_grades": c.numeric_grades,
+                "numeric_average": c.numeric_average,
+                "letter_average": c.letter_average,
+            }
+            for c in card.courses
+        ],
+    }
+
+
+@dataclass(frozen=True)
+class StudentOverallAverage:
+    """
+    A student's mean of course averages (the averages of their report card).
+
+    numeric_average and letter_average are None for a student without courses.
+    """
+    student_id: object
+    course_count: int
+    numeric_average: int | None
+    letter_average: str | None
+
+
+@instrumented
+def build_report_card(*, student_id, include_archived: bool = False) -> StudentReportCard:
     """
     Build the report card for a student.
 
     For each enrolled course, include:
-    - all recorded numeric grades (historical)
+    - all recorded numeric grades (historical); archived grades only when
+      include_archived is true, listed before the live ones
     - numeric average (rounded to nearest integer, half-up)
     - letter average derived from the numeric average
 
     Notes:
+    - Averages come from the enrollment's stored grade aggregate, which
+      counts archived grades too.
     - If a student has no grades in a course yet, average is 0 and letter is derived from 0 ("F").
       This is a design choice to keep the report total and stable.
+    - Served from the per-student read-through cache when it is enabled;
+      grade and enrollment writes invalidate it.
+    - Always read from the primary: a card built from a lagging replica
+      would be cached under the student's current version.
     """
-    enrollments = (
-        Enrollment.objects.select_related("course")
-        .filter(student_id=student_id)
-        .order_by("course__name")
+    return cached_for_student(
+        "report_card",
+        student_id=student_id,
+        # Letters depend on the loaded grade scale.
+        parts=_card_parts(include_archived),
+        build=lambda: build_report_cards(
+            student_ids=[student_id], consistency=STRONG, include_archived=include_archived
+        )[0],
     )
 
-    course_reports: list[CourseReport] = []
-    for e in enrollments:
-        values = list(
-            Grade.objects.filter(enrollment=e)
-            .order_by("created_at")
-            .values_list("numeric_value", flat=True)
+
+@instrumented
+def build_report_cards(
+    *, student_ids: Iterable, consistency: str = EVENTUAL, include_archived: bool = False
+) -> list[StudentReportCard]:
+    """
+    Build report cards for many students at once.
+
+    Returns one card per given student id, in the same order.
+
+    Rules:
+    - Same content and averages as build_report_card.
+    - Enrollments and grades are fetched with a fixed number of queries
+      per batch of REPORT_CARD_BATCH_SIZE students (two, three with
+      include_archived), regardless of how many courses or grades each
+      student has.
+    - Reads from the replica unless consistency is STRONG (see apps.academics.routers).
+    """
+    student_ids = list(student_ids)
+    cards: list[StudentReportCard] = []
+    with read_consistency(consistency):
+        for start in range(0, len(student_ids), REPORT_CARD_BATCH_SIZE):
+            batch = student_ids[start:start + REPORT_CARD_BATCH_SIZE]
+            cards.extend(_build_report_card_batch(batch, include_archived=include_archived))
+    return cards
+
+
+@instrumented
+async def abuild_report_card(*, student_id, include_archived: bool = False) -> StudentReportCard:
+    """
+    Async build_report_card: same card, cache and primary-only reads.
+    """
+    async def build():
+        (card,) = await abuild_report_cards(
+            student_ids=[student_id], consistency=STRONG, include_archived=include_archived
         )
+        return card
+
+    return await acached_for_student(
+        "report_card",
+        student_id=student_id,
+        parts=_card_parts(include_archived),
+        build=build,
+    )
+
+
+@instrumented
+async def abuild_report_cards(
+    *, student_ids: Iterable, consistency: str = EVENTUAL, include_archived: bool = False
+) -> list[StudentReportCard]:
+    """
+    Async build_report_cards, on Django's async ORM.
+    """
+    student_ids = list(student_ids)
+    cards: list[StudentReportCard] = []
+    with read_consistency(consistency):
+        for start in range(0, len(student_ids), REPORT_CARD_BATCH_SIZE):
+            batch = student_ids[start:start + REPORT_CARD_BATCH_SIZE]
+            cards.extend(await _abuild_report_card_batch(batch, include_archived=include_archived))
+    return cards
+
+
+# Not @instrumented: these return lazy iterators, timed by whoever consumes them.
+
+def report_card_chunks(
+    *,
+    workers: int = 1,
+    after=None,
+    chunk_size: int = REPORT_CARD_BATCH_SIZE,
+    consistency: str = EVENTUAL,
+    include_archived: bool = False,
+) -> Iterator[ReportCardChunk]:
+    """
+    Stream every student's report card, in chunks, ordered by student id.
+
+    Rules:
+    - Students are partitioned into ranges of chunk_size consecutive ids
+      (after the given id, if any); each chunk is one range's cards, built
+      as build_report_cards would, with the range's bounds.
+    - With workers > 1 the ranges are built in a pool of that many spawned
+      processes, each with its own database connection, read from the
+      settings module in DJANGO_SETTINGS_MODULE. Chunks are still yielded
+      in id order, so the output does not depend on workers.
+    - At most 2 * workers ranges are in flight, so memory stays bounded.
+    - A student created while the stream runs appears only if its id falls
+      in a range not yet built.
+    """
+    with read_consistency(consistency):
+        ids = Student.objects.order_by("uuid")
+        if after is not None:
+            ids = ids.filter(uuid__gt=after)
+        ids = ids.values_list("uuid", flat=True).iterator(chunk_size=chunk_size)
+        ranges = []
+        while chunk := list(islice(ids, chunk_size)):
+            ranges.append((chunk[0], chunk[-1]))
+    options = {"consistency": consistency, "include_archived": include_archived}
+
+    if workers <= 1:
+        for first, last in ranges:
+            yield ReportCardChunk(first, last, _report_cards_in_range(first, last, **options))
+        return
+
+    # Imported here: the process pool machinery is only needed with workers.
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import get_context
+
+    import django
 
-        if values:
-            avg = _round_half_up(sum(values) / len(values))
+    # Workers import this module, which needs the app registry: django.setup
+    # is their initializer (a function defined here could not be unpickled).
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"), initializer=django.setup)
+    try:
+        in_flight = deque()
+        for first, last in ranges:
+            in_flight.append((first, last, pool.submit(_report_cards_in_range, first, last, **options)))
+            if len(in_flight) >= 2 * workers:
+                first_done, last_done, future = in_flight.popleft()
+                yield ReportCardChunk(first_done, last_done, future.result())
+        while in_flight:
+            first_done, last_done, future = in_flight.popleft()
+            yield ReportCardChunk(first_done, last_done, future.result())
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _report_cards_in_range(first, last, *, consistency: str, include_archived: bool) -> list[StudentReportCard]:
+    with read_consistency(consistency):
+        student_ids = list(
+            Student.objects.filter(uuid__gte=first, uuid__lte=last).order_by("uuid").values_list("uuid", flat=True)
+        )
+    return build_report_cards(student_ids=student_ids, consistency=consistency, include_archived=include_archived)
+
+
+def overall_averages(
+    *, student_ids: Iterable | None = None, consistency: str = EVENTUAL, chunk_size: int = 2000
+) -> Iterator[StudentOverallAverage]:
+    """
+    Stream each student's overall average across their courses.
+
+    Rules:
+    - Each course average is the report card's: half-up of the stored
+      aggregate, 0 for a course without grades (the same design choice).
+    - The overall average is the half-up mean of those course averages.
+    - With student_ids=None, every student is yielded in id order (as in
+      report_card_chunks) by one grouped query, read in chunks of chunk_size rows; memory stays
+      flat however many students there are.
+    - With student_ids, one result per given id in the same order (one
+      grouped query per REPORT_CARD_BATCH_SIZE ids); unknown ids are skipped.
+    - Reads from the replica unless consistency is STRONG (see apps.academics.routers).
+    """
+    queryset = _overall_query(consistency)
+    if student_ids is None:
+        return (_overall_average(row) for row in queryset.order_by("uuid").iterator(chunk_size=chunk_size))
+    return _overall_averages_of(queryset, list(student_ids))
+
+
+def _overall_averages_of(queryset, student_ids: list) -> Iterator[StudentOverallAverage]:
+    for start in range(0, len(student_ids), REPORT_CARD_BATCH_SIZE):
+        batch = student_ids[start:start + REPORT_CARD_BATCH_SIZE]
+        by_uuid = {row["uuid"]: row for row in queryset.filter(uuid__in=batch)}
+        for student_id in batch:
+            row = by_uuid.get(_as_key(student_id))
+            if row is not None:
+                yield _overall_average(row)
+
+
+async def aoverall_averages(
+    *, student_ids: Iterable | None = None, consistency: str = EVENTUAL, chunk_size: int = 2000
+) -> AsyncIterator[StudentOverallAverage]:
+    """
+    Async overall_averages, on Django's async ORM (an async generator).
+    """
+    queryset = _overall_query(consistency)
+    if student_ids is None:
+        async for row in queryset.order_by("uuid").aiterator(chunk_size=chunk_size):
+            yield _overall_average(row)
+        return
+    student_ids = list(student_ids)
+    for start in range(0, len(student_ids), REPORT_CARD_BATCH_SIZE):
+        batch = student_ids[start:start + REPORT_CARD_BATCH_SIZE]
+        by_uuid = {row["uuid"]: row async for row in queryset.filter(uuid__in=batch)}
+        for student_id in batch:
+            row = by_uuid.get(_as_key(student_id))
+            if row is not None:
+                yield _overall_average(row)
+
+
+def _overall_query(consistency: str):
+    # The alias is resolved now: the rows are read after read_consistency()
+    # has exited, when the caller iterates.
+    with read_consistency(consistency):
+        alias = router.db_for_read(Student)
+    course_average = Case(
+        When(
+            enrollments__grade_count__gt=0,
+            # Exact integer half-up of grade_sum / grade_count.
+            then=(2 * F("enrollments__grade_sum") + F("enrollments__grade_count"))
+            / (2 * F("enrollments__grade_count")),
+        ),
+        default=0,
+        output_field=IntegerField(),
+    )
+    return (
+        Student.objects.using(alias)
+        # GROUP BY the unique public id only: grouping by every Student
+        # column makes SQLite sort all students in a temp B-tree before the
+        # first row, while ordering by uuid walks its unique index.
+        .values("uuid")
+        .annotate(course_count=Count("enrollments"), average_sum=Sum(course_average))
+        # values(), not values_list(): aiterator() only streams the former.
+        .values("uuid", "course_count", "average_sum")
+    )
+
+
+def _overall_average(row) -> StudentOverallAverage:
+    student_id, course_count, average_sum = row["uuid"], row["course_count"], row["average_sum"]
+    if not course_count:
+        return StudentOverallAverage(student_id=student_id, course_count=0, numeric_average=None, letter_average=None)
+    average = _round_half_up(average_sum / course_count)
+    return StudentOverallAverage(
+        student_id=student_id,
+        course_count=course_count,
+        numeric_average=average,
+        letter_average=numeric_to_letter(average),
+    )
+
+
+def _card_parts(include_archived: bool) -> tuple:
+    fingerprint = get_grade_scale().fingerprint
+    return (fingerprint, "archived") if include_archived else (fingerprint,)
+
+
+def _build_report_card_batch(student_ids: list, *, include_archived: bool) -> list[StudentReportCard]:
+    enrollments = list(_enrollments_query(student_ids))
+    grade_rows = [row for query in _grades_queries(enrollments, include_archived=include_archived) for row in query]
+    return _assemble_report_cards(student_ids, enrollments, grade_rows)
+
+
+async def _abuild_report_card_batch(student_ids: list, *, include_archived: bool) -> list[StudentReportCard]:
+    enrollments = [e async for e in _enrollments_query(student_ids)]
+    grade_rows = [
+        row for query in _grades_queries(enrollments, include_archived=include_archived) async for row in query
+    ]
+    return _assemble_report_cards(student_ids, enrollments, grade_rows)
+
+
+def _enrollments_query(student_ids: list):
+    return (
+        Enrollment.objects.select_related("course")
+        .filter(student__uuid__in=student_ids)
+        .annotate(student_uuid=F("student__uuid"))
+    )
+
+
+def _grades_queries(enrollments: list[Enrollment], *, include_archived: bool) -> list:
+    """
+    (enrollment_id, numeric_value) queries, archived grades (all older) first.
+    """
+    models = [ArchivedGrade, Grade] if include_archived else [Grade]
+    return [
+        model.objects.filter(enrollment_id__in=[e.id for e in enrollments])
+        .order_by("enrollment_id", "created_at")
+        .values_list("enrollment_id", "numeric_value")
+        for model in models
+    ]
+
+
+def _assemble_report_cards(student_ids: list, enrollments: list[Enrollment], grade_rows) -> list[StudentReportCard]:
+    values_by_enrollment: dict[object, list[int]] = defaultdict(list)
+    for enrollment_id, value in grade_rows:
+        values_by_enrollment[enrollment_id].append(value)
+
+    # Sorted here rather than in SQL: the sort is per student and tiny,
+    # and it keeps both queries index-only on SQLite (no temp B-tree).
+    reports_by_student: dict[object, list[CourseReport]] = defaultdict(list)
+    for e in sorted(enrollments, key=lambda e: (e.course.name, e.course_id)):
+        values = values_by_enrollment.get(e.id, [])
+
+        if e.grade_count:
+            avg = _round_half_up(e.grade_sum / e.grade_count)
         else:
             avg = 0  # design choice: no grades yet => 0
 
-        course_reports.append(
+        reports_by_student[e.student_uuid].append(
             CourseReport(
-                course_id=e.course_id,
+                course_id=e.course.uuid,
                 course_name=e.course.name,
                 numeric_grades=values,
                 numeric_average=avg,
@@ -70,4 +411,16 @@ def build_report_card(*, student_id) -> StudentReportCard:
             )
         )
 
-    return StudentReportCard(student_id=student_id, courses=course_reports)
+    return [
+        StudentReportCard(student_id=sid, courses=reports_by_student.get(_as_key(sid), []))
+        for sid in student_ids
+    ]
+
+
+def _as_key(student_id):
+    """
+    Normalize a caller-provided id (UUID or its string form) to the
+    value Django returns for Student.uuid.
+    """
+    field = Student._meta.get_field("uuid")
+    return field.to_python(student_id)
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from apps.academics.services import analytics
+from apps.academics.services.analytics import course_statistics
+from apps.academics.services.grades import calculate_numeric_average, record_grade
+from apps.academics.services.queries import list_students_for_course
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_course_statistics_matches_per_student_averages(django_assert_num_queries):
+    course = CourseFactory()
+    rng = random.Random(7)
+    for _ in range(12):
+        e = EnrollmentFactory(course=course)
+        for _ in range(rng.randint(1, 4)):
+            record_grade(student_id=e.student.uuid, course_id=course.uuid, numeric=rng.randint(40, 100))
+    EnrollmentFactory(course=course)  # enrolled, not graded yet
+
+    with django_assert_num_queries(1):
+        stats = course_statistics(course_id=course.uuid)
+
+    averages = sorted(
+        calculate_numeric_average(student_id=s.uuid, course_id=course.uuid)
+        for s in list_students_for_course(course_id=course.uuid)
+        if s.enrollments.get(course=course).grade_count
+    )
+    assert stats.enrollment_count == 13
+    assert stats.graded_count == 12
+    assert stats.mean == pytest.approx(sum(averages) / 12)
+    assert stats.median == pytest.approx((averages[5] + averages[6]) / 2)
+    assert sum(stats.letter_histogram.values()) == 12
+    assert list(stats.letter_histogram)[0] == "A+"
+
+
+@pytest.mark.django_db
+def test_course_statistics_numpy_path_matches_python_path(monkeypatch):
+    pytest.importorskip("numpy")
+    course = CourseFactory()
+    for values in ([80, 81], [59], [100, 97, 90], [70], [60, 61]):
+        e = EnrollmentFactory(course=course)
+        for v in values:
+            record_grade(student_id=e.student.uuid, course_id=course.uuid, numeric=v)
+
+    python_stats = course_statistics(course_id=course.uuid)
+    monkeypatch.setattr(analytics, "NUMPY_THRESHOLD", 1)
+    numpy_stats = course_statistics(course_id=course.uuid)
+
+    assert python_stats.letter_histogram == numpy_stats.letter_histogram
+    assert python_stats.letter_histogram["B-"] == 1  # 80.5 => 81
+    for field in ("mean", "median", "p10", "p90", "stddev"):
+        assert getattr(numpy_stats, field) == pytest.approx(getattr(python_stats, field))
+
+
+@pytest.mark.django_db
+def test_course_statistics_without_grades():
+    course = CourseFactory()
+    EnrollmentFactory(course=course, student=StudentFactory())
+
+    stats = course_statistics(course_id=course.uuid)
+
+    assert (stats.enrollment_count, stats.graded_count) == (1, 0)
+    assert stats.mean is None and stats.p90 is None
+    assert set(stats.letter_histogram.values()) == {0}
+
+
+@pytest.mark.django_db
+def test_course_ranking_dense_ranks_half_up_averages(django_assert_num_queries):
+    course = CourseFactory()
+    # name -> grades; Ana and Bia tie on 81 (80.5 rounds up), Caio has no grades.
+    grades = {"Dan": [90], "Ana": [80, 81], "Bia": [81], "Eva": [40, 60], "Caio": []}
+    for name, values in grades.items():
+        e = EnrollmentFactory(course=course, student=StudentFactory(name=name))
+        for v in values:
+            record_grade(student_id=e.student.uuid, course_id=course.uuid, numeric=v)
+
+    with django_assert_num_queries(1):
+        ranking = analytics.course_ranking(course_id=course.uuid)
+
+    assert [(r.student_name, r.numeric_average, r.rank) for r in ranking] == [
+        ("Dan", 90, 1), ("Ana", 81, 2), ("Bia", 81, 2), ("Eva", 50, 3),
+    ]
+    assert [r.percentile for r in ranking] == [100.0, 75.0, 75.0, 25.0]
+    assert [r.student_name for r in analytics.course_ranking(course_id=course.uuid, limit=1)] == ["Dan"]
+    assert [r.student_name for r in analytics.course_ranking(course_id=course.uuid, limit=2, bottom=True)] == [
+        "Eva", "Ana",
+    ]
+    for row in ranking:
+        assert analytics.student_rank(course_id=course.uuid, student_id=row.student_id) == row
+
+
+@pytest.mark.django_db
+def test_course_ranking_cache_follows_new_grades(settings):
+    settings.ACADEMICS_CACHE = {"ENABLED": True, "ALIAS": "default", "TIMEOUT": 300}
+    course = CourseFactory()
+    first, second = EnrollmentFactory(course=course), EnrollmentFactory(course=course)
+    record_grade(student_id=first.student.uuid, course_id=course.uuid, numeric=70)
+    record_grade(student_id=second.student.uuid, course_id=course.uuid, numeric=60)
+    assert analytics.course_ranking(course_id=course.uuid, limit=1)[0].student_id == first.student.uuid
+
+    record_grade(student_id=second.student.uuid, course_id=course.uuid, numeric=100)
+
+    assert analytics.course_ranking(course_id=course.uuid, limit=1)[0].student_id == second.student.uuid
+    assert analytics.student_rank(course_id=course.uuid, student_id=first.student.uuid).rank == 2
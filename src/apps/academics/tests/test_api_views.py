@@ -0,0 +1,98 @@
+import pytest
+from django.urls import reverse
+
+from apps.academics.services.enrollments import enroll_student
+from apps.academics.services.grades import record_grade
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+
+def _report_card_url(student_id):
+    return reverse("academics:report-card", kwargs={"student_id": student_id})
+
+
+@pytest.mark.django_db
+def test_report_card_json(client):
+    e = EnrollmentFactory(course=CourseFactory(name="Math"))
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+
+    response = client.get(_report_card_url(e.student.uuid))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert response.json() == {
+        "student_id": str(e.student.uuid),
+        "courses": [{
+            "course_id": str(e.course.uuid),
+            "course_name": "Math",
+            "numeric_grades": [80],
+            "numeric_average": 80,
+            "letter_average": "B-",
+        }],
+    }
+    assert b": " not in response.content  # compact separators
+
+
+@pytest.mark.django_db
+def test_report_card_revalidation_skips_the_build(client, django_assert_num_queries):
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+    etag = client.get(_report_card_url(e.student.uuid))["ETag"]
+
+    with django_assert_num_queries(1):  # the ETag aggregate only
+        response = client.get(_report_card_url(e.student.uuid), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=90)
+    response = client.get(_report_card_url(e.student.uuid), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.json()["courses"][0]["numeric_grades"] == [80, 90]
+
+    new_etag = response["ETag"]
+    enroll_student(student_id=e.student.uuid, course_id=CourseFactory().uuid)
+    assert client.get(_report_card_url(e.student.uuid), HTTP_IF_NONE_MATCH=new_etag).status_code == 200
+
+
+@pytest.mark.django_db
+def test_roster_pages_and_etag(client):
+    course = CourseFactory()
+    for name in ("Carla", "Ana", "Bruno"):
+        EnrollmentFactory(course=course, student=StudentFactory(name=name))
+    url = reverse("academics:course-students", kwargs={"course_id": course.uuid})
+
+    first = client.get(url, {"page_size": 2})
+    body = first.json()
+    assert [s["name"] for s in body["items"]] == ["Ana", "Bruno"]
+    second = client.get(url, {"page_size": 2, "cursor": body["next_cursor"]}).json()
+    assert [s["name"] for s in second["items"]] == ["Carla"]
+    assert second["next_cursor"] is None
+
+    assert client.get(url, {"page_size": 2}, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+    EnrollmentFactory(course=course)
+    assert client.get(url, {"page_size": 2}, HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 200
+
+
+@pytest.mark.django_db
+def test_student_courses_and_catalog_listings(client):
+    e = EnrollmentFactory(course=CourseFactory(name="Physics"))
+
+    courses = client.get(reverse("academics:student-courses", kwargs={"student_id": e.student.uuid}))
+    assert courses.json()["items"] == [{"id": str(e.course.uuid), "name": "Physics"}]
+
+    listing = client.get(reverse("academics:students"))
+    assert listing.json()["items"] == [{"id": str(e.student.uuid), "name": e.student.name}]
+    assert client.get(reverse("academics:students"), HTTP_IF_NONE_MATCH=listing["ETag"]).status_code == 304
+    assert client.get(reverse("academics:courses")).json()["items"][0]["name"] == "Physics"
+
+
+@pytest.mark.django_db
+def test_invalid_paging_is_a_400(client):
+    for params in ({"page_size": "lots"}, {"page_size": 0}, {"cursor": "not-a-cursor"}):
+        response = client.get(reverse("academics:courses"), params)
+        assert response.status_code == 400
+        assert response.json()["error"] in ("InvalidPageSizeError", "InvalidCursorError")
+
+
+@pytest.mark.django_db
+def test_api_is_read_only(client):
+    assert client.post(reverse("academics:students")).status_code == 405
@@ -0,0 +1,93 @@
+import io
+from datetime import datetime, timezone
+
+import pytest
+from django.core.management import call_command
+
+from apps.academics.domain.models import ArchivedGrade, Grade, GradeRollup
+from apps.academics.services.archival import archive_grades
+from apps.academics.services.grade_stats import find_grade_stats_mismatches, rebuild_grade_stats
+from apps.academics.services.grades import calculate_numeric_average, get_numeric_grades, record_grade
+from apps.academics.services.report_cards import build_report_card
+from apps.academics.tests.factories import EnrollmentFactory
+
+
+def _record(enrollment, values, *, dates=()):
+    """
+    Record grades through the service, backdating the first ones to dates.
+    """
+    grades = [
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=v)
+        for v in values
+    ]
+    for grade, day in zip(grades, dates):
+        Grade.objects.filter(pk=grade.pk).update(created_at=day)
+    return grades
+
+
+@pytest.mark.django_db
+def test_archive_grades_keeps_averages_and_full_history():
+    enrollment = EnrollmentFactory()
+    ids = {"student_id": enrollment.student.uuid, "course_id": enrollment.course.uuid}
+    _record(enrollment, [60, 95, 70, 81], dates=[datetime(2024, 3, 1, tzinfo=timezone.utc),
+                                                  datetime(2024, 5, 1, tzinfo=timezone.utc)])
+    average = calculate_numeric_average(**ids)
+    card = build_report_card(student_id=enrollment.student.uuid)
+
+    result = archive_grades(before=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert (result.enrollments, result.grades) == (1, 2)
+    assert Grade.objects.count() == 2 and ArchivedGrade.objects.count() == 2
+    rollup = GradeRollup.objects.get(enrollment=enrollment)
+    assert (rollup.grade_count, rollup.grade_sum, rollup.min_grade_value, rollup.max_grade_value) == (2, 155, 60, 95)
+    assert rollup.last_grade_value == 95
+
+    assert calculate_numeric_average(**ids) == average
+    assert get_numeric_grades(**ids) == [70, 81]
+    assert get_numeric_grades(**ids, include_archived=True) == [60, 95, 70, 81]
+    assert build_report_card(student_id=enrollment.student.uuid).courses[0].numeric_grades == [70, 81]
+    assert build_report_card(student_id=enrollment.student.uuid, include_archived=True) == card
+
+    # The aggregates rebuild identically from live rows plus the rollup.
+    assert list(find_grade_stats_mismatches()) == []
+    rebuild_grade_stats()
+    assert calculate_numeric_average(**ids) == average
+
+
+@pytest.mark.django_db
+def test_archive_grades_merges_rollups_across_runs():
+    enrollment = EnrollmentFactory()
+    ids = {"student_id": enrollment.student.uuid, "course_id": enrollment.course.uuid}
+    _record(enrollment, [40, 100, 90], dates=[datetime(2023, 9, 1, tzinfo=timezone.utc),
+                                              datetime(2024, 9, 1, tzinfo=timezone.utc)])
+
+    archive_grades(before=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    call_command("archive_grades", "--before", "2025-01-01", stdout=io.StringIO(), stderr=io.StringIO())
+
+    rollup = GradeRollup.objects.get(enrollment=enrollment)
+    assert (rollup.grade_count, rollup.grade_sum, rollup.min_grade_value, rollup.max_grade_value) == (2, 140, 40, 100)
+    assert rollup.last_grade_value == 100
+    assert rollup.archived_through.year == 2025
+    assert get_numeric_grades(**ids, include_archived=True) == [40, 100, 90]
+    assert list(find_grade_stats_mismatches()) == []
+
+
+@pytest.mark.django_db
+def test_archive_grades_only_deletes_the_grades_it_copied(monkeypatch):
+    enrollment = EnrollmentFactory()
+    ids = {"student_id": enrollment.student.uuid, "course_id": enrollment.course.uuid}
+    _record(enrollment, [60, 70], dates=[datetime(2024, 3, 1, tzinfo=timezone.utc)])
+    bulk_create = ArchivedGrade.objects.bulk_create
+
+    def copy_then_race(objs, **kwargs):
+        # A concurrent writer commits an old-dated grade after the batch was read.
+        created = bulk_create(objs, **kwargs)
+        _record(enrollment, [80], dates=[datetime(2024, 4, 1, tzinfo=timezone.utc)])
+        return created
+
+    monkeypatch.setattr(ArchivedGrade.objects, "bulk_create", copy_then_race)
+    result = archive_grades(before=datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert result.grades == ArchivedGrade.objects.count() == 1
+    assert sorted(get_numeric_grades(**ids)) == [70, 80]
+    assert sorted(get_numeric_grades(**ids, include_archived=True)) == [60, 70, 80]
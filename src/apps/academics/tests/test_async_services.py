@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+
+from apps.academics.domain.exceptions import (
+    DuplicateEnrollmentError,
+    InvalidGradeInputError,
+    NoGradesRecordedError,
+    StudentNotEnrolledError,
+)
+from apps.academics.services.analytics import acourse_ranking, acourse_statistics, course_ranking, course_statistics
+from apps.academics.services.enrollments import aenroll_student
+from apps.academics.services.grades import (
+    acalculate_letter_average,
+    acalculate_numeric_average,
+    aget_letter_grades,
+    arecord_grade,
+    record_grade,
+)
+from apps.academics.services.queries import alist_courses_for_student, alist_students_for_course
+from apps.academics.services.registration import acreate_student
+from apps.academics.services.report_cards import (
+    abuild_report_card,
+    aoverall_averages,
+    build_report_card,
+    overall_averages,
+)
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_async_report_cards_match_sync_and_can_be_gathered():
+    course = CourseFactory()
+    enrollments = [EnrollmentFactory(course=course) for _ in range(5)]
+    for i, e in enumerate(enrollments):
+        record_grade(student_id=e.student.uuid, course_id=course.uuid, numeric=60 + i)
+
+    async def dashboard():
+        return await asyncio.gather(*(abuild_report_card(student_id=e.student.uuid) for e in enrollments))
+
+    cards = async_to_sync(dashboard)()
+
+    assert cards == [build_report_card(student_id=e.student.uuid) for e in enrollments]
+    assert [c.courses[0].numeric_grades for c in cards] == [[60], [61], [62], [63], [64]]
+
+
+@pytest.mark.django_db
+def test_async_overall_averages_match_sync():
+    enrollments = [EnrollmentFactory() for _ in range(3)]
+    for i, e in enumerate(enrollments):
+        record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=70 + i)
+    ids = [e.student.uuid for e in reversed(enrollments)]
+
+    async def collect(**kwargs):
+        return [a async for a in aoverall_averages(**kwargs)]
+
+    assert async_to_sync(collect)() == list(overall_averages())
+    assert async_to_sync(collect)(student_ids=ids) == list(overall_averages(student_ids=ids))
+
+
+@pytest.mark.django_db
+def test_async_grades_and_listings():
+    e = EnrollmentFactory()
+
+    async def flow():
+        await arecord_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=90)
+        await arecord_grade(student_id=e.student.uuid, course_id=e.course.uuid, letter="B")
+        return (
+            await aget_letter_grades(student_id=e.student.uuid, course_id=e.course.uuid),
+            await acalculate_numeric_average(student_id=e.student.uuid, course_id=e.course.uuid),
+            await acalculate_letter_average(student_id=e.student.uuid, course_id=e.course.uuid),
+            await alist_students_for_course(course_id=e.course.uuid),
+            await alist_courses_for_student(student_id=e.student.uuid),
+            await acourse_statistics(course_id=e.course.uuid),
+            await acourse_ranking(course_id=e.course.uuid),
+        )
+
+    letters, average, letter, students, courses, stats, ranking = async_to_sync(flow)()
+
+    assert letters == ["A-", "B"]
+    assert (average, letter) == (88, "B+")
+    assert [s.uuid for s in students] == [e.student.uuid]
+    assert [c.uuid for c in courses] == [e.course.uuid]
+    assert stats == course_statistics(course_id=e.course.uuid)
+    assert ranking == course_ranking(course_id=e.course.uuid)
+
+
+@pytest.mark.django_db
+def test_async_services_raise_the_same_domain_errors():
+    e = EnrollmentFactory()
+    stranger = StudentFactory()
+
+    with pytest.raises(StudentNotEnrolledError):
+        async_to_sync(arecord_grade)(student_id=stranger.uuid, course_id=e.course.uuid, numeric=80)
+    with pytest.raises(InvalidGradeInputError):
+        async_to_sync(arecord_grade)(student_id=e.student.uuid, course_id=e.course.uuid, numeric=101)
+    with pytest.raises(NoGradesRecordedError):
+        async_to_sync(acalculate_numeric_average)(student_id=e.student.uuid, course_id=e.course.uuid)
+    with pytest.raises(DuplicateEnrollmentError):
+        async_to_sync(aenroll_student)(student_id=e.student.uuid, course_id=e.course.uuid)
+
+    student = async_to_sync(acreate_student)(name="  Ada ")
+    assert student.name == "Ada"
@@ -0,0 +1,110 @@
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from apps.academics.domain.exceptions import NoGradesRecordedError
+from apps.academics.domain.grade_scale import LetterRange, load_grade_scale
+from apps.academics.instrumentation import registry
+from apps.academics.services.enrollments import enroll_student
+from apps.academics.services.grade_stats import rebuild_grade_stats
+from apps.academics.services.grades import calculate_numeric_average, record_grade
+from apps.academics.services.report_cards import build_report_card
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, GradeFactory
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    cache.clear()
+    registry.reset()
+    yield
+    cache.clear()
+    registry.reset()
+
+
+@pytest.mark.django_db
+def test_report_card_is_served_from_cache_until_a_grade_is_recorded(django_assert_num_queries):
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+
+    first = build_report_card(student_id=e.student.uuid)
+    with django_assert_num_queries(0):
+        assert build_report_card(student_id=str(e.student.uuid)) == first
+
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=90)
+
+    assert build_report_card(student_id=e.student.uuid).courses[0].numeric_grades == [80, 90]
+    assert registry.cache_stats("report_card") == {"hits": 1, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_enrollment_invalidates_report_card():
+    e = EnrollmentFactory()
+    assert len(build_report_card(student_id=e.student.uuid).courses) == 1
+
+    enroll_student(student_id=e.student.uuid, course_id=CourseFactory().uuid)
+
+    assert len(build_report_card(student_id=e.student.uuid).courses) == 2
+
+
+@pytest.mark.django_db
+def test_average_is_cached_per_course_and_errors_are_not(django_assert_num_queries):
+    e = EnrollmentFactory()
+    with pytest.raises(NoGradesRecordedError):
+        calculate_numeric_average(student_id=e.student.uuid, course_id=e.course.uuid)
+
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=70)
+    assert calculate_numeric_average(student_id=e.student.uuid, course_id=e.course.uuid) == 70
+    with django_assert_num_queries(0):
+        assert calculate_numeric_average(student_id=e.student.uuid, course_id=e.course.uuid) == 70
+
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=81)
+    assert calculate_numeric_average(student_id=e.student.uuid, course_id=e.course.uuid) == 76
+
+
+@pytest.mark.django_db
+def test_version_is_bumped_again_on_commit(django_capture_on_commit_callbacks):
+    e = EnrollmentFactory()
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+        # A reader caching between the write and its commit...
+        build_report_card(student_id=e.student.uuid)
+
+    assert len(callbacks) == 2  # student and course versions
+    # ...does not get its entry served after the commit.
+    build_report_card(student_id=e.student.uuid)
+    assert registry.cache_stats("report_card") == {"hits": 0, "misses": 2}
+
+
+@pytest.mark.django_db
+def test_full_rebuild_invalidates_every_student():
+    e = EnrollmentFactory()
+    assert build_report_card(student_id=e.student.uuid).courses[0].numeric_average == 0
+
+    GradeFactory(enrollment=e, numeric_value=88)  # bypasses the services
+    rebuild_grade_stats()
+
+    assert build_report_card(student_id=e.student.uuid).courses[0].numeric_average == 88
+
+
+@pytest.mark.django_db
+def test_report_card_follows_the_loaded_grade_scale():
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=55)
+    assert build_report_card(student_id=e.student.uuid).courses[0].letter_average == "F"
+
+    previous = load_grade_scale((LetterRange("P", 50, 100), LetterRange("F", 0, 49)))
+    try:
+        assert build_report_card(student_id=e.student.uuid).courses[0].letter_average == "P"
+    finally:
+        load_grade_scale(previous)
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_CACHE={"ENABLED": False})
+def test_disabled_cache_reads_the_database_every_time(django_assert_num_queries):
+    e = EnrollmentFactory()
+    build_report_card(student_id=e.student.uuid)
+
+    with django_assert_num_queries(2):
+        build_report_card(student_id=e.student.uuid)
+    assert registry.cache_stats("report_card") == {"hits": 0, "misses": 0}
@@ -0,0 +1,62 @@
+import pytest
+
+from apps.academics.domain.exceptions import InvalidCursorError, InvalidPageSizeError
+from apps.academics.services.catalog import (
+    list_courses,
+    list_courses_page,
+    list_students,
+    list_students_page,
+)
+from apps.academics.services.pagination import decode_cursor
+from apps.academics.tests.factories import CourseFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_list_students_page_walks_all_students_in_name_order():
+    for name in ["Carla", "Ana", "Bruno", "Ana", "Davi"]:
+        StudentFactory(name=name)
+
+    seen = []
+    cursor = None
+    while True:
+        page = list_students_page(page_size=2, cursor=cursor)
+        assert len(page.items) <= 2
+        seen.extend(page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert seen == list_students()
+    assert [s.name for s in seen] == ["Ana", "Ana", "Bruno", "Carla", "Davi"]
+
+
+@pytest.mark.django_db
+def test_cursor_holds_only_public_values_and_breaks_name_ties_by_uuid():
+    twins = sorted((StudentFactory(name="Ana") for _ in range(2)), key=lambda s: str(s.uuid))
+
+    first = list_students_page(page_size=1)
+    second = list_students_page(page_size=1, cursor=first.next_cursor)
+
+    assert decode_cursor(first.next_cursor) == ("Ana", str(twins[0].uuid))
+    assert [first.items[0].id, second.items[0].id] == [s.uuid for s in twins]
+    assert second.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_list_courses_page_last_page_has_no_cursor():
+    CourseFactory(name="Physics")
+    CourseFactory(name="Algebra")
+
+    page = list_courses_page(page_size=2)
+
+    assert [c.name for c in page.items] == ["Algebra", "Physics"]
+    assert page.items == list_courses()
+    assert page.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_list_students_page_rejects_bad_cursor_and_page_size():
+    with pytest.raises(InvalidCursorError):
+        list_students_page(page_size=10, cursor="not-a-cursor")
+    with pytest.raises(InvalidPageSizeError):
+        list_students_page(page_size=0)
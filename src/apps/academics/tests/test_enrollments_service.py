@@ -1,8 +1,14 @@
+import threading
+import time
+import uuid
+
 import pytest
+from django.db import OperationalError, connection, transaction
+from django.test.utils import CaptureQueriesContext
 
-from apps.academics.domain.exceptions import DuplicateEnrollmentError
+from apps.academics.domain.exceptions import DuplicateEnrollmentError, UnknownCourseError, UnknownStudentError
 from apps.academics.domain.models import Enrollment
-from apps.academics.services.enrollments import enroll_student
+from apps.academics.services.enrollments import enroll_student, enroll_students
 from apps.academics.tests.factories import StudentFactory, CourseFactory, EnrollmentFactory
 
 
@@ -11,10 +17,13 @@ def test_enroll_student_creates_enrollment():
     student = StudentFactory()
     course = CourseFactory()
 
-    enrollment = enroll_student(student_id=student.id, course_id=course.id)
+    with CaptureQueriesContext(connection) as ctx:
+        enrollment = enroll_student(student_id=student.uuid, course_id=course.uuid)
 
-    assert enrollment.student_id == student.id
-    assert enrollment.course_id == course.id
+    # The public ids are resolved inside the INSERT, not looked up first.
+    assert not [q["sql"] for q in ctx.captured_queries if q["sql"].lstrip().upper().startswith("SELECT")]
+    assert enrollment.student.uuid == student.uuid
+    assert enrollment.course.uuid == course.uuid
     assert Enrollment.objects.filter(student=student, course=course).exists()
 
 
@@ -23,4 +32,109 @@ def test_enroll_student_raises_on_duplicate_enrollment():
     enrollment = EnrollmentFactory()
 
     with pytest.raises(DuplicateEnrollmentError):
-        enroll_student(student_id=enrollment.student_id, course_id=enrollment.course_id)
+        enroll_student(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid)
+
+
+@pytest.mark.django_db
+def test_enroll_student_raises_on_duplicate_inside_outer_transaction():
+    enrollment = EnrollmentFactory()
+
+    with transaction.atomic():
+        with pytest.raises(DuplicateEnrollmentError):
+            enroll_student(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid)
+        # The outer transaction is still usable after the translated conflict.
+        assert Enrollment.objects.filter(pk=enrollment.pk).exists()
+
+
+@pytest.mark.django_db
+def test_enroll_students_reports_duplicates():
+    existing = EnrollmentFactory()
+    student = StudentFactory()
+    course_a = CourseFactory()
+    course_b = CourseFactory()
+
+    result = enroll_students(
+        [
+            (student.uuid, course_a.uuid),
+            (existing.student.uuid, existing.course.uuid),
+            (str(student.uuid), str(course_b.uuid)),
+            (student.uuid, course_a.uuid),
+        ]
+    )
+
+    assert result.enrolled == [(student.uuid, course_a.uuid), (student.uuid, course_b.uuid)]
+    assert sorted(result.duplicates) == sorted(
+        [(existing.student.uuid, existing.course.uuid), (student.uuid, course_a.uuid)]
+    )
+    assert Enrollment.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_enrollments_resolve_public_uuids():
+    student = StudentFactory()
+    course = CourseFactory()
+    missing = uuid.uuid4()
+
+    result = enroll_students([(student.uuid, course.uuid), (student.uuid, missing), (missing, course.uuid)])
+
+    assert result.enrolled == [(student.uuid, course.uuid)]
+    assert [(e.student_id, e.course_id, type(e.error)) for e in result.unknown] == [
+        (student.uuid, missing, UnknownCourseError),
+        (missing, course.uuid, UnknownStudentError),
+    ]
+    assert Enrollment.objects.get().student_id == student.pk
+    with pytest.raises(UnknownCourseError):
+        enroll_student(student_id=student.uuid, course_id=missing)
+    with pytest.raises(UnknownStudentError):
+        enroll_student(student_id=missing, course_id=course.uuid)
+    assert Enrollment.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_enroll_student_never_loses_or_misreports_enrollments():
+    students = [StudentFactory() for _ in range(3)]
+    courses = [CourseFactory() for _ in range(3)]
+    pairs = [(s.uuid, c.uuid) for s in students for c in courses]
+    threads_count = 6
+    barrier = threading.Barrier(threads_count)
+    outcomes = []
+    lock = threading.Lock()
+
+    def attempt(student_id, course_id):
+        # SQLite's shared in-memory test database reports transient table
+        # locks between threads; those are retried, everything else is
+        # recorded as the outcome of the call.
+        while True:
+            try:
+                enroll_student(student_id=student_id, course_id=course_id)
+                return "created"
+            except DuplicateEnrollmentError:
+                return "duplicate"
+            except OperationalError as exc:
+                if "locked" not in str(exc):
+                    return repr(exc)
+                time.sleep(0.001)
+            except Exception as exc:
+                return repr(exc)
+
+    def worker():
+        try:
+            barrier.wait()
+            for student_id, course_id in pairs:
+                outcome = attempt(student_id, course_id)
+                with lock:
+                    outcomes.append(((student_id, course_id), outcome))
+        finally:
+            connection.close()
+
+    threads = [threading.Thread(target=worker) for _ in range(threads_count)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for pair in pairs:
+        results = [outcome for p, outcome in outcomes if p == pair]
+        assert results.count("created") == 1, results
+        assert results.count("duplicate") == threads_count - 1, results
+    assert Enrollment.objects.count() == len(pairs)
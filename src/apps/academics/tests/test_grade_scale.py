@@ -1,6 +1,15 @@
 import pytest
 
-from apps.academics.domain.grade_scale import letter_to_numeric_max, numeric_to_letter
+from apps.academics.domain.grade_scale import (
+    LetterRange,
+    compile_grade_scale,
+    get_grade_scale,
+    letter_to_numeric_max,
+    letters_to_numeric,
+    load_grade_scale,
+    numeric_to_letter,
+    numeric_to_letters,
+)
 
 
 @pytest.mark.parametrize(
@@ -51,3 +60,59 @@ def test_letter_to_numeric_max_raises_on_unknown():
 def test_numeric_to_letter_raises_on_out_of_range():
     with pytest.raises(ValueError):
         numeric_to_letter(101)
+
+
+def test_batch_conversions_match_scalar_functions():
+    values = list(range(101))
+    letters = [numeric_to_letter(v) for v in values]
+
+    assert numeric_to_letters(values) == letters
+    assert letters_to_numeric(letters + [" a "]) == [letter_to_numeric_max(l) for l in letters] + [96]
+
+
+def test_batch_conversions_raise_scalar_errors():
+    with pytest.raises(ValueError):
+        numeric_to_letters([50, 101])
+    with pytest.raises(TypeError):
+        numeric_to_letters([50, 50.5])
+    with pytest.raises(ValueError):
+        letters_to_numeric(["A", "Z"])
+
+
+def test_batch_conversions_accept_numpy_arrays():
+    np = pytest.importorskip("numpy")
+
+    values = np.arange(101).reshape(1, 101)
+    assert numeric_to_letters(values).tolist() == [[numeric_to_letter(v) for v in range(101)]]
+    assert letters_to_numeric(np.array(["A+", " b ", "F"])).tolist() == [100, 86, 59]
+
+    with pytest.raises(ValueError):
+        numeric_to_letters(np.array([-1, 50]))
+    with pytest.raises(TypeError):
+        numeric_to_letters(np.array([50.0]))
+    with pytest.raises(ValueError):
+        letters_to_numeric(np.array(["A", "Z"]))
+
+
+def test_load_grade_scale_switches_conversions_without_changing_call_sites():
+    pass_fail = (LetterRange("P", 50, 100), LetterRange("F", 0, 49))
+
+    previous = load_grade_scale(pass_fail)
+    try:
+        assert numeric_to_letter(50) == "P"
+        assert numeric_to_letters([49, 50]) == ["F", "P"]
+        assert letter_to_numeric_max("p") == 100
+        with pytest.raises(ValueError):
+            letter_to_numeric_max("A")
+    finally:
+        load_grade_scale(previous)
+
+    assert get_grade_scale() is previous
+    assert numeric_to_letter(50) == "F"
+
+
+def test_compile_grade_scale_rejects_gaps_and_overlaps():
+    with pytest.raises(ValueError):
+        compile_grade_scale((LetterRange("P", 51, 100), LetterRange("F", 0, 49)))
+    with pytest.raises(ValueError):
+        compile_grade_scale((LetterRange("P", 50, 100), LetterRange("F", 0, 50)))
@@ -0,0 +1,57 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.academics.domain.models import Enrollment
+from apps.academics.services.grade_stats import find_grade_stats_mismatches, rebuild_grade_stats
+from apps.academics.services.grades import calculate_numeric_average, record_grade
+from apps.academics.tests.factories import EnrollmentFactory, GradeFactory
+
+
+@pytest.mark.django_db
+def test_record_grade_updates_enrollment_aggregate():
+    enrollment = EnrollmentFactory()
+
+    record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=80)
+    g = record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, letter="A")
+
+    enrollment.refresh_from_db()
+    assert enrollment.grade_count == 2
+    assert enrollment.grade_sum == 176
+    assert enrollment.last_grade_value == 96
+    assert enrollment.last_graded_at == g.created_at
+    assert list(find_grade_stats_mismatches()) == []
+
+
+@pytest.mark.django_db
+def test_rebuild_grade_stats_repairs_rows_inserted_outside_services():
+    enrollment = EnrollmentFactory()
+    GradeFactory(enrollment=enrollment, numeric_value=70)
+    latest = GradeFactory(enrollment=enrollment, numeric_value=91)
+
+    mismatches = list(find_grade_stats_mismatches())
+    assert [m.enrollment_id for m in mismatches] == [enrollment.uuid]
+
+    assert rebuild_grade_stats() == 1
+
+    enrollment.refresh_from_db()
+    assert (enrollment.grade_count, enrollment.grade_sum) == (2, 161)
+    assert enrollment.last_grade_value == 91
+    assert enrollment.last_graded_at == latest.created_at
+    assert calculate_numeric_average(
+        student_id=enrollment.student.uuid, course_id=enrollment.course.uuid
+    ) == 81  # 80.5 => 81
+    assert list(find_grade_stats_mismatches()) == []
+
+
+@pytest.mark.django_db
+def test_rebuild_grade_stats_command_check_mode():
+    enrollment = EnrollmentFactory()
+    GradeFactory(enrollment=enrollment, numeric_value=50)
+
+    with pytest.raises(CommandError):
+        call_command("rebuild_grade_stats", "--check")
+
+    call_command("rebuild_grade_stats")
+    call_command("rebuild_grade_stats", "--check")
+
+    assert Enrollment.objects.get(pk=enrollment.pk).grade_sum == 50
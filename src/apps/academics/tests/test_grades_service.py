@@ -1,4 +1,7 @@
+import io
+
 import pytest
+from django.core.management import call_command
 
 from apps.academics.domain.exceptions import (
     InvalidGradeInputError,
@@ -12,6 +15,7 @@ from apps.academics.services.grades import (
     get_letter_grades,
     get_numeric_grades,
     record_grade,
+    record_grades_bulk,
 )
 from apps.academics.tests.factories import StudentFactory, CourseFactory, EnrollmentFactory
 
@@ -22,14 +26,14 @@ def test_record_grade_requires_enrollment():
     course = CourseFactory()
 
     with pytest.raises(StudentNotEnrolledError):
-        record_grade(student_id=student.id, course_id=course.id, numeric=80)
+        record_grade(student_id=student.uuid, course_id=course.uuid, numeric=80)
 
 
 @pytest.mark.django_db
 def test_record_grade_accepts_numeric():
     enrollment = EnrollmentFactory()
 
-    g = record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, numeric=80)
+    g = record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=80)
 
     assert g.enrollment_id == enrollment.id
     assert g.numeric_value == 80
@@ -39,7 +43,7 @@ def test_record_grade_accepts_numeric():
 def test_record_grade_accepts_letter_and_stores_numeric_max():
     enrollment = EnrollmentFactory()
 
-    g = record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, letter="A")
+    g = record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, letter="A")
 
     assert g.numeric_value == 96  # max of A range
 
@@ -50,8 +54,8 @@ def test_record_grade_rejects_both_numeric_and_letter():
 
     with pytest.raises(InvalidGradeInputError):
         record_grade(
-            student_id=enrollment.student_id,
-            course_id=enrollment.course_id,
+            student_id=enrollment.student.uuid,
+            course_id=enrollment.course.uuid,
             numeric=80,
             letter="B",
         )
@@ -62,7 +66,7 @@ def test_record_grade_rejects_neither_numeric_nor_letter():
     enrollment = EnrollmentFactory()
 
     with pytest.raises(InvalidGradeInputError):
-        record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id)
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid)
 
 
 @pytest.mark.django_db
@@ -70,7 +74,7 @@ def test_record_grade_rejects_out_of_range_numeric():
     enrollment = EnrollmentFactory()
 
     with pytest.raises(InvalidGradeInputError):
-        record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, numeric=101)
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=101)
 
 
 @pytest.mark.django_db
@@ -78,22 +82,22 @@ def test_record_grade_rejects_invalid_letter():
     enrollment = EnrollmentFactory()
 
     with pytest.raises(InvalidLetterGradeError):
-        record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, letter="Z")
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, letter="Z")
 
 
 @pytest.mark.django_db
 def test_get_grades_and_averages():
     enrollment = EnrollmentFactory()
 
-    record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, numeric=80)
-    record_grade(student_id=enrollment.student_id, course_id=enrollment.course_id, numeric=81)
+    record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=80)
+    record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=81)
 
-    assert get_numeric_grades(student_id=enrollment.student_id, course_id=enrollment.course_id) == [80, 81]
-    assert get_letter_grades(student_id=enrollment.student_id, course_id=enrollment.course_id) == ["B-", "B-"]
+    assert get_numeric_grades(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid) == [80, 81]
+    assert get_letter_grades(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid) == ["B-", "B-"]
 
     # average = 80.5 -> must round to nearest integer (half up) => 81
-    assert calculate_numeric_average(student_id=enrollment.student_id, course_id=enrollment.course_id) == 81
-    assert calculate_letter_average(student_id=enrollment.student_id, course_id=enrollment.course_id) == "B-"
+    assert calculate_numeric_average(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid) == 81
+    assert calculate_letter_average(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid) == "B-"
 
 
 @pytest.mark.django_db
@@ -101,4 +105,80 @@ def test_average_requires_at_least_one_grade():
     enrollment = EnrollmentFactory()
 
     with pytest.raises(NoGradesRecordedError):
-        calculate_numeric_average(student_id=enrollment.student_id, course_id=enrollment.course_id)
+        calculate_numeric_average(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid)
+
+
+@pytest.mark.django_db
+def test_record_grades_bulk_inserts_valid_rows_and_reports_errors():
+    enrollment = EnrollmentFactory()
+    other = EnrollmentFactory()
+    stranger = StudentFactory()
+    sid, cid = enrollment.student.uuid, enrollment.course.uuid
+
+    result = record_grades_bulk(
+        [
+            (sid, cid, 80),
+            (str(sid), str(cid), "A"),
+            (stranger.uuid, cid, 90),
+            (sid, cid, 101),
+            (sid, cid, "Z"),
+            (sid, cid, None),
+            (other.student.uuid, other.course.uuid, 70),
+            ("not-a-uuid", cid, 50),
+        ],
+        chunk_size=3,
+    )
+
+    assert result.created == 3
+    assert [(e.row_number, type(e.error)) for e in result.errors] == [
+        (2, StudentNotEnrolledError),
+        (3, InvalidGradeInputError),
+        (4, InvalidLetterGradeError),
+        (5, InvalidGradeInputError),
+        (7, StudentNotEnrolledError),
+    ]
+    assert get_numeric_grades(student_id=sid, course_id=cid) == [80, 96]
+    assert calculate_numeric_average(student_id=sid, course_id=cid) == 88
+    assert calculate_numeric_average(student_id=other.student.uuid, course_id=other.course.uuid) == 70
+
+
+@pytest.mark.django_db
+def test_import_grades_command_streams_csv(tmp_path):
+    enrollment = EnrollmentFactory()
+    path = tmp_path / "grades.csv"
+    path.write_text(
+        "student_id,course_id,grade\n"
+        f"{enrollment.student.uuid},{enrollment.course.uuid},75\n"
+        f"{enrollment.student.uuid},{enrollment.course.uuid},B+\n"
+        f"{enrollment.student.uuid},{enrollment.course.uuid},Q\n"
+    )
+
+    out, err = io.StringIO(), io.StringIO()
+    call_command("import_grades", str(path), "--chunk-size", "2", stdout=out, stderr=err)
+
+    assert "Imported 2 grade(s), 1 error(s)" in out.getvalue()
+    assert "row 3: Invalid letter grade: 'Q'." in err.getvalue()
+    assert get_numeric_grades(
+        student_id=enrollment.student.uuid, course_id=enrollment.course.uuid
+    ) == [75, 89]
+
+
+@pytest.mark.django_db
+def test_import_grades_command_reports_jsonl_lines_that_are_not_objects(tmp_path):
+    enrollment = EnrollmentFactory()
+    path = tmp_path / "grades.jsonl"
+    path.write_text(
+        f'{{"student_id": "{enrollment.student.uuid}", "course_id": "{enrollment.course.uuid}", "grade": 82}}\n'
+        "[1, 2]\n"
+        "5\n"
+    )
+
+    out, err = io.StringIO(), io.StringIO()
+    call_command("import_grades", str(path), stdout=out, stderr=err)
+
+    assert "Imported 1 grade(s), 2 error(s)" in out.getvalue()
+    assert "row 2: Row must be a (student_id, course_id, grade) triple." in err.getvalue()
+    assert "row 3: Row must be a (student_id, course_id, grade) triple." in err.getvalue()
+    assert get_numeric_grades(
+        student_id=enrollment.student.uuid, course_id=enrollment.course.uuid
+    ) == [82]
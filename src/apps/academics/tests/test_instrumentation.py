@@ -0,0 +1,106 @@
+import asyncio
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.academics.domain.exceptions import StudentNotEnrolledError
+from apps.academics.instrumentation import registry
+from apps.academics.services.grades import aget_numeric_grades, arecord_grade, get_numeric_grades, record_grade
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+ENABLED = {"ENABLED": True}
+
+
+@pytest.fixture(autouse=True)
+def _clean_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+@pytest.mark.django_db
+def test_disabled_by_default_records_nothing():
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+    assert registry.snapshot("grades.record_grade") is None
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_INSTRUMENTATION=ENABLED)
+def test_records_calls_and_queries():
+    e = EnrollmentFactory()
+    with CaptureQueriesContext(connection) as ctx:
+        record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=90)
+
+    snapshot = registry.snapshot("grades.record_grade")
+    assert snapshot["calls"] == 2
+    assert snapshot["queries"] == 2 * len(ctx.captured_queries)
+    assert snapshot["seconds"] >= snapshot["db_seconds"] > 0
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_INSTRUMENTATION=ENABLED)
+def test_async_services_record_their_own_queries_even_when_gathered():
+    course = CourseFactory()
+    ids = [EnrollmentFactory(course=course).student.uuid for _ in range(3)]
+
+    async def run():
+        await arecord_grade(student_id=ids[0], course_id=course.uuid, numeric=80)
+        await asyncio.gather(*(aget_numeric_grades(student_id=s, course_id=course.uuid) for s in ids))
+
+    async_to_sync(run)()
+    with CaptureQueriesContext(connection) as ctx:
+        get_numeric_grades(student_id=ids[0], course_id=course.uuid)
+
+    write = registry.snapshot("grades.arecord_grade")
+    assert write["calls"] == 1
+    assert write["queries"] == registry.snapshot("grades.record_grade")["queries"] > 0
+    reads = registry.snapshot("grades.aget_numeric_grades")
+    assert (reads["calls"], reads["queries"]) == (3, 3 * len(ctx.captured_queries))
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_INSTRUMENTATION=ENABLED)
+def test_errors_are_counted_by_exception_type():
+    with pytest.raises(StudentNotEnrolledError):
+        record_grade(student_id=StudentFactory().uuid, course_id=CourseFactory().uuid, numeric=80)
+
+    assert registry.snapshot("grades.record_grade")["calls"] == 1
+    assert (
+        'academics_service_errors_total{service="grades.record_grade",exception="StudentNotEnrolledError"} 1'
+        in registry.render_prometheus()
+    )
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_INSTRUMENTATION={"ENABLED": True, "SLOW_CALL_SECONDS": 0})
+def test_slow_calls_are_logged_with_their_sql(caplog):
+    e = EnrollmentFactory()
+    with caplog.at_level(logging.WARNING, logger="apps.academics.instrumentation"):
+        record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+
+    (message,) = [r.getMessage() for r in caplog.records]
+    assert message.startswith("Slow service call grades.record_grade")
+    assert "academics_grade" in message
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_INSTRUMENTATION=ENABLED)
+def test_metrics_view_renders_prometheus_histograms(client):
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=80)
+
+    response = client.get("/metrics/")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = response.content.decode()
+    assert "# TYPE academics_service_duration_seconds histogram" in body
+    assert 'academics_service_duration_seconds_bucket{service="grades.record_grade",le="+Inf"} 1' in body
+    assert 'academics_service_duration_seconds_count{service="grades.record_grade"} 1' in body
+    assert 'academics_service_db_queries_bucket{service="grades.record_grade",le="0"} 0' in body
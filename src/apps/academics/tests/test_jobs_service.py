@@ -0,0 +1,138 @@
+import io
+import time
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.academics.domain.exceptions import UnknownJobError
+from apps.academics.domain.models import Grade, Job
+from apps.academics.services.grades import record_grade
+from apps.academics.services.jobs import (
+    claim_job,
+    enqueue,
+    enqueue_many,
+    job_counts,
+    renew_lease,
+    requeue_dead_jobs,
+    run_job,
+    run_next_job,
+)
+from apps.academics.tests.factories import EnrollmentFactory
+
+
+@pytest.mark.django_db
+def test_builtin_job_runs_the_service_and_keeps_its_result():
+    e = EnrollmentFactory()
+    record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=91)
+    job = enqueue("course_statistics", {"course_id": e.course.uuid})
+
+    assert run_next_job(worker="w1") == Job.Status.SUCCEEDED
+    assert run_next_job(worker="w1") is None
+
+    job.refresh_from_db()
+    assert (job.status, job.attempts, job.locked_by) == (Job.Status.SUCCEEDED, 1, "")
+    assert job.result["course_id"] == str(e.course.uuid)
+    assert job.result["mean"] == 91
+    with pytest.raises(UnknownJobError):
+        enqueue("no_such_job")
+
+
+@pytest.mark.django_db
+def test_archive_job_reads_a_naive_cutoff_in_the_current_time_zone():
+    e = EnrollmentFactory()
+    grade = record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=70)
+    Grade.objects.filter(pk=grade.pk).update(created_at=timezone.make_aware(datetime(2024, 6, 1)))
+    job = enqueue("archive_grades", {"before": "2025-01-01T00:00:00"})
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", RuntimeWarning)  # naive datetime while time zone support is active
+        assert run_next_job(worker="w1") == Job.Status.SUCCEEDED
+
+    job.refresh_from_db()
+    assert job.result == {"enrollments": 1, "grades": 1}
+    assert not Grade.objects.filter(pk=grade.pk).exists()
+
+
+@pytest.mark.django_db
+def test_failing_job_is_retried_with_backoff_then_dead_lettered(settings):
+    calls = []
+
+    def flaky(*, n):
+        calls.append(n)
+        raise ValueError(f"bad input {n}")
+
+    settings.ACADEMICS_JOBS = {"HANDLERS": {"flaky": flaky}, "RETRY_DELAY": 30}
+    job = enqueue("flaky", {"n": 1}, max_attempts=2)
+
+    assert run_next_job(worker="w1") == Job.Status.QUEUED
+    job.refresh_from_db()
+    assert job.run_after > timezone.now() + timedelta(seconds=25)
+    assert run_next_job(worker="w1") is None  # not due yet
+
+    Job.objects.filter(pk=job.pk).update(run_after=timezone.now())
+    assert run_next_job(worker="w1") == Job.Status.DEAD
+    job.refresh_from_db()
+    assert "ValueError: bad input 1" in job.last_error
+    assert calls == [1, 1]
+    assert job_counts() == {"queued": 0, "running": 0, "succeeded": 0, "dead": 1}
+
+    assert requeue_dead_jobs(name="flaky") == 1
+    job.refresh_from_db()
+    assert (job.status, job.attempts) == (Job.Status.QUEUED, 0)
+
+
+@pytest.mark.django_db
+def test_claims_are_exclusive_and_expired_leases_are_taken_over(settings):
+    settings.ACADEMICS_JOBS = {"HANDLERS": {"noop": lambda: None}, "LEASE_SECONDS": 60}
+    first, second = enqueue_many("noop", [{}, {}], max_attempts=2)
+
+    a, b = claim_job(worker="a"), claim_job(worker="b")
+    assert (a.id, b.id) == (first.id, second.id)
+    assert claim_job(worker="c") is None
+
+    # Worker "a" died: once its lease expires, "c" takes the job over and a's outcome is discarded.
+    Job.objects.filter(pk=a.pk).update(locked_at=timezone.now() - timedelta(minutes=5))
+    taken = claim_job(worker="c")
+    assert (taken.id, taken.attempts) == (first.id, 2)
+    assert run_job(a, worker="a") == Job.Status.SUCCEEDED
+    assert Job.objects.get(pk=a.pk).locked_by == "c"
+
+    # After its last attempt, an expired job is dead-lettered instead of run again.
+    Job.objects.filter(pk=a.pk).update(locked_at=timezone.now() - timedelta(minutes=5))
+    assert claim_job(worker="d") is None
+    assert Job.objects.get(pk=a.pk).status == Job.Status.DEAD
+
+
+@pytest.mark.django_db(transaction=True)
+def test_running_job_renews_its_lease_so_it_is_not_taken_over(settings):
+    # Committed rows (transaction=True): the heartbeat thread has its own connection.
+    def slow():
+        time.sleep(1.0)  # several leases long
+        return claim_job(worker="thief") is None
+
+    settings.ACADEMICS_JOBS = {"HANDLERS": {"slow": slow}, "LEASE_SECONDS": 0.4, "HEARTBEAT_SECONDS": 0.05}
+    job = enqueue("slow")
+
+    assert run_next_job(worker="w1") == Job.Status.SUCCEEDED
+
+    job.refresh_from_db()
+    assert (job.status, job.attempts, job.result) == (Job.Status.SUCCEEDED, 1, True)
+    assert not renew_lease(job_id=job.id, worker="w1")
+
+
+@pytest.mark.django_db
+def test_run_workers_command_drains_the_queue_in_burst_mode():
+    e = EnrollmentFactory()
+    enqueue("record_grades_bulk", {"rows": [[e.student.uuid, e.course.uuid, 70], [e.student.uuid, e.course.uuid, "Z"]]})
+    enqueue("rebuild_grade_stats")
+    out = io.StringIO()
+
+    call_command("run_workers", "--concurrency", "1", "--burst", stdout=out, stderr=io.StringIO())
+
+    assert "Ran 2 job(s)" in out.getvalue()
+    imported = Job.objects.get(name="record_grades_bulk").result
+    assert imported["created"] == 1 and imported["errors"][0]["row_number"] == 1
+    assert e.grades.count() == 1
@@ -0,0 +1,81 @@
+import io
+import json
+from collections import Counter
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.academics.domain.models import Grade
+from apps.academics.management.commands.loadtest import parse_mix, sample_ids, summarize
+from apps.academics.tests.factories import EnrollmentFactory
+
+
+def test_parse_mix_normalises_weights_and_rejects_unknown_operations():
+    assert parse_mix("record_grade=1, build_report_card=3,enroll_student=0") == {
+        "record_grade": 0.25,
+        "build_report_card": 0.75,
+    }
+    with pytest.raises(CommandError):
+        parse_mix("drop_tables=1")
+    with pytest.raises(CommandError):
+        parse_mix("record_grade=0")
+
+
+def test_summarize_reports_percentiles_and_outcome_rates_per_operation():
+    tallies = {
+        "build_report_card": {
+            "latencies": [float(ms) for ms in range(1, 101)],
+            "outcomes": Counter(ok=99, error=1),
+            "errors": Counter(ValueError=1),
+        },
+        "record_grade": {
+            "latencies": [5.0, 7.0],
+            "outcomes": Counter(ok=1, lock_timeout=1, unsent=3),
+            "errors": Counter(),
+        },
+    }
+
+    grades, cards, total = summarize(tallies, duration=2.0)
+
+    assert grades["operation"] == "record_grade"
+    assert (grades["throughput"], grades["lock_timeout_rate"], grades["unsent"]) == (1.0, 0.5, 3)
+    assert (cards["p50_ms"], cards["p95_ms"], cards["p99_ms"]) == (51.0, 95.0, 99.0)
+    assert (cards["error_rate"], cards["errors"]) == (0.01, {"ValueError": 1})
+    assert (total["operation"], total["requests"], total["max_ms"]) == ("total", 102, 100.0)
+
+
+@pytest.mark.django_db
+def test_sample_ids_reads_random_id_ranges_without_sorting_the_tables():
+    enrollments = EnrollmentFactory.create_batch(5)
+
+    with CaptureQueriesContext(connection) as ctx:
+        pairs, students, courses = sample_ids(100, seed=1)
+
+    assert set(pairs) <= {(e.student.uuid, e.course.uuid) for e in enrollments}
+    assert set(students) <= {e.student.uuid for e in enrollments}
+    assert set(courses) <= {e.course.uuid for e in enrollments}
+    assert pairs and students and courses
+    assert sample_ids(100, seed=1) == (pairs, students, courses)
+    assert not [q["sql"] for q in ctx.captured_queries if "RANDOM()" in q["sql"].upper()]
+
+
+@pytest.mark.django_db
+def test_loadtest_drives_the_mix_and_writes_results(tmp_path):
+    enrollments = EnrollmentFactory.create_batch(3)
+    output = tmp_path / "results.json"
+    out = io.StringIO()
+
+    call_command(
+        "loadtest", "--threads", "1", "--duration", "0.3", "--warmup", "0",
+        "--mix", "record_grade=1,build_report_card=1,list_students_for_course=1",
+        "--output", str(output), stdout=out, stderr=io.StringIO(),
+    )
+
+    results = {row["operation"]: row for row in json.loads(output.read_text())["results"]}
+    assert set(results) == {"record_grade", "build_report_card", "list_students_for_course", "total"}
+    assert results["total"]["requests"] > 0
+    assert results["total"]["error_rate"] == results["total"]["lock_timeout_rate"] == 0
+    assert Grade.objects.filter(enrollment__in=enrollments).count() == results["record_grade"]["requests"]
+    assert "list_students_for_course" in out.getvalue()
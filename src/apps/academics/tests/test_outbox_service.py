@@ -0,0 +1,104 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from apps.academics.domain.exceptions import StudentNotEnrolledError
+from apps.academics.domain.models import OutboxEvent, OutboxOffset
+from apps.academics.services.enrollments import enroll_student, enroll_students
+from apps.academics.services.grades import record_grade, record_grades_bulk
+from apps.academics.services.outbox import drain_outbox, pending_events
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+
+@pytest.mark.django_db
+def test_write_services_append_events_only_when_the_write_commits():
+    student, course, other = StudentFactory(), CourseFactory(), CourseFactory()
+
+    enrollment = enroll_student(student_id=student.uuid, course_id=course.uuid)
+    record_grade(student_id=student.uuid, course_id=course.uuid, letter="B")
+    with pytest.raises(StudentNotEnrolledError):
+        record_grade(student_id=student.uuid, course_id=other.uuid, numeric=90)
+    enroll_students([(student.uuid, other.uuid), (student.uuid, course.uuid)])  # second is a duplicate
+    record_grades_bulk([(student.uuid, course.uuid, 70), (student.uuid, other.uuid, 101)])  # second is invalid
+
+    ids = {"student_id": str(student.uuid), "course_id": str(course.uuid)}
+    assert [(e.topic, e.payload) for e in OutboxEvent.objects.order_by("id")] == [
+        ("enrollment.created", {"enrollment_id": str(enrollment.uuid), **ids}),
+        ("grade.recorded", {**ids, "numeric_value": 86}),  # letter B is stored as its max
+        ("enrollment.created", {
+            "enrollment_id": str(student.enrollments.get(course=other).uuid),
+            "student_id": str(student.uuid),
+            "course_id": str(other.uuid),
+        }),
+        ("grade.recorded", {**ids, "numeric_value": 70}),
+    ]
+
+
+@pytest.mark.django_db
+def test_drain_outbox_delivers_in_order_and_redelivers_after_a_failure():
+    enrollment = EnrollmentFactory()
+    for value in range(60, 65):
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=value)
+    batches = []
+
+    def flaky(events):
+        if len(batches) == 1:
+            batches.append(None)
+            raise RuntimeError("downstream unavailable")
+        batches.append([e.payload["numeric_value"] for e in events])
+
+    first = drain_outbox(consumer="analytics", handler=flaky, batch_size=2, max_batches=1)
+    with pytest.raises(RuntimeError):
+        drain_outbox(consumer="analytics", handler=flaky, batch_size=2)
+    assert pending_events(consumer="analytics") == 3
+    last = drain_outbox(consumer="analytics", handler=flaky, batch_size=2)
+
+    assert batches == [[60, 61], None, [62, 63], [64]]
+    assert (first.delivered, last.delivered, last.batches) == (2, 3, 2)
+    assert OutboxOffset.objects.get(consumer="analytics").position == OutboxEvent.objects.latest("id").id
+    assert drain_outbox(consumer="analytics", handler=flaky).delivered == 0
+    # Each consumer has its own position.
+    assert drain_outbox(consumer="other", handler=lambda events: None).delivered == 5
+
+
+@pytest.mark.django_db
+def test_drain_outbox_leaves_events_younger_than_the_settle_time(settings):
+    settings.ACADEMICS_OUTBOX = {"SETTLE_SECONDS": 60}
+    enrollment = EnrollmentFactory()
+    for value in (70, 80):
+        record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=value)
+    OutboxEvent.objects.filter(payload__numeric_value=70).update(created_at=timezone.now() - timedelta(minutes=5))
+    seen = []
+
+    result = drain_outbox(consumer="slow", handler=seen.extend)
+
+    assert [e.payload["numeric_value"] for e in seen] == [70]
+    assert result.position == seen[0].id
+
+
+@pytest.mark.django_db
+def test_drain_outbox_command_isolates_failing_consumers_and_prunes(settings):
+    received = []
+
+    def broken(events):
+        raise RuntimeError("boom")
+
+    settings.ACADEMICS_OUTBOX = {"HANDLERS": {"audit": received.extend, "broken": broken}}
+    enrollment = EnrollmentFactory()
+    record_grade(student_id=enrollment.student.uuid, course_id=enrollment.course.uuid, numeric=75)
+    out, err = io.StringIO(), io.StringIO()
+
+    with pytest.raises(CommandError, match="broken"):
+        call_command("drain_outbox", "--prune", stdout=out, stderr=err)
+    assert len(received) == 1 and "audit: delivered 1 event(s)" in out.getvalue()
+    assert OutboxEvent.objects.count() == 1  # still needed by "broken"
+
+    settings.ACADEMICS_OUTBOX = {"HANDLERS": {"audit": received.extend}}
+    call_command("drain_outbox", "--prune", stdout=out, stderr=err)
+    assert len(received) == 1
+    assert OutboxEvent.objects.count() == 0
+    with pytest.raises(CommandError, match="Unknown consumer"):
+        call_command("drain_outbox", "--consumer", "nope", stdout=out, stderr=err)
@@ -1,6 +1,11 @@
 import pytest
 
-from apps.academics.services.queries import list_courses_for_student, list_students_for_course
+from apps.academics.services.queries import (
+    list_courses_for_student,
+    list_courses_for_student_page,
+    list_students_for_course,
+    list_students_for_course_page,
+)
 from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
 
 
@@ -13,7 +18,7 @@ def test_list_courses_for_student_returns_enrolled_courses():
     EnrollmentFactory(student=student, course=course_b)
     EnrollmentFactory(student=student, course=course_a)
 
-    courses = list_courses_for_student(student_id=student.id)
+    courses = list_courses_for_student(student_id=student.uuid)
 
     assert [c.name for c in courses] == ["Algebra", "Biology"]
 
@@ -27,6 +32,36 @@ def test_list_students_for_course_returns_enrolled_students():
     EnrollmentFactory(student=s2, course=course)
     EnrollmentFactory(student=s1, course=course)
 
-    students = list_students_for_course(course_id=course.id)
+    students = list_students_for_course(course_id=course.uuid)
 
     assert [s.name for s in students] == ["Ana", "Bruno"]
+
+
+@pytest.mark.django_db
+def test_list_students_for_course_page_only_returns_enrolled_students():
+    course = CourseFactory()
+    other = CourseFactory()
+    enrolled = [StudentFactory(name=n) for n in ["Eva", "Ana", "Caio"]]
+    for s in enrolled:
+        EnrollmentFactory(student=s, course=course)
+        EnrollmentFactory(student=s, course=other)
+    EnrollmentFactory(student=StudentFactory(name="Bia"), course=other)
+
+    first = list_students_for_course_page(course_id=course.uuid, page_size=2)
+    second = list_students_for_course_page(course_id=course.uuid, page_size=2, cursor=first.next_cursor)
+
+    assert [s.name for s in first.items] == ["Ana", "Caio"]
+    assert [s.name for s in second.items] == ["Eva"]
+    assert second.next_cursor is None
+
+
+@pytest.mark.django_db
+def test_list_courses_for_student_page():
+    student = StudentFactory()
+    for name in ["Music", "Art", "Latin"]:
+        EnrollmentFactory(student=student, course=CourseFactory(name=name))
+
+    page = list_courses_for_student_page(student_id=student.uuid, page_size=2)
+
+    assert [c.name for c in page.items] == ["Art", "Latin"]
+    assert page.next_cursor is not None
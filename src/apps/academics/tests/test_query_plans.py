@@ -0,0 +1,134 @@
+"""
+Query-plan regression tests for the service layer (SQLite only).
+
+Every SELECT issued by a hot-path service is run through EXPLAIN QUERY PLAN.
+The test fails when SQLite falls back to a full table scan or sorts in a
+temporary B-tree, unless the plan is listed in ALLOWED below with the reason.
+"""
+import re
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.academics.services import (
+    analytics, archival, catalog, enrollments, freshness, grades, jobs, queries, report_cards,
+)
+from apps.academics.services.pagination import encode_cursor
+from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
+
+pytestmark = pytest.mark.skipif(connection.vendor != "sqlite", reason="EXPLAIN QUERY PLAN is SQLite syntax")
+
+FULL_SCAN = "full index scan"
+TEMP_SORT = "temp b-tree"
+
+# service -> plan features it is allowed to use, and why.
+ALLOWED = {
+    # Listing the whole catalog is the purpose of these; they walk the
+    # (name, uuid) index in order, so there is no sort.
+    "list_students": {FULL_SCAN},
+    "list_courses": {FULL_SCAN},
+    # Rosters are found through an enrollment index and then sorted by name;
+    # the sort is bounded by one roster, not by the catalog size.
+    "list_students_for_course": {TEMP_SORT},
+    "list_courses_for_student": {TEMP_SORT},
+    # Averaging the whole institution reads every student, in the order of
+    # the uuid index, so rows stream out without a sort.
+    "overall_averages[all]": {FULL_SCAN},
+    # Window functions sort the graded enrollments of one course.
+    "course_ranking": {TEMP_SORT},
+    # COUNT(DISTINCT average) keeps at most 101 averages in a temp B-tree.
+    "student_rank": {TEMP_SORT},
+    # Maintenance: walks the grade index once to find old grades.
+    "archive_grades": {FULL_SCAN},
+    # Roster pages sort the same single roster (only the rows after the
+    # cursor), and the LIMIT keeps at most page_size + 1 rows in the sorter.
+    # Walking the (name, uuid) index instead would avoid the sort but read
+    # the whole catalog up to the page for a small roster.
+    "list_students_for_course_page": {TEMP_SORT},
+    "list_courses_for_student_page": {TEMP_SORT},
+}
+
+SERVICES = {
+    "record_grade": lambda s, c: grades.record_grade(student_id=s.uuid, course_id=c.uuid, numeric=80),
+    "get_numeric_grades": lambda s, c: grades.get_numeric_grades(student_id=s.uuid, course_id=c.uuid),
+    "calculate_numeric_average": lambda s, c: grades.calculate_numeric_average(student_id=s.uuid, course_id=c.uuid),
+    "record_grades_bulk": lambda s, c: grades.record_grades_bulk([(s.uuid, c.uuid, 70)]),
+    "build_report_card": lambda s, c: report_cards.build_report_card(student_id=s.uuid),
+    "build_report_cards": lambda s, c: report_cards.build_report_cards(student_ids=[s.uuid]),
+    "build_report_cards[archived]": lambda s, c: report_cards.build_report_cards(
+        student_ids=[s.uuid], include_archived=True
+    ),
+    "get_numeric_grades[archived]": lambda s, c: grades.get_numeric_grades(
+        student_id=s.uuid, course_id=c.uuid, include_archived=True
+    ),
+    "overall_averages": lambda s, c: list(report_cards.overall_averages(student_ids=[s.uuid])),
+    "overall_averages[all]": lambda s, c: list(report_cards.overall_averages(student_ids=None)),
+    "archive_grades": lambda s, c: archival.archive_grades(before=timezone.now()),
+    "claim_job": lambda s, c: (
+        jobs.enqueue("course_statistics", {"course_id": c.uuid}), jobs.claim_job(worker="plans")
+    ),
+    "enroll_students": lambda s, c: enrollments.enroll_students([(s.uuid, c.uuid)]),
+    "course_statistics": lambda s, c: analytics.course_statistics(course_id=c.uuid),
+    "course_ranking": lambda s, c: analytics.course_ranking(course_id=c.uuid, limit=10),
+    "student_rank": lambda s, c: analytics.student_rank(course_id=c.uuid, student_id=s.uuid),
+    "report_card_etag": lambda s, c: freshness.report_card_etag(student_id=s.uuid),
+    "course_roster_etag": lambda s, c: freshness.course_roster_etag(course_id=c.uuid),
+    "list_students": lambda s, c: catalog.list_students(),
+    "list_courses": lambda s, c: catalog.list_courses(),
+    "list_students_page": lambda s, c: catalog.list_students_page(
+        page_size=10, cursor=encode_cursor(name=s.name, uuid=s.uuid)
+    ),
+    "list_courses_page": lambda s, c: catalog.list_courses_page(
+        page_size=10, cursor=encode_cursor(name=c.name, uuid=c.uuid)
+    ),
+    "list_students_for_course": lambda s, c: queries.list_students_for_course(course_id=c.uuid),
+    "list_courses_for_student": lambda s, c: queries.list_courses_for_student(student_id=s.uuid),
+    "list_students_for_course_page": lambda s, c: queries.list_students_for_course_page(
+        course_id=c.uuid, page_size=10
+    ),
+    "list_courses_for_student_page": lambda s, c: queries.list_courses_for_student_page(
+        student_id=s.uuid, page_size=10
+    ),
+}
+
+# "SCAN (subquery-N)" reads the rows of a co-routine (e.g. a window
+# function's input), not a table.
+_SCAN_RE = re.compile(r"^SCAN (?!\(subquery-)\S+( USING (COVERING )?INDEX)?")
+
+
+def _plan_features(detail: str) -> set[str]:
+    features = set()
+    match = _SCAN_RE.match(detail)
+    if match:
+        features.add(FULL_SCAN if match.group(1) else "full table scan")
+    if "TEMP B-TREE" in detail:
+        features.add(TEMP_SORT)
+    return features
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("service", sorted(SERVICES))
+def test_service_queries_use_indexes(service):
+    students = [StudentFactory() for _ in range(3)]
+    courses = [CourseFactory() for _ in range(3)]
+    for s in students:
+        for c in courses[:2]:
+            EnrollmentFactory(student=s, course=c)
+            grades.record_grade(student_id=s.uuid, course_id=c.uuid, numeric=90)
+    student, course = students[0], courses[0]
+
+    with CaptureQueriesContext(connection) as ctx:
+        SERVICES[service](student, course)
+
+    selects = [q["sql"] for q in ctx.captured_queries if q["sql"].lstrip().upper().startswith("SELECT")]
+    assert selects, f"{service} issued no SELECT"
+
+    allowed = ALLOWED.get(service, set())
+    for sql in selects:
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            details = [row[-1] for row in cursor.fetchall()]
+        found = set().union(*map(_plan_features, details))
+        assert found <= allowed, f"{service}: {sorted(found - allowed)}\n{sql}\n" + "\n".join(details)
@@ -1,6 +1,22 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
+from django.core.management import CommandError, call_command
 
-from apps.academics.services.report_cards import build_report_card
+from apps.academics.domain.models import Student
+from apps.academics.services import report_cards
+from apps.academics.services.report_cards import (
+    build_report_card,
+    build_report_cards,
+    overall_averages,
+    report_card_chunks,
+)
 from apps.academics.services.grades import record_grade
 from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, StudentFactory
 
@@ -9,9 +25,9 @@ from apps.academics.tests.factories import CourseFactory, EnrollmentFactory, Stu
 def test_build_report_card_empty_when_no_enrollments():
     student = StudentFactory()
 
-    report = build_report_card(student_id=student.id)
+    report = build_report_card(student_id=student.uuid)
 
-    assert report.student_id == student.id
+    assert report.student_id == student.uuid
     assert report.courses == []
 
 
@@ -25,10 +41,10 @@ def test_build_report_card_includes_courses_and_aggregates_grades():
     EnrollmentFactory(student=student, course=course_history)
 
     # Math: 80, 81 => avg 80.5 => 81 => B-
-    record_grade(student_id=student.id, course_id=course_math.id, numeric=80)
-    record_grade(student_id=student.id, course_id=course_math.id, numeric=81)
+    record_grade(student_id=student.uuid, course_id=course_math.uuid, numeric=80)
+    record_grade(student_id=student.uuid, course_id=course_math.uuid, numeric=81)
 
-    report = build_report_card(student_id=student.id)
+    report = build_report_card(student_id=student.uuid)
 
     # Sorted by course name: History, Math
     assert [c.course_name for c in report.courses] == ["History", "Math"]
@@ -39,7 +55,7 @@ def test_build_report_card_includes_courses_and_aggregates_grades():
     assert history.letter_average == "F"
 
     math = report.courses[1]
-    assert math.course_id == e_math.course_id
+    assert math.course_id == e_math.course.uuid
     assert math.numeric_grades == [80, 81]
     assert math.numeric_average == 81
     assert math.letter_average == "B-"
@@ -52,12 +68,220 @@ def test_build_report_card_records_letter_input_as_numeric_max():
     EnrollmentFactory(student=student, course=course)
 
     # "A" => numeric max 96
-    record_grade(student_id=student.id, course_id=course.id, letter="A")
+    record_grade(student_id=student.uuid, course_id=course.uuid, letter="A")
 
-    report = build_report_card(student_id=student.id)
+    report = build_report_card(student_id=student.uuid)
     assert len(report.courses) == 1
 
     c = report.courses[0]
     assert c.numeric_grades == [96]
     assert c.numeric_average == 96
     assert c.letter_average == "A"
+
+
+@pytest.mark.django_db
+def test_build_report_cards_preserves_input_order_and_matches_single_card():
+    s1 = StudentFactory()
+    s2 = StudentFactory()
+    s3 = StudentFactory()
+    course_a = CourseFactory(name="Art")
+    course_b = CourseFactory(name="Biology")
+
+    EnrollmentFactory(student=s1, course=course_b)
+    EnrollmentFactory(student=s1, course=course_a)
+    EnrollmentFactory(student=s2, course=course_a)
+
+    record_grade(student_id=s1.uuid, course_id=course_a.uuid, numeric=70)
+    record_grade(student_id=s1.uuid, course_id=course_b.uuid, numeric=90)
+    record_grade(student_id=s1.uuid, course_id=course_b.uuid, numeric=85)
+    record_grade(student_id=s2.uuid, course_id=course_a.uuid, letter="B")
+
+    cards = build_report_cards(student_ids=[s3.uuid, s1.uuid, s2.uuid])
+
+    assert [c.student_id for c in cards] == [s3.uuid, s1.uuid, s2.uuid]
+    assert cards[0].courses == []
+    assert [c.course_name for c in cards[1].courses] == ["Art", "Biology"]
+    assert cards[1].courses[1].numeric_grades == [90, 85]
+    assert cards[1].courses[1].numeric_average == 88  # 87.5 => 88
+    assert cards[1] == build_report_card(student_id=s1.uuid)
+    assert cards[2] == build_report_card(student_id=s2.uuid)
+
+
+@pytest.mark.django_db
+def test_build_report_cards_query_count_does_not_grow_with_courses_or_students(
+    django_assert_num_queries,
+):
+    students = [StudentFactory() for _ in range(5)]
+    courses = [CourseFactory() for _ in range(4)]
+    for student in students:
+        for course in courses:
+            EnrollmentFactory(student=student, course=course)
+            record_grade(student_id=student.uuid, course_id=course.uuid, numeric=80)
+
+    with django_assert_num_queries(2):
+        cards = build_report_cards(student_ids=[s.uuid for s in students])
+
+    assert all(len(card.courses) == 4 for card in cards)
+
+
+@pytest.mark.django_db
+def test_overall_averages_are_the_mean_of_report_card_averages(django_assert_num_queries):
+    s1, s2, s3 = StudentFactory(), StudentFactory(), StudentFactory()
+    courses = [CourseFactory() for _ in range(3)]
+    for course, values in zip(courses, ([90, 85], [71], [])):  # 88, 71 and ungraded 0
+        EnrollmentFactory(student=s1, course=course)
+        for v in values:
+            record_grade(student_id=s1.uuid, course_id=course.uuid, numeric=v)
+    EnrollmentFactory(student=s2, course=courses[0])
+    record_grade(student_id=s2.uuid, course_id=courses[0].uuid, numeric=80)
+    record_grade(student_id=s2.uuid, course_id=courses[0].uuid, numeric=81)
+
+    with django_assert_num_queries(1):
+        everyone = list(overall_averages())
+
+    by_id = {a.student_id: a for a in everyone}
+    assert [a.student_id for a in everyone] == sorted(by_id)
+    assert (by_id[s1.uuid].course_count, by_id[s1.uuid].numeric_average) == (3, 53)  # 159 / 3
+    assert (by_id[s2.uuid].numeric_average, by_id[s2.uuid].letter_average) == (81, "B-")  # 80.5 => 81
+    assert (by_id[s3.uuid].course_count, by_id[s3.uuid].numeric_average) == (0, None)
+    card = build_report_card(student_id=s1.uuid)
+    assert sum(c.numeric_average for c in card.courses) == 159
+
+    selected = list(overall_averages(student_ids=[s2.uuid, s1.uuid, StudentFactory.build().uuid]))
+    assert selected == [by_id[s2.uuid], by_id[s1.uuid]]
+
+
+@pytest.mark.django_db
+def test_report_card_chunks_cover_every_student_in_id_order():
+    students = sorted((StudentFactory() for _ in range(5)), key=lambda s: str(s.uuid))
+    course = CourseFactory()
+    for i, student in enumerate(students):
+        EnrollmentFactory(student=student, course=course)
+        record_grade(student_id=student.uuid, course_id=course.uuid, numeric=60 + i)
+
+    chunks = list(report_card_chunks(chunk_size=2))
+
+    assert [len(chunk.cards) for chunk in chunks] == [2, 2, 1]
+    assert [(chunk.first_id, chunk.last_id) for chunk in chunks] == [
+        (students[0].uuid, students[1].uuid), (students[2].uuid, students[3].uuid), (students[4].uuid,) * 2
+    ]
+    cards = [card for chunk in chunks for card in chunk.cards]
+    assert cards == build_report_cards(student_ids=[s.uuid for s in students])
+    resumed = list(report_card_chunks(chunk_size=2, after=students[2].uuid))
+    assert [card.student_id for chunk in resumed for card in chunk.cards] == [s.uuid for s in students[3:]]
+
+
+# Run in a fresh interpreter on a file database: spawned workers open their
+# own connection from the settings and cannot see the test's in-memory one.
+PARALLEL_CHUNKS = """
+import json, multiprocessing
+import django
+django.setup()
+from django.core.management import CommandError, call_command
+from apps.academics.services.enrollments import enroll_student
+from apps.academics.services.grades import record_grade
+from apps.academics.services.registration import create_course, create_student
+from apps.academics.services.report_cards import report_card_chunks, report_card_to_dict
+
+call_command("migrate", verbosity=0)
+courses = [create_course(name=f"Course {i}") for i in range(2)]
+for i in range(7):
+    student = create_student(name=f"Student {i}")
+    for course in courses[: 1 + i % 2]:
+        enroll_student(student_id=student.uuid, course_id=course.uuid)
+        record_grade(student_id=student.uuid, course_id=course.uuid, numeric=50 + 7 * i)
+
+def dump(chunk):
+    return [str(chunk.first_id), str(chunk.last_id), [report_card_to_dict(c) for c in chunk.cards]]
+
+serial = [dump(chunk) for chunk in report_card_chunks(chunk_size=3)]
+chunks = report_card_chunks(workers=2, chunk_size=3)
+parallel = [dump(next(chunks))]
+processes = len(multiprocessing.active_children())
+parallel += [dump(chunk) for chunk in chunks]
+print(json.dumps({"serial": serial, "parallel": parallel, "processes": processes}))
+"""
+
+
+def test_report_card_chunks_in_worker_processes_match_the_serial_build(tmp_path):
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "config.settings.local", "SQLITE_PATH": str(tmp_path / "db.sqlite3")}
+    env.pop("SQLITE_REPLICA_PATH", None)
+    result = subprocess.run(
+        [sys.executable, "-c", PARALLEL_CHUNKS],
+        cwd=Path(__file__).resolve().parents[3],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    run = json.loads(result.stdout.splitlines()[-1])
+
+    assert run["processes"] == 2
+    assert [len(cards) for _, _, cards in run["serial"]] == [3, 3, 1]
+    assert run["parallel"] == run["serial"]
+
+
+@pytest.mark.django_db
+def test_export_report_cards_command_writes_jsonl_and_resumes(tmp_path):
+    students = sorted((StudentFactory() for _ in range(3)), key=lambda s: str(s.uuid))
+    course = CourseFactory(name="Math")
+    for student in students:
+        EnrollmentFactory(student=student, course=course)
+        record_grade(student_id=student.uuid, course_id=course.uuid, numeric=90)
+
+    path = tmp_path / "cards.jsonl"
+    call_command("export_report_cards", "--output", str(path), "--chunk-size", "2", stderr=io.StringIO())
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+
+    assert [line["student_id"] for line in lines] == [str(s.uuid) for s in students]
+    assert lines[0]["courses"][0]["letter_average"] == "A-"
+
+    path.write_text(path.read_text().splitlines(keepends=True)[0])
+    call_command("export_report_cards", "--output", str(path), "--after", str(students[0].uuid), stderr=io.StringIO())
+    assert [json.loads(line) for line in path.read_text().splitlines()] == lines
+
+
+def test_export_report_cards_command_rejects_a_malformed_after_before_opening_the_output(tmp_path):
+    path = tmp_path / "cards.jsonl"
+    path.write_text("kept\n")
+
+    with pytest.raises(CommandError, match="--after must be a student uuid"):
+        call_command("export_report_cards", "--output", str(path), "--after", "42", stderr=io.StringIO())
+    assert path.read_text() == "kept\n"
+
+
+@pytest.mark.django_db
+def test_export_report_cards_command_skips_ranges_emptied_while_it_runs(monkeypatch):
+    students = sorted((StudentFactory() for _ in range(5)), key=lambda s: str(s.uuid))
+    in_range = report_cards._report_cards_in_range
+
+    def deleted_meanwhile(first, last, **options):
+        if first == students[2].uuid:
+            Student.objects.filter(uuid__in=[students[2].uuid, students[3].uuid]).delete()
+        return in_range(first, last, **options)
+
+    monkeypatch.setattr(report_cards, "_report_cards_in_range", deleted_meanwhile)
+    out, err = io.StringIO(), io.StringIO()
+    call_command("export_report_cards", "--chunk-size", "2", stdout=out, stderr=err)
+
+    assert [json.loads(line)["student_id"] for line in out.getvalue().splitlines()] == [
+        str(s.uuid) for s in (students[0], students[1], students[4])
+    ]
+    progress = err.getvalue().splitlines()
+    assert progress[1].endswith(f"last id {students[3].uuid}")
+    assert progress[-1].startswith("Exported 3 report card(s)")
+
+
+@pytest.mark.django_db
+def test_export_report_cards_command_writes_csv_rows_per_course():
+    student = StudentFactory()
+    EnrollmentFactory(student=student, course=CourseFactory(name="Art"))
+    EnrollmentFactory(student=student, course=CourseFactory(name="Biology"))
+    record_grade(student_id=student.uuid, course_id=student.enrollments.first().course.uuid, numeric=80)
+
+    out = io.StringIO()
+    call_command("export_report_cards", "--format", "csv", stdout=out, stderr=io.StringIO())
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+
+    assert [r["course_name"] for r in rows] == ["Art", "Biology"]
+    assert {r["student_id"] for r in rows} == {str(student.uuid)}
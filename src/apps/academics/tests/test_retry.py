@@ -0,0 +1,72 @@
+import pytest
+from django.db import OperationalError, connection, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.test import override_settings
+
+from apps.academics.retry import retry_on_db_lock
+from config.settings.base import SQLITE_OPTIONS, SQLITE_PRAGMAS
+
+NO_DELAY = {"ATTEMPTS": 3, "BASE_DELAY": 0}
+
+
+def _failing(*errors):
+    calls = []
+
+    @retry_on_db_lock
+    def write():
+        calls.append(1)
+        if len(calls) <= len(errors):
+            raise errors[len(calls) - 1]
+        return "ok"
+
+    return write, calls
+
+
+@override_settings(ACADEMICS_DB_RETRY=NO_DELAY)
+def test_lock_errors_are_retried_until_success():
+    write, calls = _failing(OperationalError("database is locked"), OperationalError("database is locked"))
+
+    assert write() == "ok"
+    assert len(calls) == 3
+
+
+@override_settings(ACADEMICS_DB_RETRY=NO_DELAY)
+def test_gives_up_after_the_configured_attempts():
+    write, calls = _failing(*[OperationalError("database is locked")] * 3)
+
+    with pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 3
+
+
+@override_settings(ACADEMICS_DB_RETRY=NO_DELAY)
+def test_other_operational_errors_are_not_retried():
+    write, calls = _failing(OperationalError("no such table: academics_grade"))
+
+    with pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+@override_settings(ACADEMICS_DB_RETRY=NO_DELAY)
+def test_nothing_is_retried_inside_an_outer_transaction():
+    write, calls = _failing(OperationalError("database is locked"))
+
+    with transaction.atomic(), pytest.raises(OperationalError):
+        write()
+    assert len(calls) == 1
+
+
+@pytest.mark.django_db
+def test_sqlite_profile_is_applied_on_connect(tmp_path):
+    settings_dict = {**connection.settings_dict, "NAME": str(tmp_path / "tuned.sqlite3"), "OPTIONS": SQLITE_OPTIONS}
+    wrapper = DatabaseWrapper(settings_dict, alias="tuned")
+    try:
+        with wrapper.cursor() as cursor:
+            for pragma in ("journal_mode", "mmap_size", "cache_size", "busy_timeout"):
+                cursor.execute(f"PRAGMA {pragma}")
+                assert str(cursor.fetchone()[0]) == str(SQLITE_PRAGMAS[pragma])
+        assert wrapper.transaction_mode == "IMMEDIATE"
+    finally:
+        wrapper.close()
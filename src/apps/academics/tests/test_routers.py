@@ -0,0 +1,87 @@
+import io
+import sqlite3
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connections
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.academics.domain.models import Student
+from apps.academics.routers import EVENTUAL, STRONG, ReplicaRouter, read_consistency
+from apps.academics.services.catalog import list_courses
+from apps.academics.services.grades import record_grade
+from apps.academics.services.queries import list_students_for_course
+from apps.academics.services.report_cards import build_report_card, build_report_cards
+from apps.academics.tests.factories import EnrollmentFactory
+
+router = ReplicaRouter()
+with_replica = override_settings(ACADEMICS_READ_REPLICA="replica")
+
+
+@with_replica
+def test_reads_go_to_the_replica_only_with_eventual_consistency():
+    assert router.db_for_read(Student) is None
+    with read_consistency(EVENTUAL):
+        assert router.db_for_read(Student) == "replica"
+        with read_consistency(STRONG):
+            assert router.db_for_read(Student) is None
+    assert router.db_for_write(Student) == "default"
+
+
+def test_without_a_replica_everything_stays_on_the_primary():
+    with read_consistency(EVENTUAL):
+        assert router.db_for_read(Student) is None
+    assert router.allow_migrate("default", "academics")
+
+
+def test_unknown_consistency_is_rejected():
+    with pytest.raises(ValueError):
+        with read_consistency("sometimes"):
+            pass
+
+
+@pytest.mark.django_db
+@with_replica
+def test_reads_inside_a_transaction_stay_on_the_primary():
+    # pytest-django wraps this test in a transaction on the primary.
+    with read_consistency(EVENTUAL):
+        assert router.db_for_read(Student) is None
+
+
+@pytest.mark.django_db(transaction=True, databases=["default", "replica"])
+@with_replica
+def test_read_services_use_the_replica_and_writes_the_primary():
+    e = EnrollmentFactory()
+
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        record_grade(student_id=e.student.uuid, course_id=e.course.uuid, numeric=75)
+        build_report_card(student_id=e.student.uuid)
+        list_students_for_course(course_id=e.course.uuid, consistency=STRONG)
+    assert replica.captured_queries == []
+
+    with CaptureQueriesContext(connections["replica"]) as replica:
+        assert [s.uuid for s in list_students_for_course(course_id=e.course.uuid)] == [e.student.uuid]
+        assert [c.id for c in list_courses()] == [e.course.uuid]
+        (card,) = build_report_cards(student_ids=[e.student.uuid])
+    assert len(replica.captured_queries) == 4
+    assert card.courses[0].numeric_grades == [75]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_refresh_sqlite_replica_writes_a_read_only_snapshot(tmp_path):
+    e = EnrollmentFactory()
+    replica = tmp_path / "replica.sqlite3"
+
+    with override_settings(SQLITE_REPLICA_PATH=str(replica)):
+        call_command("refresh_sqlite_replica", stdout=io.StringIO())
+
+    with sqlite3.connect(f"file:{replica}?mode=ro", uri=True) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone() == ("delete",)
+        (name,) = conn.execute("SELECT name FROM academics_student").fetchone()
+    assert name == e.student.name
+
+
+def test_refresh_sqlite_replica_requires_a_path():
+    with pytest.raises(CommandError):
+        call_command("refresh_sqlite_replica")
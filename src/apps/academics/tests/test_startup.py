@@ -0,0 +1,101 @@
+"""
+Start-up regression tests: what a batch process imports before doing work.
+
+Each case boots Django in a fresh interpreter and checks sys.modules, which
+is deterministic where wall time is not. Run python -m benchmarks.startup
+for the timings, RSS and an -X importtime breakdown.
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[3]
+
+# What run_workers and drain_outbox import before their first query.
+WORKER_BOOT = (
+    "import django; django.setup(); "
+    "import apps.academics.services.jobs, apps.academics.services.outbox"
+)
+
+# Web stack and optional heavy modules no batch process needs at start.
+NOT_IN_BATCH = (
+    "django.contrib.admin",
+    "django.contrib.auth",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.staticfiles",
+    "apps.academics.views",
+    "apps.academics.services.analytics",
+    "apps.academics.services.report_cards",
+    "concurrent.futures.process",
+    "numpy",
+)
+
+
+def _imported_modules(code: str, settings_module: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}; import json, sys; print(json.dumps(sorted(sys.modules)))"],
+        cwd=SRC,
+        env={**os.environ, "DJANGO_SETTINGS_MODULE": settings_module},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+@pytest.fixture(scope="module")
+def worker_imports():
+    return {
+        profile: _imported_modules(WORKER_BOOT, f"config.settings.{profile}")
+        for profile in ("batch", "local")
+    }
+
+
+def test_batch_profile_boots_without_the_web_stack(worker_imports):
+    batch = worker_imports["batch"]
+
+    assert sorted(m for m in batch if m.startswith(NOT_IN_BATCH)) == []
+    assert "apps.academics.domain.models" in batch
+    # The full profile pays for the web stack on every command.
+    assert "django.contrib.admin" in worker_imports["local"]
+    assert len(batch) < len(worker_imports["local"]) * 0.9
+
+
+def test_services_package_imports_submodules_on_first_use():
+    modules = _imported_modules(
+        "import django; django.setup(); "
+        "import apps.academics.services as services; services.outbox.publish",
+        "config.settings.batch",
+    )
+
+    assert "apps.academics.services.outbox" in modules
+    assert "apps.academics.services.grades" not in modules
+
+
+def test_batch_profile_layers_on_the_settings_named_in_the_environment():
+    result = subprocess.run(
+        [
+            sys.executable, "-c",
+            "import json; from django.conf import settings; "
+            "print(json.dumps([settings.DATABASES['default']['ENGINE'], settings.DEBUG, settings.INSTALLED_APPS]))",
+        ],
+        cwd=SRC,
+        env={
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": "config.settings.batch",
+            "BATCH_BASE_SETTINGS": "config.settings.prod",
+            **{name: "academics" for name in ("DB_NAME", "DB_USER", "DB_PASSWORD", "DB_HOST")},
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    engine, debug, apps = json.loads(result.stdout)
+    assert (engine, debug) == ("django.db.backends.postgresql", False)
+    assert apps == ["apps.academics.apps.AcademicsConfig"]
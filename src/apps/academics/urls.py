@@ -0,0 +1,13 @@
+from django.urls import path
+
+from apps.academics import views
+
+app_name = "academics"
+
+urlpatterns = [
+    path("students/", views.students, name="students"),
+    path("students/<uuid:student_id>/report-card/", views.report_card, name="report-card"),
+    path("students/<uuid:student_id>/courses/", views.student_courses, name="student-courses"),
+    path("courses/", views.courses, name="courses"),
+    path("courses/<uuid:course_id>/students/", views.course_students, name="course-students"),
+]
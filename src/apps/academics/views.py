@@ -0,0 +1,98 @@
+import json
+from functools import wraps
+from operator import attrgetter
+
+from django.http import HttpResponse
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, conditional_page, require_GET
+
+from apps.academics.domain.exceptions import DomainError, InvalidPageSizeError
+from apps.academics.instrumentation import registry
+from apps.academics.services.catalog import list_courses_page, list_students_page
+from apps.academics.services.freshness import course_roster_etag, report_card_etag, student_courses_etag
+from apps.academics.services.queries import list_courses_for_student_page, list_students_for_course_page
+from apps.academics.services.report_cards import build_report_card, report_card_to_dict
+
+DEFAULT_PAGE_SIZE = 50
+
+
+@require_GET
+def metrics(request):
+    """
+    Service-layer metrics of this process in Prometheus text exposition format.
+    """
+    return HttpResponse(registry.render_prometheus(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+def _json(payload, *, status: int = 200) -> HttpResponse:
+    body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return HttpResponse(body, content_type="application/json", status=status)
+
+
+def _api(view):
+    """
+    GET-only JSON endpoint; domain errors become 400 responses.
+    Clients must revalidate (If-None-Match) before reusing a response.
+    """
+
+    @require_GET
+    @cache_control(private=True, no_cache=True)
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        try:
+            return view(request, *args, **kwargs)
+        except DomainError as exc:
+            return _json({"error": type(exc).__name__, "detail": str(exc)}, status=400)
+
+    return wrapper
+
+
+def _page_params(request) -> dict:
+    raw = request.GET.get("page_size", DEFAULT_PAGE_SIZE)
+    try:
+        page_size = int(raw)
+    except (TypeError, ValueError):
+        raise InvalidPageSizeError(page_size=raw)
+    return {"page_size": page_size, "cursor": request.GET.get("cursor") or None}
+
+
+def _page_json(page, *, public_id=attrgetter("id")) -> HttpResponse:
+    return _json({
+        "items": [{"id": str(public_id(item)), "name": item.name} for item in page.items],
+        "next_cursor": page.next_cursor,
+    })
+
+
+# Catalog pages change with any new student or course; their ETag is a hash
+# of the body, which saves the transfer but not the (cheap) query.
+
+@_api
+@conditional_page
+def students(request):
+    return _page_json(list_students_page(**_page_params(request)))
+
+
+@_api
+@conditional_page
+def courses(request):
+    return _page_json(list_courses_page(**_page_params(request)))
+
+
+@_api
+@condition(etag_func=lambda request, student_id: report_card_etag(student_id=student_id))
+def report_card(request, student_id):
+    return _json(report_card_to_dict(build_report_card(student_id=student_id)))
+
+
+@_api
+@condition(etag_func=lambda request, student_id: student_courses_etag(student_id=student_id))
+def student_courses(request, student_id):
+    page = list_courses_for_student_page(student_id=student_id, **_page_params(request))
+    return _page_json(page, public_id=attrgetter("uuid"))
+
+
+@_api
+@condition(etag_func=lambda request, course_id: course_roster_etag(course_id=course_id))
+def course_students(request, course_id):
+    page = list_students_for_course_page(course_id=course_id, **_page_params(request))
+    return _page_json(page, public_id=attrgetter("uuid"))
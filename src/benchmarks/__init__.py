@@ -0,0 +1,28 @@
+"""
+Benchmarks for the academics domain and services.
+
+Run them from the src/ directory, e.g.:
+
+    python -m benchmarks.bench_grade_scale
+    python -m benchmarks.seed --students 100000 --courses 2000 --grades 10000000
+    python -m benchmarks.services --sizes 1000:50:20000,10000:200:200000
+    python -m benchmarks.concurrency --writers 4 --readers 4
+    python -m benchmarks.storage before.sqlite3 after.sqlite3
+
+Database benchmarks use DJANGO_SETTINGS_MODULE (default: config.settings.local)
+and therefore SQLITE_PATH; point it at a scratch file, not a real database.
+"""
+import os
+
+
+def setup_django(settings_module: str = "config.settings.local") -> None:
+    """
+    Configure Django for a standalone benchmark script and apply migrations.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
@@ -0,0 +1,76 @@
+"""
+Sync vs async report-card fetching for a dashboard of many students.
+
+    python -m benchmarks.async_services --students 200 --repeat 5
+
+Builds the same report cards (read-through cache disabled) in four ways:
+
+- sync:        build_report_card per student, one after another
+- async:       abuild_report_card per student, all awaited with asyncio.gather
+- sync batch:  one build_report_cards call
+- async batch: one abuild_report_cards call
+
+Django runs async ORM queries in its single sync thread, so gather overlaps
+the Python-side work of the calls, not their SQL; the batch calls show what
+a fixed number of queries per batch buys on top.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+
+def _best_of(fn, repeat: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.fmean(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    from benchmarks import setup_django
+
+    setup_django()
+    from django.conf import settings
+
+    from apps.academics.domain.models import Student
+    from apps.academics.services.report_cards import (
+        abuild_report_card,
+        abuild_report_cards,
+        build_report_card,
+        build_report_cards,
+    )
+
+    settings.ACADEMICS_CACHE = {"ENABLED": False}
+    ids = list(Student.objects.values_list("uuid", flat=True)[:50_000])
+    if not ids:
+        raise SystemExit("The database has no students; seed it first (python -m benchmarks.seed).")
+    sample = random.Random(0).sample(ids, min(args.students, len(ids)))
+
+    async def gather_cards():
+        return await asyncio.gather(*(abuild_report_card(student_id=sid) for sid in sample))
+
+    cases = {
+        "sync": lambda: [build_report_card(student_id=sid) for sid in sample],
+        "async": lambda: asyncio.run(gather_cards()),
+        "sync batch": lambda: build_report_cards(student_ids=sample),
+        "async batch": lambda: asyncio.run(abuild_report_cards(student_ids=sample)),
+    }
+    print(f"{len(sample)} report cards, best/mean of {args.repeat}:")
+    for name, fn in cases.items():
+        best, mean = _best_of(fn, args.repeat)
+        print(f"  {name:12s} {best * 1000:9.1f}ms  {mean * 1000:9.1f}ms  {len(sample) / best:9.0f} cards/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark: compiled grade-scale lookups vs the original linear scan.
+
+    python -m benchmarks.bench_grade_scale [--size N] [--repeat R]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+
+from apps.academics.domain.grade_scale import (
+    GRADE_SCALE,
+    letter_to_numeric_max,
+    letters_to_numeric,
+    numeric_to_letter,
+    numeric_to_letters,
+)
+
+
+def legacy_numeric_to_letter(value: int) -> str:
+    if not isinstance(value, int):
+        raise TypeError("Numeric grade must be an integer.")
+    if value < 0 or value > 100:
+        raise ValueError("Numeric grade must be between 0 and 100 (inclusive).")
+    for r in GRADE_SCALE:
+        if r.min_value <= value <= r.max_value:
+            return r.letter
+    raise ValueError(f"Numeric grade {value} does not match any letter range.")
+
+
+def legacy_letter_to_numeric_max(letter: str) -> int:
+    normalized = letter.strip().upper()
+    for r in GRADE_SCALE:
+        if r.letter == normalized:
+            return r.max_value
+    raise ValueError(f"Unknown letter grade: {letter!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    values = [rng.randint(0, 100) for _ in range(args.size)]
+    letters = [r.letter for r in rng.choices(GRADE_SCALE, k=args.size)]
+
+    cases = {
+        "numeric->letter legacy loop": lambda: [legacy_numeric_to_letter(v) for v in values],
+        "numeric->letter compiled": lambda: [numeric_to_letter(v) for v in values],
+        "numeric->letter batch list": lambda: numeric_to_letters(values),
+        "letter->numeric legacy loop": lambda: [legacy_letter_to_numeric_max(l) for l in letters],
+        "letter->numeric compiled": lambda: [letter_to_numeric_max(l) for l in letters],
+        "letter->numeric batch list": lambda: letters_to_numeric(letters),
+    }
+
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    if np is not None:
+        values_array = np.array(values)
+        letters_array = np.array(letters)
+        cases["numeric->letter batch numpy"] = lambda: numeric_to_letters(values_array)
+        cases["letter->numeric batch numpy"] = lambda: letters_to_numeric(letters_array)
+
+    print(f"{args.size} values, best of {args.repeat}")
+    for name, fn in cases.items():
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        print(f"{name:32s} {best * 1000:9.2f} ms  {args.size / best / 1e6:8.2f} M values/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Concurrent read/write throughput of the SQLite database, per tuning profile.
+
+    python -m benchmarks.seed --students 5000 --courses 100 --grades 200000
+    python -m benchmarks.concurrency --writers 4 --readers 4 --seconds 10
+
+Each worker is a separate process (like separate gunicorn workers) with its
+own connection. Writers call record_grade and readers call
+build_report_cards (uncached) on random enrollments. The same run is repeated
+with SQLITE_TUNING=off (SQLite defaults, rollback journal) and with the tuned
+profile from config.settings.base, and the two are compared.
+
+With SQLITE_REPLICA_PATH set, reads go to the replica snapshot (refresh it
+first with `manage.py refresh_sqlite_replica`).
+
+Writers modify the database: point SQLITE_PATH at a scratch file.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import time
+
+PROFILES = {
+    # profile -> (SQLITE_TUNING, journal mode the file is switched to before the run)
+    "default": ("off", "delete"),
+    "tuned": ("on", "wal"),
+}
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _worker(role: str, pairs: list[tuple[str, str]], seconds: float, seed: int, start, results) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
+    import django
+
+    django.setup()
+    from django.db import OperationalError
+
+    from apps.academics.services.grades import record_grade
+    from apps.academics.services.report_cards import build_report_cards
+
+    rng = random.Random(seed)
+
+    if role == "writer":
+        def op(student_id, course_id):
+            record_grade(student_id=student_id, course_id=course_id, numeric=rng.randint(0, 100))
+    else:
+        def op(student_id, course_id):
+            build_report_cards(student_ids=[student_id])
+
+    ops, errors, latencies = 0, 0, []
+    start.wait()
+    deadline = time.perf_counter() + seconds
+    while (now := time.perf_counter()) < deadline:
+        try:
+            op(*rng.choice(pairs))
+            ops += 1
+            latencies.append((time.perf_counter() - now) * 1000)
+        except OperationalError:
+            # Still locked after busy_timeout and every retry.
+            errors += 1
+    results.put((role, ops, errors, latencies))
+
+
+def run_profile(profile: str, *, pairs, writers: int, readers: int, seconds: float, database: str) -> dict:
+    tuning, journal_mode = PROFILES[profile]
+    with sqlite3.connect(database) as conn:
+        conn.execute(f"PRAGMA journal_mode={journal_mode}")
+
+    os.environ["SQLITE_TUNING"] = tuning
+    ctx = multiprocessing.get_context("spawn")
+    start, results = ctx.Event(), ctx.Queue()
+    roles = ["writer"] * writers + ["reader"] * readers
+    processes = [
+        ctx.Process(target=_worker, args=(role, pairs, seconds, seed, start, results))
+        for seed, role in enumerate(roles)
+    ]
+    for p in processes:
+        p.start()
+    time.sleep(2)  # let every worker import Django before the clock starts
+    start.set()
+    collected = [results.get() for _ in processes]
+    for p in processes:
+        p.join()
+
+    summary = {"profile": profile, "writers": writers, "readers": readers, "seconds": seconds}
+    for role in ("writer", "reader"):
+        mine = [r for r in collected if r[0] == role]
+        latencies = sorted(ms for r in mine for ms in r[3])
+        summary[f"{role}s_ops_per_s"] = sum(r[1] for r in mine) / seconds
+        summary[f"{role}_errors"] = sum(r[2] for r in mine)
+        summary[f"{role}_p95_ms"] = _percentile(latencies, 95)
+    return summary
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--profile", action="append", choices=sorted(PROFILES), help="default: all")
+    parser.add_argument("--output", help="write JSON results to this file")
+    args = parser.parse_args()
+
+    from benchmarks import setup_django
+
+    setup_django()
+    from django.db import connection
+
+    from apps.academics.domain.models import Enrollment
+
+    database = str(connection.settings_dict["NAME"])
+    pairs = [
+        (str(s), str(c)) for s, c in Enrollment.objects.values_list("student__uuid", "course__uuid")[:20_000]
+    ]
+    connection.close()
+    if not pairs:
+        raise SystemExit("The database has no enrollments; seed it first (python -m benchmarks.seed).")
+
+    results = []
+    for profile in args.profile or ["default", "tuned"]:
+        r = run_profile(
+            profile, pairs=pairs, writers=args.writers, readers=args.readers,
+            seconds=args.seconds, database=database,
+        )
+        results.append(r)
+        print(
+            f"{profile:8s} writes {r['writers_ops_per_s']:8.1f}/s (p95 {r['writer_p95_ms']:7.2f}ms, "
+            f"{r['writer_errors']} errors)  reads {r['readers_ops_per_s']:8.1f}/s "
+            f"(p95 {r['reader_p95_ms']:7.2f}ms, {r['reader_errors']} errors)"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
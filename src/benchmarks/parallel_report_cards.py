@@ -0,0 +1,59 @@
+"""
+Speedup curve of parallel report-card generation (report_card_chunks).
+
+    python -m benchmarks.parallel_report_cards --workers 1,2,4,8 --repeat 3
+
+Builds every student's report card once per worker count and prints the
+throughput, the speedup over the first worker count (normally 1) and the
+parallel efficiency (speedup per added worker). Each run includes starting
+the worker processes, as a real export does. Worker counts above
+os.cpu_count() are still run, but cannot scale: they only show the cost of
+oversubscription.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    cpus = os.cpu_count() or 1
+    default_workers = ",".join(str(n) for n in (1, 2, 4, 8, 16) if n <= cpus) or "1"
+    parser.add_argument("--workers", default=default_workers, help="comma-separated worker counts")
+    parser.add_argument("--chunk-size", type=int, default=None, help="students per range (default: service default)")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    from benchmarks import setup_django
+
+    setup_django()
+    from apps.academics.domain.models import Student
+    from apps.academics.services.report_cards import REPORT_CARD_BATCH_SIZE, report_card_chunks
+
+    students = Student.objects.count()
+    if not students:
+        raise SystemExit("The database has no students; seed it first (python -m benchmarks.seed).")
+    chunk_size = args.chunk_size or REPORT_CARD_BATCH_SIZE
+
+    print(f"{students} report cards, {chunk_size} students per range, {cpus} CPU(s), best of {args.repeat}:")
+    baseline = None
+    for workers in (int(n) for n in args.workers.split(",")):
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            built = sum(len(chunk.cards) for chunk in report_card_chunks(workers=workers, chunk_size=chunk_size))
+            timings.append(time.perf_counter() - started)
+            assert built == students, (built, students)
+        best = min(timings)
+        baseline = baseline or (best, workers)
+        speedup = baseline[0] / best
+        print(
+            f"  {workers:3d} worker(s) {best:8.2f}s {students / best:9.0f} cards/s "
+            f"speedup x{speedup:5.2f}  efficiency {speedup * baseline[1] / workers:4.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
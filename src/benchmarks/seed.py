@@ -0,0 +1,276 @@
+"""
+Fast synthetic data generator for benchmarks.
+
+    python -m benchmarks.seed --students 100000 --courses 2000 --grades 10000000
+
+Rows are written with executemany in large batches (no per-row factories or
+model saves). The data is skewed the way real schools are: a few courses are
+far more popular than the rest (Zipf-like), students take a variable number
+of courses, and grades per enrollment follow a long-tailed distribution.
+Enrollment grade aggregates are written together with the grades, so the
+seeded database is consistent with what the services maintain. Integer ids
+are assigned here (after the current maximum), so foreign keys are written
+without reading anything back.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from functools import partial
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+
+FIRST_NAMES = (
+    "Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela", "Hugo", "Isabela",
+    "João", "Karina", "Lucas", "Marina", "Nicolas", "Olivia", "Pedro", "Rafaela", "Sofia",
+)
+LAST_NAMES = (
+    "Almeida", "Barbosa", "Costa", "Dias", "Ferreira", "Gomes", "Lima", "Martins",
+    "Oliveira", "Pereira", "Rocha", "Santos", "Silva", "Souza",
+)
+SUBJECTS = (
+    "Algebra", "Biology", "Chemistry", "Economics", "Geography", "History", "Literature",
+    "Music", "Philosophy", "Physics", "Programming", "Statistics",
+)
+
+TERM_START = datetime(2025, 2, 1, tzinfo=timezone.utc)
+TERM_SECONDS = 120 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class SeedSummary:
+    students: int
+    courses: int
+    enrollments: int
+    grades: int
+    seconds: float
+
+
+class _BulkWriter:
+    """
+    Buffers rows for one model and flushes them with a single executemany.
+    """
+
+    def __init__(self, model, columns: list[str], batch_size: int):
+        from django.db import DEFAULT_DB_ALIAS, connections, models
+
+        # The concrete connection, not the thread-local proxy: add() is hot.
+        connection = connections[DEFAULT_DB_ALIAS]
+        fields = [model._meta.get_field(name) for name in columns]
+        quote = connection.ops.quote_name
+        self.sql = "INSERT INTO {} ({}) VALUES ({})".format(
+            quote(model._meta.db_table),
+            ", ".join(quote(f.column) for f in fields),
+            ", ".join(["%s"] * len(fields)),
+        )
+        self.preps = [
+            None if isinstance(f, models.IntegerField) else partial(f.get_db_prep_save, connection=connection)
+            for f in fields
+        ]
+        self.connection = connection
+        self.batch_size = batch_size
+        self.rows: list[tuple] = []
+        self.written = 0
+
+    def add(self, *values) -> None:
+        self.rows.append(
+            tuple(v if prep is None or v is None else prep(v) for prep, v in zip(self.preps, values))
+        )
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.rows:
+            with self.connection.cursor() as cursor:
+                cursor.executemany(self.sql, self.rows)
+            self.written += len(self.rows)
+            self.rows = []
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    # Seeded (reproducible) and much cheaper than uuid4()'s os.urandom call.
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _next_id(model) -> int:
+    from django.db.models import Max
+
+    return (model.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+
+
+def _reset_sequences(models) -> None:
+    # Explicit ids do not advance the id sequences of every backend (PostgreSQL).
+    from django.core.management.color import no_style
+    from django.db import connection
+
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def _zipf_weights(n: int, s: float) -> list[float]:
+    return list(accumulate(1.0 / (rank ** s) for rank in range(1, n + 1)))
+
+
+def _pick_distinct(rng: random.Random, population: list, cum_weights: list[float], k: int) -> list:
+    picked: dict = {}
+    attempts = 0
+    while len(picked) < k and attempts < k * 10:
+        item = rng.choices(population, cum_weights=cum_weights)[0]
+        picked[item] = None
+        attempts += 1
+    return list(picked)
+
+
+def seed(
+    *,
+    students: int,
+    courses: int,
+    grades: int,
+    courses_per_student: tuple[int, int] = (3, 8),
+    popularity_skew: float = 1.1,
+    random_seed: int = 0,
+    batch_size: int = 10_000,
+    progress=None,
+) -> SeedSummary:
+    """
+    Insert a synthetic dataset; `grades` is an approximate total.
+
+    Existing rows are left untouched (call clear() first for a fresh dataset).
+    """
+    from django.db import transaction
+
+    from apps.academics.domain.models import Course, Enrollment, Grade, Student
+
+    rng = random.Random(random_seed)
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc)
+
+    first_course, first_student = _next_id(Course), _next_id(Student)
+    next_enrollment = _next_id(Enrollment)
+    course_ids = list(range(first_course, first_course + courses))
+    student_ids = list(range(first_student, first_student + students))
+    low, high = courses_per_student
+    mean_courses = (min(low, courses) + min(high, courses)) / 2
+    mean_grades = grades / max(1.0, students * mean_courses)
+    course_weights = _zipf_weights(courses, popularity_skew)
+
+    with transaction.atomic():
+        course_writer = _BulkWriter(Course, ["id", "uuid", "name", "created_at", "updated_at"], batch_size)
+        for i, course_id in enumerate(course_ids):
+            course_writer.add(course_id, _uuid(rng), f"{rng.choice(SUBJECTS)} {i + 1}", now, now)
+        course_writer.flush()
+
+        student_writer = _BulkWriter(Student, ["id", "uuid", "name", "created_at", "updated_at"], batch_size)
+        for student_id in student_ids:
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {rng.randrange(10_000):04d}"
+            student_writer.add(student_id, _uuid(rng), name, now, now)
+        student_writer.flush()
+
+    enrollment_writer = _BulkWriter(
+        Enrollment,
+        ["id", "uuid", "student", "course", "grade_count", "grade_sum", "last_grade_value",
+         "last_graded_at", "created_at", "updated_at"],
+        batch_size,
+    )
+    grade_writer = _BulkWriter(
+        Grade, ["enrollment", "numeric_value", "created_at", "updated_at"], batch_size
+    )
+
+    # Commit in slices so a large seed never holds one huge transaction.
+    for start in range(0, students, 1000):
+        with transaction.atomic():
+            for student_id in student_ids[start:start + 1000]:
+                # A per-student ability shifts all of their grades.
+                ability = rng.gauss(75, 10)
+                k = rng.randint(min(low, courses), min(high, courses))
+                for course_id in _pick_distinct(rng, course_ids, course_weights, k):
+                    enrollment_id = next_enrollment
+                    next_enrollment += 1
+                    count = int(rng.expovariate(1 / mean_grades) + 0.5) if mean_grades else 0
+                    offsets = sorted(rng.random() * TERM_SECONDS for _ in range(count))
+                    values = [max(0, min(100, int(rng.gauss(ability, 8)))) for _ in range(count)]
+                    last_at = TERM_START + timedelta(seconds=offsets[-1]) if count else None
+
+                    enrollment_writer.add(
+                        enrollment_id, _uuid(rng), student_id, course_id, count, sum(values),
+                        values[-1] if count else None, last_at, TERM_START, TERM_START,
+                    )
+                    for offset, value in zip(offsets, values):
+                        at = TERM_START + timedelta(seconds=offset)
+                        grade_writer.add(enrollment_id, value, at, at)
+            enrollment_writer.flush()
+            grade_writer.flush()
+        if progress:
+            progress(min(start + 1000, students), students, grade_writer.written)
+    _reset_sequences([Course, Student, Enrollment])
+
+    return SeedSummary(
+        students=students,
+        courses=courses,
+        enrollments=enrollment_writer.written,
+        grades=grade_writer.written,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def clear() -> None:
+    """
+    Delete every academics row (children first, without per-row cascades).
+    """
+    from django.db import connection, transaction
+
+    from apps.academics.domain.models import (
+        ArchivedGrade, Course, Enrollment, Grade, GradeRollup, Job, OutboxEvent, OutboxOffset, Student,
+    )
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for model in (Job, OutboxEvent, OutboxOffset, ArchivedGrade, GradeRollup, Grade, Enrollment, Student, Course):
+            cursor.execute(f"DELETE FROM {connection.ops.quote_name(model._meta.db_table)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--students", type=int, default=10_000)
+    parser.add_argument("--courses", type=int, default=200)
+    parser.add_argument("--grades", type=int, default=500_000, help="approximate total")
+    parser.add_argument("--courses-per-student", default="3:8", help="min:max")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent of course popularity")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--clear", action="store_true", help="delete existing data first")
+    args = parser.parse_args()
+
+    from benchmarks import setup_django
+
+    setup_django()
+    if args.clear:
+        clear()
+
+    low, high = (int(x) for x in args.courses_per_student.split(":"))
+
+    def progress(done, total, grades_written):
+        print(f"\r{done}/{total} students, {grades_written} grades", end="", flush=True)
+
+    summary = seed(
+        students=args.students,
+        courses=args.courses,
+        grades=args.grades,
+        courses_per_student=(low, high),
+        popularity_skew=args.skew,
+        random_seed=args.seed,
+        progress=progress,
+    )
+    print(
+        f"\nSeeded {summary.students} students, {summary.courses} courses, "
+        f"{summary.enrollments} enrollments and {summary.grades} grades "
+        f"in {summary.seconds:.1f}s ({summary.grades / summary.seconds:.0f} grades/s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Latency and query-count benchmark of the public academics services.
+
+    # benchmark whatever is in the configured database
+    python -m benchmarks.services --output results.json
+
+    # seed fresh datasets (students:courses:grades) and benchmark each of them
+    python -m benchmarks.services --sizes 1000:50:20000,10000:200:200000 --output results.json
+
+    # compare against an earlier run (e.g. from another commit)
+    python -m benchmarks.services --compare baseline.json
+
+Results are JSON: one entry per (dataset size, service) with p50/p95/p99/mean
+latency in milliseconds and SQL statements per call, plus the git commit.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import time
+from datetime import datetime, timezone
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def service_cases(rng: random.Random, *, batch: int = 100) -> dict:
+    """
+    name -> zero-argument callable exercising one public service with random ids.
+    """
+    from apps.academics.domain.models import Course, Enrollment, Student
+    from apps.academics.services import analytics, catalog, grades, queries, report_cards
+
+    pairs = list(Enrollment.objects.values_list("student__uuid", "course__uuid")[:50_000])
+    graded_pairs = list(
+        Enrollment.objects.filter(grade_count__gt=0).values_list("student__uuid", "course__uuid")[:50_000]
+    )
+    student_ids = list(Student.objects.values_list("uuid", flat=True)[:50_000])
+    course_ids = list(Course.objects.values_list("uuid", flat=True))
+    if not pairs:
+        raise SystemExit("The database has no enrollments; seed it first (python -m benchmarks.seed).")
+
+    def on_pair(service, population=pairs):
+        def call():
+            student_id, course_id = rng.choice(population)
+            return service(student_id=student_id, course_id=course_id)
+        return call
+
+    def record_grade(*, student_id, course_id):
+        return grades.record_grade(student_id=student_id, course_id=course_id, numeric=rng.randint(0, 100))
+
+    return {
+        "grades.record_grade": on_pair(record_grade),
+        "grades.get_numeric_grades": on_pair(grades.get_numeric_grades),
+        "grades.get_letter_grades": on_pair(grades.get_letter_grades),
+        "grades.calculate_numeric_average": on_pair(grades.calculate_numeric_average, graded_pairs),
+        "grades.calculate_letter_average": on_pair(grades.calculate_letter_average, graded_pairs),
+        "report_cards.build_report_card": lambda: report_cards.build_report_card(
+            student_id=rng.choice(student_ids)
+        ),
+        f"report_cards.build_report_cards[{batch}]": lambda: report_cards.build_report_cards(
+            student_ids=rng.sample(student_ids, min(batch, len(student_ids)))
+        ),
+        "queries.list_students_for_course": lambda: queries.list_students_for_course(
+            course_id=rng.choice(course_ids)
+        ),
+        "queries.list_courses_for_student": lambda: queries.list_courses_for_student(
+            student_id=rng.choice(student_ids)
+        ),
+        "queries.list_students_for_course_page": lambda: queries.list_students_for_course_page(
+            course_id=rng.choice(course_ids), page_size=50
+        ),
+        "catalog.list_courses": catalog.list_courses,
+        "catalog.list_students_page": lambda: catalog.list_students_page(page_size=50),
+        "analytics.course_statistics": lambda: analytics.course_statistics(
+            course_id=rng.choice(course_ids)
+        ),
+        "analytics.course_ranking[10]": lambda: analytics.course_ranking(
+            course_id=rng.choice(course_ids), limit=10
+        ),
+        "analytics.student_rank": on_pair(analytics.student_rank, graded_pairs),
+    }
+
+
+def measure(fn, *, iterations: int, warmup: int = 3) -> dict:
+    from django.db import connection
+
+    for _ in range(warmup):
+        fn()
+
+    counter = _QueryCounter()
+    latencies = []
+    with connection.execute_wrapper(counter):
+        for _ in range(iterations):
+            started = time.perf_counter()
+            fn()
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    latencies.sort()
+    return {
+        "calls": iterations,
+        "p50_ms": _percentile(latencies, 50),
+        "p95_ms": _percentile(latencies, 95),
+        "p99_ms": _percentile(latencies, 99),
+        "mean_ms": statistics.fmean(latencies),
+        "queries_per_call": counter.count / iterations,
+    }
+
+
+def run(*, sizes: list[tuple[int, int, int]] | None, iterations: int, services: list[str] | None) -> dict:
+    from django import get_version
+    from django.db import connection
+
+    from apps.academics.domain.models import Course, Grade, Student
+    from benchmarks import seed
+
+    results = []
+    for size in sizes or [None]:
+        if size is not None:
+            seed.clear()
+            students, courses, grade_total = size
+            seed.seed(students=students, courses=courses, grades=grade_total)
+        dataset = {
+            "students": Student.objects.count(),
+            "courses": Course.objects.count(),
+            "grades": Grade.objects.count(),
+        }
+        print(f"dataset {dataset}")
+
+        cases = service_cases(random.Random(0))
+        for name, fn in cases.items():
+            if services and not any(s in name for s in services):
+                continue
+            stats = measure(fn, iterations=iterations)
+            results.append({"dataset": dataset, "service": name, **stats})
+            print(
+                f"  {name:45s} p50 {stats['p50_ms']:8.2f}ms  p95 {stats['p95_ms']:8.2f}ms  "
+                f"p99 {stats['p99_ms']:8.2f}ms  {stats['queries_per_call']:6.1f} queries/call"
+            )
+
+    return {
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "django": get_version(),
+        "database": connection.vendor,
+        "iterations": iterations,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict) -> None:
+    def key(r):
+        # Grade counts drift between runs (record_grade writes), so datasets
+        # are matched on their student and course counts.
+        return r["dataset"]["students"], r["dataset"]["courses"], r["service"]
+
+    before = {key(r): r for r in baseline["results"]}
+    print(f"p50 vs baseline {baseline.get('commit')}:")
+    for r in current["results"]:
+        old = before.get(key(r))
+        if old is None:
+            continue
+        ratio = r["p50_ms"] / old["p50_ms"] if old["p50_ms"] else float("inf")
+        print(f"  {r['service']:45s} {old['p50_ms']:8.2f}ms -> {r['p50_ms']:8.2f}ms  x{ratio:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", help="comma-separated students:courses:grades datasets to seed")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--service", action="append", help="only run services containing this text")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare with")
+    args = parser.parse_args()
+
+    from benchmarks import setup_django
+
+    setup_django()
+    sizes = None
+    if args.sizes:
+        sizes = [tuple(int(x) for x in spec.split(":")) for spec in args.sizes.split(",")]
+
+    report = run(sizes=sizes, iterations=args.iterations, services=args.service)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Start-up cost of management commands under different settings profiles.
+
+    python -m benchmarks.startup --repeat 10
+    python -m benchmarks.startup --profiles config.settings.local,config.settings.batch \\
+        --command "run_workers --burst --concurrency 1"
+
+Runs `python manage.py <command>` in fresh interpreters and reports the
+median wall time, the peak RSS of the process and the number of modules
+loaded. --importtime adds the slowest imports of one `-X importtime` run
+(modules Django loads with import_module appear only through their own
+imports). Commands run against the database of the chosen profile
+(SQLITE_PATH); use a migrated scratch file.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent
+DEFAULT_PROFILES = "config.settings.local,config.settings.batch"
+DEFAULT_COMMANDS = ("drain_outbox", "run_workers --burst --concurrency 1")
+
+# manage.py, reporting how many modules were loaded when the process exits.
+_MANAGE = (
+    "import atexit, runpy, sys; "
+    "atexit.register(lambda: sys.stderr.write(f'\\nmodules loaded: {len(sys.modules)}\\n')); "
+    "sys.argv[0] = 'manage.py'; runpy.run_path('manage.py', run_name='__main__')"
+)
+
+
+def run(command: list[str], settings_module: str, *, importtime: bool = False) -> tuple[float, int, str]:
+    """
+    (wall seconds, peak RSS in KiB, stderr) of one run.
+    """
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings_module}
+    flags = ["-X", "importtime"] if importtime else []
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, *flags, "-c", _MANAGE, *command],
+        cwd=SRC, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    stderr = process.stderr.read()
+    _, status, usage = os.wait4(process.pid, 0)
+    elapsed = time.perf_counter() - started
+    process.returncode = os.waitstatus_to_exitcode(status)
+    if process.returncode:
+        raise SystemExit(f"{' '.join(command)} failed under {settings_module}:\n{stderr}")
+    return elapsed, usage.ru_maxrss, stderr
+
+
+def slowest_imports(stderr: str, count: int) -> list[tuple[int, str]]:
+    """
+    (cumulative microseconds, module) of the top-level imports in -X importtime output.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, cumulative, name = line.split("|")
+            if cumulative.strip().isdigit() and not name.startswith("  "):
+                entries.append((int(cumulative), name.strip()))
+    return sorted(entries, reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--profiles", default=DEFAULT_PROFILES, help="comma-separated settings modules")
+    parser.add_argument("--command", action="append", dest="commands", help="manage.py command line (repeatable)")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--importtime", type=int, default=0, metavar="N", help="show the N slowest imports")
+    args = parser.parse_args()
+
+    for command_line in args.commands or DEFAULT_COMMANDS:
+        command = command_line.split()
+        print(f"manage.py {command_line} (median of {args.repeat}):")
+        for profile in args.profiles.split(","):
+            runs = [run(command, profile) for _ in range(args.repeat)]
+            modules = runs[0][2].rsplit("modules loaded: ", 1)[1].split()[0]
+            wall = statistics.median(seconds for seconds, _, _ in runs)
+            rss = max(kib for _, kib, _ in runs) / 1024
+            print(f"  {profile:28s} {wall * 1000:7.0f}ms  {rss:6.1f}MiB  {modules:>5s} modules")
+            if args.importtime:
+                _, _, stderr = run(command, profile, importtime=True)
+                for micros, name in slowest_imports(stderr, args.importtime):
+                    print(f"      {micros / 1000:7.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+On-disk size and join speed of the academics tables, before/after a schema change.
+
+    cp db.sqlite3 before.sqlite3                       # e.g. still on UUID primary keys
+    SQLITE_PATH=after.sqlite3 python manage.py migrate # copy migrated to integer keys
+    python -m benchmarks.storage before.sqlite3 after.sqlite3 --repeat 5
+
+Reads the files directly with sqlite3 (no Django), so databases on different
+migrations can be compared. Sizes come from the dbstat virtual table. The
+join queries address students and courses by their public UUID, which is the
+primary key on the old schema and the uuid column on the new one:
+
+- report card:  grades of one student, joined to enrollments and courses
+- roster:       students enrolled in one course
+- full join:    every grade joined to its enrollment and student (a scan)
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sqlite3
+import time
+
+TABLES = ("academics_student", "academics_course", "academics_enrollment", "academics_grade")
+
+
+def _public_column(conn: sqlite3.Connection, table: str) -> str:
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    return "uuid" if "uuid" in columns else "id"
+
+
+def sizes(conn: sqlite3.Connection) -> dict[str, dict[str, int]]:
+    """
+    table -> {"table": bytes, "indexes": bytes} (automatic indexes included).
+    """
+    owners = dict(conn.execute("SELECT name, tbl_name FROM sqlite_master WHERE type IN ('table', 'index')"))
+    result = {table: {"table": 0, "indexes": 0} for table in TABLES}
+    for name, size in conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name"):
+        table = owners.get(name)
+        if table in result:
+            result[table]["table" if name == table else "indexes"] += size
+    return result
+
+
+def join_queries(conn: sqlite3.Connection) -> dict[str, tuple[str, bool]]:
+    """
+    name -> (SQL, whether it takes a random public id parameter).
+    """
+    student = _public_column(conn, "academics_student")
+    course = _public_column(conn, "academics_course")
+    return {
+        "report card": (
+            f"""
+            SELECT c.name, g.numeric_value
+            FROM academics_student s
+            JOIN academics_enrollment e ON e.student_id = s.id
+            JOIN academics_course c ON c.id = e.course_id
+            JOIN academics_grade g ON g.enrollment_id = e.id
+            WHERE s.{student} = ?
+            """,
+            True,
+        ),
+        "roster": (
+            f"""
+            SELECT s.name
+            FROM academics_course c
+            JOIN academics_enrollment e ON e.course_id = c.id
+            JOIN academics_student s ON s.id = e.student_id
+            WHERE c.{course} = ?
+            """,
+            True,
+        ),
+        "full join": (
+            """
+            SELECT COUNT(*), SUM(g.numeric_value), COUNT(DISTINCT s.id)
+            FROM academics_grade g
+            JOIN academics_enrollment e ON e.id = g.enrollment_id
+            JOIN academics_student s ON s.id = e.student_id
+            """,
+            False,
+        ),
+    }
+
+
+def time_joins(conn: sqlite3.Connection, *, repeat: int, lookups: int, seed: int = 0) -> dict[str, float]:
+    """
+    name -> best-of-repeat seconds (for `lookups` random ids on parameterized queries).
+    """
+    rng = random.Random(seed)
+    student_ids = [r[0] for r in conn.execute(
+        f"SELECT {_public_column(conn, 'academics_student')} FROM academics_student"
+    )]
+    course_ids = [r[0] for r in conn.execute(
+        f"SELECT {_public_column(conn, 'academics_course')} FROM academics_course"
+    )]
+    samples = {
+        "report card": [rng.choice(student_ids) for _ in range(lookups)],
+        "roster": [rng.choice(course_ids) for _ in range(lookups)],
+    }
+
+    timings = {}
+    for name, (sql, parameterized) in join_queries(conn).items():
+        runs = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            if parameterized:
+                for value in samples[name]:
+                    conn.execute(sql, (value,)).fetchall()
+            else:
+                conn.execute(sql).fetchall()
+            runs.append(time.perf_counter() - started)
+        timings[name] = min(runs)
+    return timings
+
+
+def _mib(size: int) -> str:
+    return f"{size / 2 ** 20:8.1f}MiB"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("databases", nargs="+", help="SQLite files to compare")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--lookups", type=int, default=500, help="random ids per parameterized query")
+    args = parser.parse_args()
+
+    results = {}
+    for path in args.databases:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            results[path] = (sizes(conn), time_joins(conn, repeat=args.repeat, lookups=args.lookups))
+        finally:
+            conn.close()
+
+    for path, (by_table, timings) in results.items():
+        total = sum(s["table"] + s["indexes"] for s in by_table.values())
+        print(f"{path}: {_mib(total)} in academics tables and indexes")
+        for table, s in by_table.items():
+            print(f"  {table:22s} table {_mib(s['table'])}  indexes {_mib(s['indexes'])}")
+        for name, seconds in timings.items():
+            per = f"{seconds / args.lookups * 1e6:8.1f}us/lookup" if name != "full join" else ""
+            print(f"  {name:22s} {seconds * 1000:9.1f}ms  {per}")
+
+    if len(results) == 2:
+        (_, (_, old)), (_, (_, new)) = results.items()
+        speedups = ", ".join(f"{name} x{old[name] / new[name]:.2f}" for name in old)
+        print(f"speedup (first / second): {speedups}")
+    print(f"(best of {args.repeat}, SQLite {sqlite3.sqlite_version})")
+
+
+if __name__ == "__main__":
+    main()
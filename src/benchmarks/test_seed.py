@@ -0,0 +1,21 @@
+import pytest
+
+from apps.academics.domain.models import Course, Enrollment, Grade, Student
+from apps.academics.services.grade_stats import find_grade_stats_mismatches
+from benchmarks.seed import clear, seed
+
+
+@pytest.mark.django_db
+def test_seed_generates_consistent_skewed_dataset():
+    summary = seed(students=60, courses=10, grades=1500, courses_per_student=(2, 4), batch_size=100)
+
+    assert Student.objects.count() == 60
+    assert Course.objects.count() == 10
+    assert Enrollment.objects.count() == summary.enrollments
+    assert Grade.objects.count() == summary.grades > 0
+    assert 2 * 60 <= summary.enrollments <= 4 * 60
+    # Aggregates are written alongside the grades.
+    assert list(find_grade_stats_mismatches()) == []
+
+    clear()
+    assert not Student.objects.exists() and not Grade.objects.exists()
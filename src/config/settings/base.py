@@ -1,11 +1,193 @@
-from .base import *
+"""
+Django settings for config project.
 
+Generated by 'django-admin startproject' using Django 6.0.1.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/6.0/topics/settings/
+
+For the full list of settings and their values, see
+https://docs.djangoproject.com/en/6.0/ref/settings/
+"""
+
+import os
+from pathlib import Path
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+# Quick-start development settings - unsuitable for production
+# See https://docs.djangoproject.com/en/6.0/howto/deployment/checklist/
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = 'django-insecure-@1=68_ex10civ7t7gvub0q4+gubo9g@*bzp5%5dc^q!7r19s_^'
+
+# SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
-ALLOWED_HOSTS = ["*"]
+
+ALLOWED_HOSTS = []
+
+
+# Application definition
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+    "apps.academics.apps.AcademicsConfig",
+]
+
+MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'config.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'config.wsgi.application'
+
+
+SQLITE_PATH = os.getenv("SQLITE_PATH", os.path.join(BASE_DIR, "db.sqlite3"))
+
+# SQLite tuning applied on every new connection. SQLITE_TUNING=off keeps
+# SQLite's defaults (e.g. to measure the difference).
+SQLITE_PRAGMAS = {
+    # Readers no longer block behind the writer (and vice versa).
+    "journal_mode": "wal",
+    # Safe with WAL: a power loss may drop the last commits, never corrupt.
+    "synchronous": "normal",
+    "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)),
+    # Negative values are KiB: 64 MiB of page cache per connection.
+    "cache_size": int(os.getenv("SQLITE_CACHE_SIZE", -64 * 1024)),
+    # Wait this long (ms) for the write lock before "database is locked".
+    "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", 5000)),
+    "temp_store": "memory",
+}
+
+if os.getenv("SQLITE_TUNING", "on") == "off":
+    SQLITE_OPTIONS = {}
+else:
+    SQLITE_OPTIONS = {
+        "init_command": "".join(f"PRAGMA {name}={value};" for name, value in SQLITE_PRAGMAS.items()),
+        # Take the write lock at BEGIN, so a transaction that reads before
+        # writing waits for busy_timeout instead of failing on lock upgrade.
+        "transaction_mode": "IMMEDIATE",
+    }
+
+# The read-only snapshot only needs the read-side pragmas.
+SQLITE_REPLICA_OPTIONS = {
+    "init_command": "".join(
+        f"PRAGMA {name}={SQLITE_PRAGMAS[name]};"
+        for name in ("mmap_size", "cache_size", "busy_timeout", "temp_store")
+    ),
+}
 
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": os.getenv("SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+        "NAME": SQLITE_PATH,
+        "OPTIONS": SQLITE_OPTIONS,
     }
 }
+
+# Read services with eventual consistency go to ACADEMICS_READ_REPLICA when
+# it names a configured alias (see apps.academics.routers).
+DATABASE_ROUTERS = ["apps.academics.routers.ReplicaRouter"]
+ACADEMICS_READ_REPLICA = None
+
+
+# Caches
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+
+# MAX_ENTRIES bounds each process's memory; culling drops 1/CULL_FREQUENCY
+# of the entries when it is reached.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "academics",
+        "TIMEOUT": 300,
+        "OPTIONS": {"MAX_ENTRIES": 10_000, "CULL_FREQUENCY": 4},
+    }
+}
+
+ACADEMICS_CACHE = {
+    "ENABLED": True,
+    "ALIAS": "default",
+    "TIMEOUT": 300,
+}
+
+# Consumers of grade/enrollment events, run by `manage.py drain_outbox`
+# (see apps.academics.services.outbox).
+ACADEMICS_OUTBOX = {
+    "HANDLERS": {},
+    "SETTLE_SECONDS": 0,
+}
+
+# Background jobs run by `manage.py run_workers` (see apps.academics.services.jobs).
+ACADEMICS_JOBS = {
+    "HANDLERS": {},
+    "MAX_ATTEMPTS": 3,
+    "RETRY_DELAY": 10,
+    "LEASE_SECONDS": 600,
+}
+
+
+# Password validation
+# https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
+
+AUTH_PASSWORD_VALIDATORS = [
+    {
+        'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator',
+    },
+    {
+        'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator',
+    },
+]
+
+
+# Internationalization
+# https://docs.djangoproject.com/en/6.0/topics/i18n/
+
+LANGUAGE_CODE = 'en-us'
+
+TIME_ZONE = 'UTC'
+
+USE_I18N = True
+
+USE_TZ = True
+
+
+# Static files (CSS, JavaScript, Images)
+# https://docs.djangoproject.com/en/6.0/howto/static-files/
+
+STATIC_URL = 'static/'
@@ -0,0 +1,32 @@
+"""
+Slim settings for management commands, cron jobs and workers.
+
+    DJANGO_SETTINGS_MODULE=config.settings.batch python manage.py run_workers
+    DJANGO_SETTINGS_MODULE=config.settings.batch BATCH_BASE_SETTINGS=config.settings.prod \\
+        python manage.py run_workers
+
+Everything (database, cache, DEBUG, ACADEMICS_* settings) comes from the
+settings module named by BATCH_BASE_SETTINGS (default: config.settings.local),
+but only the academics app is installed: no admin, auth, sessions, messages
+or staticfiles, no middleware, templates or password validators, and a
+URLconf without views. Run `migrate` and serve HTTP with the full settings.
+"""
+import os
+from importlib import import_module
+
+BATCH_BASE_SETTINGS = os.getenv("BATCH_BASE_SETTINGS", "config.settings.local")
+
+globals().update(
+    (name, value) for name, value in vars(import_module(BATCH_BASE_SETTINGS)).items() if name.isupper()
+)
+
+INSTALLED_APPS = [
+    "apps.academics.apps.AcademicsConfig",
+]
+
+MIDDLEWARE = []
+TEMPLATES = []
+AUTH_PASSWORD_VALIDATORS = []
+
+# The URL system check imports the URLconf; batch processes serve no views.
+ROOT_URLCONF = "config.urls_batch"
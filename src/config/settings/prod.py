@@ -12,3 +12,7 @@ DATABASES = {
         "HOST": os.environ["DB_HOST"],
     }
 }
+
+# PostgreSQL commits concurrent transactions out of id order; consumers stay
+# this far behind the newest event so they never skip a late commit.
+ACADEMICS_OUTBOX = {**ACADEMICS_OUTBOX, "SETTLE_SECONDS": 5}
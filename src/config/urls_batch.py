@@ -0,0 +1,4 @@
+"""
+URL configuration for config.settings.batch: batch processes serve no views.
+"""
+urlpatterns = []